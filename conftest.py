@@ -0,0 +1,45 @@
+"""This file has the fixtures shared by the tests."""
+
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+class FakeClock:
+    """Clock controlled by the tests, advanced by the 'sleep' calls."""
+
+    def __init__(self):
+        """Create the FakeClock object."""
+        self.now = 1000.0
+        self.sleep_list = []
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Advance the clock."""
+        self.sleep_list.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Return a clock controlled by the test."""
+    return FakeClock()
+
+
+@pytest.fixture(scope="module")
+def server_url(request):
+    """Run a local server during the tests of the module.
+
+    The requests are answered by the 'FixtureHandler' class of the module.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), request.module.FixtureHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:" + str(server.server_address[1])
+    server.shutdown()
+    server.server_close()
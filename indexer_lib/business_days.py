@@ -0,0 +1,178 @@
+"""This file has a set of methods related to business days counting."""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+
+class BrazilianHolidays:
+    """Class used to generate the Brazilian national holidays.
+
+    The holidays are generated locally (without any web request), following
+    the national calendar used by the financial market (ANBIMA):
+    - Fixed dates: 01/01, 21/04, 01/05, 07/09, 12/10, 02/11, 15/11, 25/12
+    - Black Consciousness Day (20/11), since 2024
+    - Easter-based dates: Carnival (Monday and Tuesday), Good Friday and
+      Corpus Christi
+    """
+
+    FIXED_HOLIDAYS_LIST = [
+        (1, 1),
+        (4, 21),
+        (5, 1),
+        (9, 7),
+        (10, 12),
+        (11, 2),
+        (11, 15),
+        (12, 25),
+    ]
+
+    BLACK_CONSCIOUSNESS_DAY = (11, 20)
+    BLACK_CONSCIOUSNESS_INITIAL_YEAR = 2024
+
+    # Days related to the Easter Sunday:
+    # - Carnival Monday, Carnival Tuesday, Good Friday, Corpus Christi
+    EASTER_OFFSETS_LIST = [-48, -47, -2, 60]
+
+    def __init__(self):
+        """Create the BrazilianHolidays object."""
+        pass
+
+    def getEasterDate(self, year):
+        """Return the Easter Sunday date of the year.
+
+        It uses the 'Anonymous Gregorian algorithm' (Meeus/Jones/Butcher).
+        """
+        a = year % 19
+        b = year // 100
+        c = year % 100
+        d = b // 4
+        e = b % 4
+        f = (b + 8) // 25
+        g = (b - f + 1) // 3
+        h = (19 * a + b - d - g + 15) % 30
+        i = c // 4
+        k = c % 4
+        L = (32 + 2 * e + 2 * i - h - k) % 7
+        m = (a + 11 * h + 22 * L) // 451
+        month = (h + L - 7 * m + 114) // 31
+        day = ((h + L - 7 * m + 114) % 31) + 1
+        return date(year, month, day)
+
+    def getHolidaysList(self, year):
+        """Return a sorted list of national holidays of the year."""
+        holidays_list = [
+            date(year, month, day)
+            for month, day in BrazilianHolidays.FIXED_HOLIDAYS_LIST
+        ]
+        if year >= BrazilianHolidays.BLACK_CONSCIOUSNESS_INITIAL_YEAR:
+            month, day = BrazilianHolidays.BLACK_CONSCIOUSNESS_DAY
+            holidays_list.append(date(year, month, day))
+        easter = self.getEasterDate(year)
+        for offset in BrazilianHolidays.EASTER_OFFSETS_LIST:
+            holidays_list.append(easter + timedelta(days=offset))
+        return sorted(holidays_list)
+
+    def getHolidaysArray(self, initial_year, final_year):
+        """Return a 'datetime64[D]' array of holidays between the years."""
+        holidays_list = []
+        for year in range(initial_year, final_year + 1):
+            holidays_list.extend(self.getHolidaysList(year))
+        return np.array(holidays_list, dtype="datetime64[D]")
+
+
+class BusinessDaysCalendar:
+    """Class used to count business days between dates.
+
+    The calendar is precomputed once as a NumPy array with the cumulative
+    amount of business days since 'INITIAL_YEAR'. Then, the number of
+    business days between any two dates is an O(1) lookup (a subtraction
+    of two array positions), also available in a vectorized way.
+
+    The counting follows the market convention: the initial date is
+    included and the final date is excluded. Example:
+    - initial_date = 2022-01-03 (Monday)
+    - final_date = 2022-01-10 (Monday)
+    - output: 5
+    """
+
+    INITIAL_YEAR = 1990
+    FINAL_YEAR = 2100
+
+    BUSINESS_DAYS_PER_YEAR = 252
+
+    def __init__(self):
+        """Create the BusinessDaysCalendar object."""
+        self.__holidays = BrazilianHolidays()
+        self.__createCalendarArrays()
+
+    """Private methods."""
+
+    def __createCalendarArrays(self):
+        initial_year = BusinessDaysCalendar.INITIAL_YEAR
+        final_year = BusinessDaysCalendar.FINAL_YEAR
+        self.__initial_day = np.datetime64(str(initial_year) + "-01-01", "D")
+        self.__final_day = np.datetime64(str(final_year + 1) + "-01-01", "D")
+        days_array = np.arange(self.__initial_day, self.__final_day)
+        self.__holidays_array = self.__holidays.getHolidaysArray(
+            initial_year,
+            final_year,
+        )
+        self.__business_day_array = np.is_busday(
+            days_array,
+            holidays=self.__holidays_array,
+        )
+        # The position 'N' stores the amount of business days before the
+        # day 'N', then the last day of the calendar is also covered.
+        self.__cumulative_array = np.concatenate(
+            ([0], np.cumsum(self.__business_day_array)),
+        )
+
+    def __getDayIndexArray(self, dates):
+        days = np.asarray(dates).astype("datetime64[D]")
+        index_array = (days - self.__initial_day).astype(np.int64)
+        if np.any(index_array < 0) or np.any(
+            index_array >= len(self.__cumulative_array)
+        ):
+            raise ValueError(
+                "The dates should be between "
+                + str(BusinessDaysCalendar.INITIAL_YEAR)
+                + " and "
+                + str(BusinessDaysCalendar.FINAL_YEAR)
+                + ".",
+            )
+        return index_array
+
+    """Public methods."""
+
+    def getBusinessDaysArray(self, initial_dates, final_dates):
+        """Return an array with the business days between the dates.
+
+        Arguments:
+        - initial_dates: a list/array/series of dates (included)
+        - final_dates: a list/array/series of dates (excluded)
+
+        When 'final_date < initial_date', the result is negative.
+        """
+        initial_index = self.__getDayIndexArray(initial_dates)
+        final_index = self.__getDayIndexArray(final_dates)
+        cumulative = self.__cumulative_array
+        return cumulative[final_index] - cumulative[initial_index]
+
+    def getBusinessDays(self, initial_date, final_date):
+        """Return the business days between 'initial_date' and 'final_date'."""
+        return int(self.getBusinessDaysArray(initial_date, final_date))
+
+    def isBusinessDay(self, day):
+        """Return True if the 'day' is a business day."""
+        index = self.__getDayIndexArray(day)
+        return bool(self.__business_day_array[index])
+
+    def getBusinessYearsArray(self, initial_dates, final_dates):
+        """Return the period in years, considering the 252-day basis."""
+        business_days = self.getBusinessDaysArray(initial_dates, final_dates)
+        return business_days / BusinessDaysCalendar.BUSINESS_DAYS_PER_YEAR
+
+    def getHolidaysArray(self):
+        """Return the array of holidays used by the calendar."""
+        return self.__holidays_array.copy()
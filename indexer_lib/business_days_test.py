@@ -0,0 +1,92 @@
+"""This file is used to test the 'business_days.py'."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from indexer_lib.business_days import BrazilianHolidays, BusinessDaysCalendar
+
+
+def date(string):
+    """Return a date from the string."""
+    return datetime.strptime(string, "%Y/%m/%d")
+
+
+class Test_BrazilianHolidays:
+    """Tests for 'BrazilianHolidays' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - year, easter_date
+    test_getEasterDate_list = [
+        (2000, date("2000/04/23")),
+        (2019, date("2019/04/21")),
+        (2022, date("2022/04/17")),
+        (2024, date("2024/03/31")),
+    ]
+
+    @pytest.mark.parametrize("year, easter_date", test_getEasterDate_list)
+    def test_getEasterDate(self, year, easter_date):
+        """Test the 'getEasterDate' method."""
+        holidays = BrazilianHolidays()
+        assert holidays.getEasterDate(year) == easter_date.date()
+
+    def test_getHolidaysList(self):
+        """Test the 'getHolidaysList' method."""
+        holidays = BrazilianHolidays()
+        holidays_2022 = holidays.getHolidaysList(2022)
+        holidays_2024 = holidays.getHolidaysList(2024)
+        assert len(holidays_2022) == 12
+        assert len(holidays_2024) == 13
+        assert date("2022/02/28").date() in holidays_2022  # Carnival
+        assert date("2022/06/16").date() in holidays_2022  # Corpus Christi
+        assert date("2024/11/20").date() in holidays_2024
+
+
+class Test_BusinessDaysCalendar:
+    """Tests for 'BusinessDaysCalendar' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - initial_date, final_date, business_days
+    test_getBusinessDays_list = [
+        (date("2022/01/03"), date("2022/01/10"), 5),
+        (date("2022/01/03"), date("2022/01/03"), 0),
+        (date("2022/01/10"), date("2022/01/03"), -5),
+        (date("2022/02/25"), date("2022/03/03"), 2),
+        (date("2022/01/01"), date("2023/01/01"), 251),
+        (date("2023/01/01"), date("2024/01/01"), 249),
+        (date("2000/04/01"), date("2000/04/30"), 19),
+    ]
+
+    @pytest.mark.parametrize(
+        "initial_date, final_date, business_days",
+        test_getBusinessDays_list,
+    )
+    def test_getBusinessDays(self, initial_date, final_date, business_days):
+        """Test the 'getBusinessDays' method."""
+        calendar = BusinessDaysCalendar()
+        value = calendar.getBusinessDays(initial_date, final_date)
+        assert value == business_days
+
+    def test_getBusinessDaysArray(self):
+        """Test the 'getBusinessDaysArray' method."""
+        calendar = BusinessDaysCalendar()
+        initial_list = [x[0] for x in self.test_getBusinessDays_list]
+        final_list = [x[1] for x in self.test_getBusinessDays_list]
+        expected_list = [x[2] for x in self.test_getBusinessDays_list]
+        value = calendar.getBusinessDaysArray(initial_list, final_list)
+        assert isinstance(value, np.ndarray) is True
+        assert value.tolist() == expected_list
+
+    def test_isBusinessDay(self):
+        """Test the 'isBusinessDay' method."""
+        calendar = BusinessDaysCalendar()
+        assert calendar.isBusinessDay(date("2022/01/03")) is True
+        assert calendar.isBusinessDay(date("2022/01/01")) is False
+        assert calendar.isBusinessDay(date("2022/04/15")) is False
+
+    def test_valueerror(self):
+        """Test the 'getBusinessDays' method against invalid data."""
+        calendar = BusinessDaysCalendar()
+        with pytest.raises(ValueError):
+            calendar.getBusinessDays(date("1980/01/01"), date("2000/01/01"))
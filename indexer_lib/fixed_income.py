@@ -3,6 +3,9 @@
 import calendar
 from datetime import datetime
 
+import numpy as np
+
+from indexer_lib.business_days import BusinessDaysCalendar
 from indexer_lib.interest_calculation import Benchmark, InterestCalculation
 
 
@@ -96,15 +99,24 @@ class FixedIncomeCalculation:
 
     Then, for short periods (less than 1 month) we can see a huge error
     in the results when comparing to long periods (more than 3 months).
+
+    To avoid such error, the 'getValueByPrefixedRate' and
+    'getValueByProportionalCDI' methods accept the 'business_days=True'
+    argument, where the market convention (252 business days per year) is
+    used, based on the 'BusinessDaysCalendar'.
     """
 
     def __init__(self):
         """Create the FixedIncomeCalculation object."""
         self.interest = InterestCalculation()
         self.idx = IndexerCalc()
+        self.calendar = BusinessDaysCalendar()
 
     """Protected methods."""
 
+    def _getDaysArray(self, dates):
+        return np.asarray(dates).astype("datetime64[D]")
+
     def _getValueByPrefixedRate(
         self,
         initial_date,
@@ -151,6 +163,68 @@ class FixedIncomeCalculation:
         final_value = buy_price + (int_value * day_proportion)
         return final_value, day_proportion
 
+    def _getValueByPrefixedRateBusinessDays(
+        self,
+        initial_date,
+        final_date,
+        rate,
+        buy_price,
+    ):
+        """Return the final value given a prefixed rate (252-day basis)."""
+        years = self.calendar.getBusinessYearsArray(initial_date, final_date)
+        years = max(float(years), 0.0)
+        return buy_price * ((1 + rate) ** years)
+
+    def _getValueByProportionalCDIBusinessDays(
+        self,
+        initial_date,
+        final_date,
+        rate,
+        buy_price,
+    ):
+        """Return the final value given a proportional CDI (252-day basis).
+
+        The monthly CDI rates are converted to daily rates according to the
+        amount of business days of each month. Then, the proportional daily
+        rate is compounded by the amount of business days of each month
+        inside the period, without any per-day loop.
+        """
+        if final_date <= initial_date:
+            return buy_price
+
+        # Monthly CDI rates related to the period
+        init_y, init_m, init_d = self.idx._getYearMonthDay(initial_date)
+        end_y, end_m, end_d = self.idx._getYearMonthDay(final_date)
+        dataframe = self.idx.getCDI().getExtendedDataframe()
+        date_col = self.idx.StackedFormatConstants.getAdjustedDateTitle()
+        rate_col = self.idx.StackedFormatConstants.getInterestTitle()
+        filtered_df = self.idx.DataframeFilter.filterDataframePerPeriod(
+            dataframe,
+            date_col,
+            self.idx._getDate(init_y, init_m, 1),
+            self.idx._getDate(end_y, end_m, 1),
+        )
+        if filtered_df.empty:
+            return buy_price
+        month_start = self._getDaysArray(filtered_df[date_col])
+        month_end = month_start.astype("datetime64[M]") + 1
+        month_end = month_end.astype("datetime64[D]")
+        monthly_rate = filtered_df[rate_col].to_numpy(dtype=float)
+
+        # Business days per month and inside the period per month
+        period_start = np.maximum(month_start, self._getDaysArray(initial_date))
+        period_end = np.minimum(month_end, self._getDaysArray(final_date))
+        month_days = self.calendar.getBusinessDaysArray(month_start, month_end)
+        period_days = self.calendar.getBusinessDaysArray(
+            period_start,
+            period_end,
+        )
+
+        # Compound the proportional daily rates
+        daily_rate = ((1 + monthly_rate) ** (1 / month_days)) - 1
+        factor = np.prod((1 + (daily_rate * rate)) ** period_days)
+        return buy_price * factor
+
     """Public methods."""
 
     def getValueByPrefixedRate(
@@ -159,8 +233,19 @@ class FixedIncomeCalculation:
         final_date,
         rate,
         buy_price,
+        business_days=False,
     ):
-        """Return the final value given a prefixed interest rate."""
+        """Return the final value given a prefixed interest rate.
+
+        When 'business_days=True', the 252-day basis is used.
+        """
+        if business_days:
+            return self._getValueByPrefixedRateBusinessDays(
+                initial_date,
+                final_date,
+                rate,
+                buy_price,
+            )
         prefixed_tuple = self._getValueByPrefixedRate(
             initial_date,
             final_date,
@@ -203,8 +288,20 @@ class FixedIncomeCalculation:
         final_date,
         rate,
         buy_price,
+        business_days=False,
     ):
-        """Return the final value given a proportional CDI interest rate."""
+        """Return the final value given a proportional CDI interest rate.
+
+        When 'business_days=True', the 252-day basis is used.
+        """
+        if business_days:
+            return self._getValueByProportionalCDIBusinessDays(
+                initial_date,
+                final_date,
+                rate,
+                buy_price,
+            )
+
         # Calculate the day proportion
         trash, day_proportion = self._getValueByPrefixedRate(
             initial_date,
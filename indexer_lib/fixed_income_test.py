@@ -128,6 +128,26 @@ class Test_FixedIncomeCalculation:
         (date("2000/04/01"), date("2000/04/30"), 1.30, 1000.0, 1016.640),
     ]
 
+    # List of tuples, with the following order per tuple:
+    # - initial_date, final_date, rate, buy_price, interest
+    test_getValueByPrefixedRate_business_days_list = [
+        (date("2000/01/01"), date("2000/12/31"), 0.12, 1000.0, 1118.993),
+        (date("2000/01/01"), date("2000/12/31"), 0.0, 1000.0, 1000.0),
+        (date("2000/01/01"), date("2000/12/31"), 0.12, 0.0, 0.0),
+        (date("2000/04/01"), date("2000/04/15"), 0.12, 1000.0, 1004.507),
+        (date("2000/04/01"), date("2000/04/30"), 0.12, 1000.0, 1008.581),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - initial_date, final_date, rate, buy_price, interest
+    test_getValueByProportionalCDI_business_days_list = [
+        (date("2000/01/01"), date("2000/12/31"), 1.30, 1000.0, 1230.751),
+        (date("2000/01/01"), date("2000/12/31"), 0.0, 1000.0, 1000.0),
+        (date("2000/01/01"), date("2000/12/31"), 1.30, 0.0, 0.0),
+        (date("2000/04/01"), date("2000/04/15"), 1.30, 1000.0, 1008.739),
+        (date("2000/04/01"), date("2000/04/30"), 1.30, 1000.0, 1016.670),
+    ]
+
     @pytest.mark.parametrize(
         "initial_date, final_date, rate, buy_price, interest",
         test_getValueByPrefixedRate_list,
@@ -159,6 +179,24 @@ class Test_FixedIncomeCalculation:
         # 21 years = R$ 1.232,39
         assert value > 1232.0
 
+    @pytest.mark.parametrize(
+        "initial_date, final_date, rate, buy_price, interest",
+        test_getValueByPrefixedRate_business_days_list,
+    )
+    def test_getValueByPrefixedRate_business_days(
+        self, initial_date, final_date, rate, buy_price, interest
+    ):
+        """Test the 'getValueByPrefixedRate' method (252-day basis)."""
+        idxCalc = FixedIncomeCalculation()
+        value = idxCalc.getValueByPrefixedRate(
+            initial_date,
+            final_date,
+            rate,
+            buy_price,
+            business_days=True,
+        )
+        assert value == pytest.approx(interest, 0.001)
+
     @pytest.mark.parametrize(
         "initial_date, final_date, rate, buy_price, interest",
         test_getValueByPrefixedRatePlusIPCA_list,
@@ -220,3 +258,21 @@ class Test_FixedIncomeCalculation:
         # From 2000/01/01 to 2021/11/30 at 130%:
         # 21 years = R$ 15.314,35
         assert value > 15314.0
+
+    @pytest.mark.parametrize(
+        "initial_date, final_date, rate, buy_price, interest",
+        test_getValueByProportionalCDI_business_days_list,
+    )
+    def test_getValueByProportionalCDI_business_days(
+        self, initial_date, final_date, rate, buy_price, interest
+    ):
+        """Test the 'getValueByProportionalCDI' method (252-day basis)."""
+        idxCalc = FixedIncomeCalculation()
+        value = idxCalc.getValueByProportionalCDI(
+            initial_date,
+            final_date,
+            rate,
+            buy_price,
+            business_days=True,
+        )
+        assert value == pytest.approx(interest, 0.001)
@@ -0,0 +1,67 @@
+"""This file has a set of methods related to Fixed Income taxes."""
+
+import numpy as np
+
+
+class RegressiveIncomeTax:
+    """Class used to estimate the Brazilian regressive income tax (IR).
+
+    The tax is applied over the gains of Fixed Income and Treasuries, given
+    the holding period in days:
+    - up to 180 days: 22.5%
+    - from 181 to 360 days: 20.0%
+    - from 361 to 720 days: 17.5%
+    - more than 720 days: 15.0%
+
+    All methods work with lists/arrays/series, in a single vectorized pass.
+    Losses are not taxed. The IOF (only charged in the first 30 days) is not
+    considered.
+    """
+
+    DAYS_THRESHOLD_LIST = [180, 360, 720]
+    TAX_RATE_LIST = [0.225, 0.200, 0.175, 0.150]
+
+    def __init__(self):
+        """Create the RegressiveIncomeTax object."""
+        self.__days_threshold = np.array(RegressiveIncomeTax.DAYS_THRESHOLD_LIST)
+        self.__tax_rate = np.array(RegressiveIncomeTax.TAX_RATE_LIST)
+
+    """Public methods."""
+
+    def getHoldingDaysArray(self, initial_dates, final_dates):
+        """Return an array with the calendar days between the dates."""
+        initial = np.asarray(initial_dates).astype("datetime64[D]")
+        final = np.asarray(final_dates).astype("datetime64[D]")
+        return (final - initial).astype(np.int64)
+
+    def getTaxRateArray(self, holding_days):
+        """Return an array with the tax rates given the holding days.
+
+        Example:
+        - holding_days = [30, 200, 400, 1000]
+        - output = [0.225, 0.200, 0.175, 0.150]
+        """
+        days = np.asarray(holding_days)
+        position = np.searchsorted(self.__days_threshold, days, side="left")
+        return self.__tax_rate[position]
+
+    def getTaxValueArray(self, gains, holding_days):
+        """Return an array with the tax values given the gains.
+
+        Negative gains (losses) return '0.0'.
+        """
+        gains = np.nan_to_num(np.asarray(gains, dtype=float))
+        return np.maximum(gains, 0.0) * self.getTaxRateArray(holding_days)
+
+    def getNetPriceArray(self, buy_prices, market_prices, holding_days):
+        """Return an array with the market prices discounted by the tax.
+
+        Arguments:
+        - buy_prices: the mean buy prices per unit
+        - market_prices: the current (estimated) prices per unit
+        - holding_days: the holding period in days
+        """
+        buy = np.asarray(buy_prices, dtype=float)
+        market = np.asarray(market_prices, dtype=float)
+        tax = self.getTaxValueArray(market - buy, holding_days)
+        return market - tax
@@ -0,0 +1,66 @@
+"""This file is used to test the 'income_tax.py'."""
+
+from datetime import datetime
+
+import pytest
+
+from indexer_lib.income_tax import RegressiveIncomeTax
+
+
+def date(string):
+    """Return a date from the string."""
+    return datetime.strptime(string, "%Y/%m/%d")
+
+
+class Test_RegressiveIncomeTax:
+    """Tests for 'RegressiveIncomeTax' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - holding_days, tax_rate
+    test_getTaxRateArray_list = [
+        (0, 0.225),
+        (180, 0.225),
+        (181, 0.200),
+        (360, 0.200),
+        (361, 0.175),
+        (720, 0.175),
+        (721, 0.150),
+        (3000, 0.150),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - buy_price, market_price, holding_days, net_price
+    test_getNetPriceArray_list = [
+        (100.0, 110.0, 100, 107.75),
+        (100.0, 110.0, 800, 108.5),
+        (100.0, 90.0, 100, 90.0),
+        (0.0, 0.0, 100, 0.0),
+    ]
+
+    @pytest.mark.parametrize("holding_days, tax_rate", test_getTaxRateArray_list)
+    def test_getTaxRateArray(self, holding_days, tax_rate):
+        """Test the 'getTaxRateArray' method."""
+        tax = RegressiveIncomeTax()
+        value = tax.getTaxRateArray([holding_days])
+        assert value[0] == pytest.approx(tax_rate, 0.001)
+
+    @pytest.mark.parametrize(
+        "buy_price, market_price, holding_days, net_price",
+        test_getNetPriceArray_list,
+    )
+    def test_getNetPriceArray(
+        self, buy_price, market_price, holding_days, net_price
+    ):
+        """Test the 'getNetPriceArray' method."""
+        tax = RegressiveIncomeTax()
+        value = tax.getNetPriceArray([buy_price], [market_price], [holding_days])
+        assert value[0] == pytest.approx(net_price, 0.001)
+
+    def test_getHoldingDaysArray(self):
+        """Test the 'getHoldingDaysArray' method."""
+        tax = RegressiveIncomeTax()
+        value = tax.getHoldingDaysArray(
+            [date("2022/01/01"), date("2022/01/01")],
+            [date("2022/01/31"), date("2023/01/01")],
+        )
+        assert value.tolist() == [30, 365]
@@ -1,7 +1,15 @@
 """File used to collect 12months-base data from Economic Indexers."""
 
+import threading
+from datetime import datetime
+
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
+from network_lib.html_parser import HtmlParser
+from network_lib.http_session import getSharedSession
+
+from indexer_lib.economic_indexers import CDI, IPCA
+from indexer_lib.indexer_manager import StackedFormatConstants
 
 
 class Indexer:
@@ -21,12 +29,16 @@ class Indexer:
             + "div.info.special.w-100.w-sm-33.w-md-25 > div > div:nth-child(1)"
             + "> strong"
         )
+        self.parser = HtmlParser([self.selector])
         self.value = self.__getUpdatedData()
 
     def __getUpdatedData(self):
-        headers = {"User-Agent": "Mozilla/5.0"}
-        page = requests.get(self.weblink, headers=headers)
-        soup = BeautifulSoup(page.content, "html.parser")
+        # The shared session sets the timeout, retries and time budget
+        try:
+            page = getSharedSession().get(self.weblink)
+        except requests.RequestException:
+            return Indexer.VALUE_NOT_FOUND
+        soup = self.parser.parse(page.content)
         selector = soup.select(self.selector)
         try:
             value_str = selector[0].get_text()
@@ -42,27 +54,193 @@ class Indexer:
         return self.value
 
 
+class LocalIndexer:
+    """
+    Class used to calculate the 12months-base % value from the local series.
+
+    The monthly rates of the extended stacked dataframe (where the months
+    not published yet repeat the last known rate) are compounded over
+    rolling windows of 12 months. All the windows are precomputed once per
+    indexer and shared by all the objects.
+
+    The 12months-base value of a date is related to the last 12 closed
+    months (the current month is not included). When some of them are not
+    published in the local series, the value is an extrapolation (see
+    'isExtrapolated').
+    """
+
+    VALUE_NOT_FOUND = 0.0
+    WINDOW_MONTHS = 12
+
+    INDEXER_CLASS_DICT = {"ipca": IPCA, "cdi": CDI}
+
+    _cache = {}
+    _lock = threading.Lock()
+
+    def __init__(self, indexer_string):
+        """Create the LocalIndexer object."""
+        self.indexer_string = str(indexer_string).lower()
+        arrays = self.__getRollingArrays()
+        self.months, self.values, self.last_published_month = arrays
+
+    def __getLastPublishedMonth(self, manager, constants):
+        # The months not published yet have 'rate == 0.0' in the series
+        dataframe = manager.getDataframe()
+        rates = dataframe[constants.getInterestTitle()].to_numpy(dtype=float)
+        dates = dataframe[constants.getAdjustedDateTitle()].to_numpy()
+        published = dates[np.nan_to_num(rates) != 0.0]
+        return published[-1].astype("datetime64[M]")
+
+    def __createRollingArrays(self):
+        constants = StackedFormatConstants()
+        manager = LocalIndexer.INDEXER_CLASS_DICT[self.indexer_string]()
+        last_published_month = self.__getLastPublishedMonth(manager, constants)
+        dataframe = manager.getExtendedDataframe()
+        dates = dataframe[constants.getAdjustedDateTitle()].to_numpy()
+        rates = dataframe[constants.getInterestTitle()].to_numpy(dtype=float)
+        months = dates.astype("datetime64[M]")
+
+        # The position 'N' stores the factor accumulated before the month 'N'
+        window = LocalIndexer.WINDOW_MONTHS
+        factors = np.concatenate(([1.0], np.cumprod(1 + np.nan_to_num(rates))))
+        values = np.full(len(rates), LocalIndexer.VALUE_NOT_FOUND)
+        values[window - 1 :] = factors[window:] / factors[: len(rates) - window + 1]
+        values[window - 1 :] -= 1
+        return months, values, last_published_month
+
+    def __getRollingArrays(self):
+        cache = LocalIndexer._cache
+        try:
+            return cache[self.indexer_string]
+        except KeyError:
+            arrays = self.__createRollingArrays()
+            with LocalIndexer._lock:
+                cache[self.indexer_string] = arrays
+            return arrays
+
+    def __getLastClosedMonth(self, date):
+        if date is None:
+            date = datetime.today()
+        return np.datetime64(date, "M") - 1
+
+    def get12MonthsValue(self, date=None):
+        """Return the 12months-base % value related to the date.
+
+        The date default is today.
+        """
+        last_month = self.__getLastClosedMonth(date)
+        index = np.searchsorted(self.months, last_month, side="right") - 1
+        if index < LocalIndexer.WINDOW_MONTHS - 1:
+            return LocalIndexer.VALUE_NOT_FOUND
+        return float(self.values[index])
+
+    def isExtrapolated(self, date=None):
+        """Return True if the 12 months window of the date is not published.
+
+        In this case, the months not published repeat the last known rate.
+        The date default is today.
+        """
+        return bool(self.__getLastClosedMonth(date) > self.last_published_month)
+
+    def getLastPublishedMonth(self):
+        """Return the last month ('datetime64[M]') of the local series."""
+        return self.last_published_month
+
+    def get12MonthsArray(self):
+        """Return the '(months, values)' arrays of all the rolling windows."""
+        return self.months.copy(), self.values.copy()
+
+
 class TwelveMonthsIndexer:
     """
     Class used to get IPCA and CDI 12months-base % value.
 
-    It uses the Status Invest website. IPCA and CDI shares the same selector.
+    By default, the values are calculated from the local series of the
+    indexers ('LocalIndexer'), without any network request. If 'local' is
+    False, the Status Invest website is used (the old behavior).
+
+    When the last 12 months are not all published in the local series, the
+    local value is an extrapolation, flagged by 'getExtrapolatedList'. If
+    'web_fallback' is True, the website value is used instead (requested
+    once per process), and the extrapolation only if it is not available.
+
+    If 'cross_check' is True, the values from the website are also
+    collected, in order to compare them with the local ones (see
+    'getCrossCheckDict').
     """
 
-    def __init__(self):
+    _webCache = {}
+    _lock = threading.Lock()
+
+    def __init__(self, local=True, cross_check=False, web_fallback=False):
         """Create the TwelveMonthsIndexer object."""
-        self.IPCA = Indexer("ipca")
-        self.CDI = Indexer("cdi")
+        self.local = local
+        self.webFallback = web_fallback
+        if local:
+            self.IPCA = LocalIndexer("ipca")
+            self.CDI = LocalIndexer("cdi")
+        else:
+            self.IPCA = Indexer("ipca")
+            self.CDI = Indexer("cdi")
+        self.webIndexerDict = {}
+        if cross_check:
+            self.webIndexerDict = {"IPCA": Indexer("ipca"), "CDI": Indexer("cdi")}
+        self.extrapolatedSet = set()
+
+    """Private methods."""
+
+    def __getWebIndexer(self, name):
+        # The website is requested only once per indexer
+        if name in self.webIndexerDict:
+            return self.webIndexerDict[name]
+        with TwelveMonthsIndexer._lock:
+            cache = TwelveMonthsIndexer._webCache
+            if name not in cache:
+                cache[name] = Indexer(name.lower())
+            return cache[name]
+
+    def __getValue(self, name, indexer):
+        if not self.local or not indexer.isExtrapolated():
+            return indexer.get12MonthsValue()
+        if self.webFallback:
+            web_value = self.__getWebIndexer(name).get12MonthsValue()
+            if web_value != Indexer.VALUE_NOT_FOUND:
+                return web_value
+        self.extrapolatedSet.add(name)
+        return indexer.get12MonthsValue()
+
+    """Public methods."""
 
     def getIPCA(self):
         """Return the IPCA 12months-base % value."""
-        return self.IPCA.get12MonthsValue()
+        return self.__getValue("IPCA", self.IPCA)
 
     def getCDI(self):
         """Return the CDI 12months-base % value."""
-        return self.CDI.get12MonthsValue()
+        return self.__getValue("CDI", self.CDI)
 
     def getSELIC(self):
         """Return the SELIC 12months-base % value."""
         # Since CDI~SELIC, we will return the CDI value
-        return self.CDI.get12MonthsValue()
+        return self.getCDI()
+
+    def getExtrapolatedList(self):
+        """Return the indexers whose values are local extrapolations.
+
+        Example: ['IPCA'], when the IPCA of the last 12 months is not
+        published locally and the website is not used (or not available).
+        """
+        return sorted(self.extrapolatedSet)
+
+    def getCrossCheckDict(self):
+        """Return the values used and the values from the website.
+
+        Example: {'IPCA': {'value': 0.045, 'web': 0.046}, 'CDI': {...}}
+
+        Return an empty dictionary if 'cross_check' is False.
+        """
+        value_dict = {"IPCA": self.getIPCA(), "CDI": self.getCDI()}
+        return {
+            name: {"value": value_dict[name], "web": web.get12MonthsValue()}
+            for name, web in self.webIndexerDict.items()
+        }
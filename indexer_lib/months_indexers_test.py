@@ -1,6 +1,26 @@
 """This file is used to test the 'months_indexers.py'."""
 
-from indexer_lib.months_indexers import TwelveMonthsIndexer
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indexer_lib import months_indexers
+from indexer_lib.months_indexers import LocalIndexer, TwelveMonthsIndexer
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, "data")
+
+
+def getLastDataMonth(file_name):
+    """Return the last month with a published rate in the data file."""
+    dataframe = pd.read_excel(os.path.join(DATA_DIR, file_name))
+    dataframe = dataframe.set_index("Ano").sort_index()
+    rates = np.nan_to_num(dataframe.to_numpy(dtype=float).ravel())
+    position = np.flatnonzero(rates)[-1]
+    first_month = np.datetime64(f"{dataframe.index[0]}-01", "M")
+    return first_month + position
 
 
 class Test_TwelveMonthsIndexer:
@@ -13,3 +33,95 @@ class Test_TwelveMonthsIndexer:
         assert indexers.getIPCA() >= 0.01
         assert indexers.getCDI() >= 0.01
         assert indexers.getSELIC() >= 0.01
+
+    def test_crossCheck_disabled(self):
+        """Test the cross-check without the website values."""
+        indexers = TwelveMonthsIndexer()
+        assert indexers.getCrossCheckDict() == {}
+
+
+class Test_LocalIndexer:
+    """Tests for 'LocalIndexer' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - indexer, date, 12months-base value (the previous closed months)
+    test_get12MonthsValue_list = [
+        ("ipca", "2001-01-10", 0.0597),
+        ("ipca", "2022-01-10", 0.1006),
+        ("ipca", "2023-01-01", 0.0578),
+        ("cdi", "2023-01-31", 0.1239),
+        ("ipca", "2000-06-01", 0.0),
+    ]
+
+    @pytest.mark.parametrize(
+        "indexer, date, value",
+        test_get12MonthsValue_list,
+    )
+    def test_get12MonthsValue(self, indexer, date, value):
+        """Test the 'get12MonthsValue' method."""
+        local = LocalIndexer(indexer)
+        assert local.get12MonthsValue(date) == pytest.approx(value, abs=5e-4)
+
+    def test_get12MonthsArray(self):
+        """Test the rolling windows are precomputed for every month."""
+        months, values = LocalIndexer("ipca").get12MonthsArray()
+        assert len(months) == len(values)
+        assert values[10] == 0.0
+        assert values[11] == pytest.approx(0.0597, abs=5e-4)
+
+    def test_isExtrapolated(self):
+        """Test the windows past the last published month."""
+        local = LocalIndexer("ipca")
+        last_month = local.getLastPublishedMonth()
+        assert last_month == getLastDataMonth("IPCA.xlsx")
+        assert local.isExtrapolated(f"{last_month + 1}-05") is False
+        assert local.isExtrapolated(f"{last_month + 2}-10") is True
+
+
+class FixtureWebIndexer:
+    """Web indexer with a fixed value (offline)."""
+
+    VALUE_NOT_FOUND = 0.0
+    value = 0.045
+
+    def __init__(self, indexer_string):
+        """Create the FixtureWebIndexer object."""
+        self.indexer_string = indexer_string
+
+    def get12MonthsValue(self):
+        """Return the fixed value."""
+        return FixtureWebIndexer.value
+
+
+class Test_TwelveMonthsIndexer_extrapolated:
+    """Tests for 'TwelveMonthsIndexer' past the last published month."""
+
+    # List of tuples, with the following order per tuple:
+    # - web value, expected IPCA value, expected extrapolated list
+    test_getIPCA_list = [
+        (0.045, 0.045, []),
+        (0.0, None, ["IPCA"]),
+    ]
+
+    @pytest.mark.parametrize("web_value, value, extrapolated", test_getIPCA_list)
+    def test_getIPCA(self, monkeypatch, web_value, value, extrapolated):
+        """Test the website value is used instead of the extrapolation."""
+        monkeypatch.setattr(months_indexers, "Indexer", FixtureWebIndexer)
+        monkeypatch.setattr(FixtureWebIndexer, "value", web_value)
+        monkeypatch.setattr(TwelveMonthsIndexer, "_webCache", {})
+        indexers = TwelveMonthsIndexer(web_fallback=True)
+        local_value = indexers.IPCA.get12MonthsValue()
+        assert indexers.IPCA.isExtrapolated() is True
+        if value is None:
+            value = local_value
+        assert indexers.getIPCA() == pytest.approx(value)
+        assert indexers.getExtrapolatedList() == extrapolated
+        assert indexers.getCrossCheckDict() == {}
+
+    def test_getIPCA_web_fallback_disabled(self, monkeypatch):
+        """Test the extrapolation is used without the website by default."""
+        monkeypatch.setattr(months_indexers, "Indexer", None)
+        indexers = TwelveMonthsIndexer()
+        assert indexers.IPCA.isExtrapolated() is True
+        assert indexers.getIPCA() == indexers.IPCA.get12MonthsValue()
+        assert indexers.getExtrapolatedList() == ["IPCA"]
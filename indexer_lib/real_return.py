@@ -0,0 +1,107 @@
+"""This file has a set of methods related to inflation-adjusted returns."""
+
+import numpy as np
+
+from indexer_lib.economic_indexers import IPCA
+from indexer_lib.indexer_manager import StackedFormatConstants
+
+
+class RealReturnCalculation:
+    """Class used to deflate nominal returns by the accumulated IPCA.
+
+    The stacked (extended) IPCA series is converted once into an array of
+    cumulative factors, indexed by month. Then, the IPCA accumulated between
+    any two dates is the ratio of two factors, what allows to calculate the
+    real return of a whole dataframe in a single vectorized pass.
+
+    Following the 'IndexerCalc' convention, the monthly IPCA values take in
+    account the entire month, for both initial and final months.
+    """
+
+    def __init__(self):
+        """Create the RealReturnCalculation object."""
+        self.IPCA = IPCA()
+        self.__createCumulativeFactors()
+
+    """Private methods."""
+
+    def __getMonthNumberArray(self, dates):
+        months = np.asarray(dates).astype("datetime64[M]")
+        return months.astype(np.int64)
+
+    def __createCumulativeFactors(self):
+        constants = StackedFormatConstants()
+        dataframe = self.IPCA.getExtendedDataframe()
+        dates = dataframe[constants.getAdjustedDateTitle()]
+        rates = dataframe[constants.getInterestTitle()].to_numpy(dtype=float)
+        rates = np.nan_to_num(rates)
+
+        # The position 'N' stores the factor accumulated before the month 'N'
+        self.__first_month = int(self.__getMonthNumberArray(dates[:1])[0])
+        self.__factors = np.concatenate(([1.0], np.cumprod(1 + rates)))
+
+    def __getFactorIndexArray(self, dates):
+        index_array = self.__getMonthNumberArray(dates) - self.__first_month
+        return np.clip(index_array, 0, len(self.__factors) - 1)
+
+    def __getNotValidDatesMask(self, initial_dates, final_dates):
+        initial = np.asarray(initial_dates).astype("datetime64[D]")
+        final = np.asarray(final_dates).astype("datetime64[D]")
+        return np.isnat(initial) | np.isnat(final)
+
+    """Public methods."""
+
+    def getAccumulatedIPCAArray(self, initial_dates, final_dates):
+        """Return an array with the IPCA accumulated between the dates.
+
+        Arguments:
+        - initial_dates: a list/array/series of dates
+        - final_dates: a list/array/series of dates
+
+        Example:
+        - initial_dates = [2000-01-01]
+        - final_dates = [2000-12-31]
+        - output = [0.05974]
+        """
+        initial_index = self.__getFactorIndexArray(initial_dates)
+        final_index = self.__getFactorIndexArray(final_dates) + 1
+        final_index = np.minimum(final_index, len(self.__factors) - 1)
+        final_index = np.maximum(final_index, initial_index)
+        factors = self.__factors[final_index] / self.__factors[initial_index]
+        accumulated = factors - 1
+        not_valid = self.__getNotValidDatesMask(initial_dates, final_dates)
+        return np.where(not_valid, np.nan, accumulated)
+
+    def getRealReturnArray(self, nominal_returns, initial_dates, final_dates):
+        """Return an array with the real returns (deflated by IPCA).
+
+        Example:
+        - nominal_returns = [0.10]
+        - accumulated IPCA in the period = [0.05]
+        - output = [0.047619]
+        """
+        nominal = np.asarray(nominal_returns, dtype=float)
+        accumulated = self.getAccumulatedIPCAArray(initial_dates, final_dates)
+        return ((1 + nominal) / (1 + accumulated)) - 1
+
+    def addRealReturnColumn(
+        self,
+        dataframe,
+        nominal_column,
+        real_column,
+        initial_column="Data Inicial",
+        final_column="Data Final",
+    ):
+        """Set the 'real_column' in the dataframe, based on 'nominal_column'.
+
+        The dataframe is changed in place and also returned.
+        """
+        if len(dataframe):
+            dataframe[real_column] = self.getRealReturnArray(
+                dataframe[nominal_column],
+                dataframe[initial_column],
+                dataframe[final_column],
+            )
+        else:
+            dataframe[real_column] = []
+        return dataframe
@@ -0,0 +1,80 @@
+"""This file is used to test the 'real_return.py'."""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from indexer_lib.real_return import RealReturnCalculation
+
+
+def date(string):
+    """Return a date from the string."""
+    return datetime.strptime(string, "%Y/%m/%d")
+
+
+class Test_RealReturnCalculation:
+    """Tests for 'RealReturnCalculation' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - initial_date, final_date, accumulated_ipca
+    test_getAccumulatedIPCAArray_list = [
+        (date("2000/01/01"), date("2000/12/01"), 0.059743),
+        (date("2000/01/01"), date("2000/12/31"), 0.059743),
+        (date("2000/04/10"), date("2000/04/20"), 0.0042),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - nominal_return, initial_date, final_date, real_return
+    test_getRealReturnArray_list = [
+        (0.10, date("2000/01/01"), date("2000/12/31"), 0.037987),
+        (0.059743, date("2000/01/01"), date("2000/12/31"), 0.0),
+        (0.0, date("2000/04/10"), date("2000/04/20"), -0.004182),
+    ]
+
+    @pytest.mark.parametrize(
+        "initial_date, final_date, accumulated_ipca",
+        test_getAccumulatedIPCAArray_list,
+    )
+    def test_getAccumulatedIPCAArray(
+        self, initial_date, final_date, accumulated_ipca
+    ):
+        """Test the 'getAccumulatedIPCAArray' method."""
+        calc = RealReturnCalculation()
+        value = calc.getAccumulatedIPCAArray([initial_date], [final_date])
+        assert value[0] == pytest.approx(accumulated_ipca, 0.001)
+
+    @pytest.mark.parametrize(
+        "nominal_return, initial_date, final_date, real_return",
+        test_getRealReturnArray_list,
+    )
+    def test_getRealReturnArray(
+        self, nominal_return, initial_date, final_date, real_return
+    ):
+        """Test the 'getRealReturnArray' method."""
+        calc = RealReturnCalculation()
+        value = calc.getRealReturnArray(
+            [nominal_return],
+            [initial_date],
+            [final_date],
+        )
+        assert value[0] == pytest.approx(real_return, abs=0.00001)
+
+    def test_addRealReturnColumn(self):
+        """Test the 'addRealReturnColumn' method."""
+        calc = RealReturnCalculation()
+        dataframe = pd.DataFrame(
+            {
+                "Data Inicial": [date("2000/01/01"), None],
+                "Data Final": [date("2000/12/31"), date("2000/12/31")],
+                "Rentabilidade Líquida": [0.10, 0.10],
+            }
+        )
+        calc.addRealReturnColumn(
+            dataframe,
+            "Rentabilidade Líquida",
+            "Rentabilidade Real",
+        )
+        real_list = dataframe["Rentabilidade Real"].tolist()
+        assert real_list[0] == pytest.approx(0.037987, abs=0.00001)
+        assert pd.isna(real_list[1]) is True
@@ -2,6 +2,7 @@
 
 import os
 
+from network_lib.quote_cache import getSharedQuoteCache
 from portfolio_lib.portfolio_widget import PortfolioViewerWidget
 from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import QMessageBox
@@ -18,6 +19,10 @@ class MainWindow(QtWidgets.QWidget):
         super().__init__()
         self.setWindowTitle("Análise de Portfólio")
 
+        # The windows show the stale quotes at once, while the fresh ones
+        # are requested in background
+        getSharedQuoteCache().setStaleWhileRevalidate(True)
+
         # Portfolio widget
         self.PortfolioWidget = PortfolioViewerWidget(extrato_file)
 
@@ -41,6 +41,9 @@ class ToolsMenu(MenuInterface):
 
     def valuationWin(self):
         """Launch the Valuation app."""
+        # The previous window is destroyed, removing its refresh listener
+        if self.ValuationWindow is not None:
+            self.ValuationWindow.deleteLater()
         self.ValuationWindow = ValuationWindow()
 
     def balancingWin(self):
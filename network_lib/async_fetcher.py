@@ -0,0 +1,218 @@
+"""This file has an asyncio pipeline used to fetch several web pages."""
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from network_lib.http_session import getSharedSession
+
+
+class AsyncFetcher:
+    """Class used to fetch and parse several web pages concurrently.
+
+    The requests are scheduled by an asyncio event loop, limited by:
+    - max_concurrency: the maximum amount of requests in flight
+    - host_concurrency: the maximum amount of requests in flight per host
+    - host_interval: the minimum interval (seconds) between the start of
+      two requests to the same host (politeness)
+    - deadline: the maximum time (seconds) for the whole batch
+
+    The blocking parts (the HTTP request, through the shared keep-alive
+    session, and the page parsing) run in worker threads, in a copy of the
+    caller context (the time budget of the requests, for example). Then,
+    the whole batch takes roughly the latency of the slowest request.
+
+    The pages not fetched (errors, timeouts or the deadline) return the
+    'default' value. The work abandoned at the deadline does not keep the
+    worker threads busy: the queued calls are cancelled, the requests in
+    flight (retries included) share a time budget ending at the deadline,
+    and the late pages are not parsed.
+
+    Arguments:
+    - executor: the 'concurrent.futures.Executor' used by the blocking
+      parts, or an object with a 'getExecutor' method (like the shared
+      'ThreadPoolTasks'), looked up per batch. Then, a shared pool shut
+      down (and created again) between the batches is still valid. If
+      None, a private pool of threads is created per batch, and shut down
+      at its end.
+    - session: the 'HttpSession' used by the requests (default: shared)
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 16
+    DEFAULT_HOST_CONCURRENCY = 8
+    DEFAULT_HOST_INTERVAL = 0.0
+    DEFAULT_DEADLINE = 30.0
+
+    def __init__(
+        self,
+        max_concurrency=None,
+        host_concurrency=None,
+        host_interval=None,
+        deadline=None,
+        executor=None,
+        session=None,
+    ):
+        """Create the AsyncFetcher object."""
+        if max_concurrency is None:
+            max_concurrency = AsyncFetcher.DEFAULT_MAX_CONCURRENCY
+        if host_concurrency is None:
+            host_concurrency = AsyncFetcher.DEFAULT_HOST_CONCURRENCY
+        if host_interval is None:
+            host_interval = AsyncFetcher.DEFAULT_HOST_INTERVAL
+        if deadline is None:
+            deadline = AsyncFetcher.DEFAULT_DEADLINE
+        if session is None:
+            session = getSharedSession()
+        self.max_concurrency = max_concurrency
+        self.host_concurrency = host_concurrency
+        self.host_interval = host_interval
+        self.deadline = deadline
+        self.executor = executor
+        self.session = session
+
+    """Private methods."""
+
+    def __getHost(self, url):
+        return urlsplit(url).netloc
+
+    def __getExecutor(self):
+        if self.executor is None:
+            return ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="AsyncFetcher",
+            )
+        if hasattr(self.executor, "getExecutor"):
+            return self.executor.getExecutor()
+        return self.executor
+
+    def __getRemaining(self, end_time):
+        # Raise the 'asyncio.TimeoutError' if the deadline is over
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError
+        return remaining
+
+    def __getContent(self, url, end_time):
+        # Run in a copy of the caller context: the budget of the request
+        # (and of its retries) ends at the deadline, or before
+        remaining = self.__getRemaining(end_time)
+        budget_remaining = self.session.budget.remaining()
+        if budget_remaining is not None:
+            remaining = min(remaining, budget_remaining)
+        self.session.startBudget(remaining)
+        page = self.session.get(url)
+        page.raise_for_status()
+        return page.content
+
+    def __parse(self, parse_function, url, content, end_time):
+        # The pages received after the deadline are not parsed
+        self.__getRemaining(end_time)
+        return parse_function(url, content)
+
+    async def __waitHostInterval(self, host_state):
+        # Space the requests to the same host by 'host_interval' seconds
+        async with host_state["lock"]:
+            wait_time = host_state["next_time"] - time.monotonic()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            host_state["next_time"] = time.monotonic() + self.host_interval
+
+    async def __fetch(
+        self, url, parse_function, semaphore, host_dict, end_time, executor
+    ):
+        loop = asyncio.get_running_loop()
+        host_state = host_dict[self.__getHost(url)]
+        async with semaphore, host_state["semaphore"]:
+            if self.host_interval > 0:
+                await self.__waitHostInterval(host_state)
+            self.__getRemaining(end_time)
+            content = await loop.run_in_executor(
+                executor,
+                contextvars.copy_context().run,
+                self.__getContent,
+                url,
+                end_time,
+            )
+        if parse_function is None:
+            return content
+        return await loop.run_in_executor(
+            executor,
+            contextvars.copy_context().run,
+            self.__parse,
+            parse_function,
+            url,
+            content,
+            end_time,
+        )
+
+    def __createHostDict(self, url_list):
+        host_dict = {}
+        for url in url_list:
+            host = self.__getHost(url)
+            if host not in host_dict:
+                host_dict[host] = {
+                    "semaphore": asyncio.Semaphore(self.host_concurrency),
+                    "lock": asyncio.Lock(),
+                    "next_time": 0.0,
+                }
+        return host_dict
+
+    def __getResult(self, task, default):
+        if task.cancelled() or task.exception() is not None:
+            return default
+        return task.result()
+
+    """Public methods."""
+
+    async def fetchAllAsync(self, url_list, parse_function=None, default=None):
+        """Coroutine version of the 'fetchAll' method."""
+        if not url_list:
+            return []
+        end_time = time.monotonic() + self.deadline
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        host_dict = self.__createHostDict(url_list)
+        executor = self.__getExecutor()
+        try:
+            task_list = [
+                asyncio.ensure_future(
+                    self.__fetch(
+                        url, parse_function, semaphore, host_dict, end_time, executor
+                    ),
+                )
+                for url in url_list
+            ]
+            done, pending = await asyncio.wait(task_list, timeout=self.deadline)
+
+            # The cancelled tasks also cancel their calls still queued
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        finally:
+            if self.executor is None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        return [self.__getResult(task, default) for task in task_list]
+
+    def fetchAll(self, url_list, parse_function=None, default=None):
+        """Return a list with the (parsed) content of each URL.
+
+        Arguments:
+        - url_list: the list of URLs
+        - parse_function: a function 'parse_function(url, content)' called
+          in a worker thread. If None, the raw content (bytes) is returned.
+        - default: the value returned for the pages not fetched or parsed
+
+        The results keep the same order of the 'url_list'.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.fetchAllAsync(url_list, parse_function, default),
+            )
+        raise RuntimeError(
+            "The 'fetchAll' method cannot be called from a running event "
+            + "loop. Use the 'fetchAllAsync' coroutine instead.",
+        )
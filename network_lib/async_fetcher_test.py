@@ -0,0 +1,121 @@
+"""This file is used to test the 'async_fetcher.py'."""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.async_fetcher import AsyncFetcher
+from network_lib.http_session import HttpSession
+from portfolio_lib.multi_processing import ThreadPoolTasks
+
+# Delay (seconds) of each response of the local server
+RESPONSE_DELAY = 0.2
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Local stand-in server: '/page/N' returns 'N', '/slow' hangs."""
+
+    def do_GET(self):
+        """Answer the GET requests."""
+        if self.path == "/slow":
+            time.sleep(3)
+        else:
+            time.sleep(RESPONSE_DELAY)
+        if self.path.startswith("/page/"):
+            body = self.path.split("/")[-1].encode()
+            self.send_response(200)
+        else:
+            body = b"not found"
+            self.send_response(404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Do not print the requests."""
+
+
+def getFetcher(**kwargs):
+    """Return the AsyncFetcher object under testing."""
+    return AsyncFetcher(session=HttpSession(pool_maxsize=64), **kwargs)
+
+
+class Test_AsyncFetcher:
+    """Tests for 'AsyncFetcher' class."""
+
+    def test_fetchAll(self, server_url):
+        """Test the 'fetchAll' method keeps the URLs order."""
+        url_list = [server_url + "/page/" + str(x) for x in range(5)]
+        output = getFetcher().fetchAll(url_list)
+        assert output == [str(x).encode() for x in range(5)]
+
+    def test_fetchAll_parse_function(self, server_url):
+        """Test the 'fetchAll' method with a parse function."""
+        url_list = [server_url + "/page/" + str(x) for x in range(5)]
+        output = getFetcher().fetchAll(
+            url_list,
+            lambda url, content: int(content) * 10,
+        )
+        assert output == [x * 10 for x in range(5)]
+
+    def test_fetchAll_concurrency(self, server_url):
+        """Test 50+ pages take roughly the latency of the slowest one."""
+        url_list = [server_url + "/page/" + str(x) for x in range(60)]
+        fetcher = getFetcher(max_concurrency=64, host_concurrency=64)
+        start = time.monotonic()
+        output = fetcher.fetchAll(url_list, lambda url, content: int(content))
+        elapsed = time.monotonic() - start
+        assert output == list(range(60))
+        assert elapsed < 60 * RESPONSE_DELAY / 4
+
+    def test_fetchAll_host_concurrency(self, server_url):
+        """Test the requests per host are limited."""
+        url_list = [server_url + "/page/" + str(x) for x in range(4)]
+        fetcher = getFetcher(host_concurrency=1)
+        start = time.monotonic()
+        fetcher.fetchAll(url_list)
+        assert time.monotonic() - start >= 4 * RESPONSE_DELAY
+
+    def test_fetchAll_errors(self, server_url):
+        """Test the 'default' value for the pages not available."""
+        url_list = [server_url + "/page/1", server_url + "/missing"]
+        output = getFetcher().fetchAll(url_list, default=0.0)
+        assert output == [b"1", 0.0]
+
+    def test_fetchAll_deadline(self, server_url):
+        """Test the 'deadline' stops the batch."""
+        url_list = [server_url + "/page/1", server_url + "/slow"]
+        start = time.monotonic()
+        output = getFetcher(deadline=1.0).fetchAll(url_list, default=0.0)
+        assert time.monotonic() - start < 2.5
+        assert output == [b"1", 0.0]
+
+    def test_fetchAll_deadline_workers(self, server_url):
+        """Test the work abandoned at the deadline releases the workers."""
+        executor = ThreadPoolExecutor(max_workers=2)
+        url_list = [server_url + "/slow"] * 4
+        fetcher = getFetcher(deadline=1.0, executor=executor)
+        assert fetcher.fetchAll(url_list, default=0.0) == [0.0] * 4
+
+        # No retry is done after the deadline, neither the queued requests
+        start = time.monotonic()
+        executor.shutdown(wait=True)
+        assert time.monotonic() - start < 0.5
+
+    def test_fetchAll_empty(self):
+        """Test the 'fetchAll' method with an empty list."""
+        assert getFetcher().fetchAll([]) == []
+
+    def test_fetchAll_shared_pool(self, server_url):
+        """Test the shared pool is looked up per batch (after a shutdown)."""
+        tasks = ThreadPoolTasks()
+        fetcher = getFetcher(executor=tasks)
+        url_list = [server_url + "/page/" + str(x) for x in range(3)]
+        assert fetcher.fetchAll(url_list) == [b"0", b"1", b"2"]
+        tasks.shutdown()
+        assert fetcher.fetchAll(url_list) == [b"0", b"1", b"2"]
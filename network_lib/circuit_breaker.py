@@ -0,0 +1,95 @@
+"""This file has a circuit breaker of the web requests per host."""
+
+import threading
+import time
+
+import requests
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised when the requests to a host are blocked by the breaker."""
+
+
+class CircuitBreaker:
+    """Class used to stop requesting a host after consecutive failures.
+
+    After 'failure_threshold' consecutive failures, the circuit of the host
+    is opened: the requests fail immediately, without waiting for any
+    timeout. After 'reset_timeout' seconds, a single trial request is
+    allowed (half-open). A success closes the circuit again.
+
+    All the methods are thread-safe.
+
+    Arguments:
+    - failure_threshold: the consecutive failures that open the circuit
+    - reset_timeout: the seconds before a trial request is allowed
+    - clock: function returning the current time in seconds
+    """
+
+    DEFAULT_FAILURE_THRESHOLD = 3
+    DEFAULT_RESET_TIMEOUT = 60.0
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=None, reset_timeout=None, clock=None):
+        """Create the CircuitBreaker object."""
+        if failure_threshold is None:
+            failure_threshold = CircuitBreaker.DEFAULT_FAILURE_THRESHOLD
+        if reset_timeout is None:
+            reset_timeout = CircuitBreaker.DEFAULT_RESET_TIMEOUT
+        if clock is None:
+            clock = time.monotonic
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.__lock = threading.Lock()
+        self.__host_dict = {}
+
+    """Private methods."""
+
+    def __getState(self, host):
+        failures, opened_time = self.__host_dict.get(host, (0, None))
+        if failures < self.failure_threshold:
+            return CircuitBreaker.CLOSED
+        if self.clock() - opened_time >= self.reset_timeout:
+            return CircuitBreaker.HALF_OPEN
+        return CircuitBreaker.OPEN
+
+    """Public methods."""
+
+    def getState(self, host):
+        """Return the state of the host: 'closed', 'open' or 'half-open'."""
+        with self.__lock:
+            return self.__getState(host)
+
+    def isAllowed(self, host):
+        """Return True if a request to the host is allowed.
+
+        In the half-open state, only one trial request is allowed, until
+        its success or failure is recorded.
+        """
+        with self.__lock:
+            state = self.__getState(host)
+            if state == CircuitBreaker.HALF_OPEN:
+                # Restart the open period, then the concurrent requests wait
+                failures, opened_time = self.__host_dict[host]
+                self.__host_dict[host] = (failures, self.clock())
+            return state != CircuitBreaker.OPEN
+
+    def recordSuccess(self, host):
+        """Close the circuit of the host."""
+        with self.__lock:
+            self.__host_dict.pop(host, None)
+
+    def recordFailure(self, host):
+        """Count a failure of the host, opening the circuit if needed."""
+        with self.__lock:
+            failures, opened_time = self.__host_dict.get(host, (0, None))
+            self.__host_dict[host] = (failures + 1, self.clock())
+
+    def reset(self):
+        """Close the circuits of all the hosts."""
+        with self.__lock:
+            self.__host_dict.clear()
@@ -0,0 +1,43 @@
+"""This file is used to test the 'circuit_breaker.py'."""
+
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.circuit_breaker import CircuitBreaker
+
+
+class Test_CircuitBreaker:
+    """Tests for 'CircuitBreaker' class."""
+
+    def test_open_after_failures(self, clock):
+        """Test the circuit is opened after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+        breaker.recordFailure("host")
+        assert breaker.isAllowed("host") is True
+        breaker.recordFailure("host")
+        assert breaker.getState("host") == CircuitBreaker.OPEN
+        assert breaker.isAllowed("host") is False
+        assert breaker.isAllowed("other") is True
+
+    def test_success_resets_failures(self, clock):
+        """Test a success closes the circuit and resets the failures."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+        breaker.recordFailure("host")
+        breaker.recordSuccess("host")
+        breaker.recordFailure("host")
+        assert breaker.getState("host") == CircuitBreaker.CLOSED
+
+    def test_half_open(self, clock):
+        """Test a single trial request after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.recordFailure("host")
+        assert breaker.isAllowed("host") is False
+        clock.now += 10
+        assert breaker.getState("host") == CircuitBreaker.HALF_OPEN
+        assert breaker.isAllowed("host") is True
+        assert breaker.isAllowed("host") is False
+        breaker.recordSuccess("host")
+        assert breaker.isAllowed("host") is True
@@ -0,0 +1,71 @@
+"""This file has a targeted HTML parser, used by the web scrapers."""
+
+import importlib.util
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+class HtmlParser:
+    """Class used to parse only the parts of the pages used by the selectors.
+
+    The scrapers run a handful of CSS selectors over big pages. Then:
+    - the C-backed 'lxml' parser is used, if it is installed (otherwise,
+      the 'html.parser' of the standard library)
+    - a 'SoupStrainer' restricts the tree to the containers where the
+      selectors start ('#main-2 > div > ...' keeps only the element with
+      the 'main-2' id and its descendants)
+
+    If any selector does not start with an '#id', the whole page is parsed.
+
+    Arguments:
+    - selector_list: the CSS selectors applied to the parsed pages
+    - backend: the BeautifulSoup parser (default: 'getDefaultBackend()')
+    """
+
+    FAST_BACKEND = "lxml"
+    DEFAULT_BACKEND = "html.parser"
+
+    ROOT_ID_PATTERN = re.compile(r"^\s*#([\w-]+)")
+
+    def __init__(self, selector_list=None, backend=None):
+        """Create the HtmlParser object."""
+        if backend is None:
+            backend = HtmlParser.getDefaultBackend()
+        self.backend = backend
+        self.root_id_list = self.__getRootIdList(selector_list)
+        self.strainer = None
+        if self.root_id_list:
+            self.strainer = SoupStrainer(id=self.root_id_list)
+
+    """Private methods."""
+
+    def __getRootIdList(self, selector_list):
+        # Return None if the whole page is needed
+        if not selector_list:
+            return None
+        root_id_list = []
+        for selector in selector_list:
+            if not selector:
+                continue
+            match = HtmlParser.ROOT_ID_PATTERN.match(selector)
+            if match is None:
+                return None
+            root_id_list.append(match.group(1))
+        return sorted(set(root_id_list)) or None
+
+    """Public methods."""
+
+    @staticmethod
+    def getDefaultBackend():
+        """Return 'lxml' if it is installed, else 'html.parser'."""
+        if importlib.util.find_spec(HtmlParser.FAST_BACKEND) is not None:
+            return HtmlParser.FAST_BACKEND
+        return HtmlParser.DEFAULT_BACKEND
+
+    def parse(self, content):
+        """Return the 'BeautifulSoup' object of the page content.
+
+        The content may be a string, bytes or an opened file.
+        """
+        return BeautifulSoup(content, self.backend, parse_only=self.strainer)
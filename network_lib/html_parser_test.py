@@ -0,0 +1,65 @@
+"""This file is used to test the 'html_parser.py'."""
+
+import os
+import sys
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.html_parser import HtmlParser
+
+PAGE = """
+<html><body>
+<nav><div><strong>ignored</strong></div></nav>
+<main id="main-2"><div><strong>1,00</strong></div><div><strong>2,00</strong></div></main>
+<section id="indicators-section"><div><strong>3,00</strong></div></section>
+<span class="value">4,00</span>
+</body></html>
+"""
+
+
+class Test_HtmlParser:
+    """Tests for 'HtmlParser' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - selector_list, expected root id list
+    test_root_id_list = [
+        (
+            ["#main-2 > div", "#indicators-section strong"],
+            ["indicators-section", "main-2"],
+        ),
+        (["#main-2 > div", "", None], ["main-2"]),
+        (["#main-2 > div", "div.value"], None),
+        ([], None),
+        (None, None),
+    ]
+
+    @pytest.mark.parametrize("selector_list, root_id_list", test_root_id_list)
+    def test_root_id_list(self, selector_list, root_id_list):
+        """Test the containers kept by the strainer."""
+        parser = HtmlParser(selector_list)
+        assert parser.root_id_list == root_id_list
+
+    @pytest.mark.parametrize("backend", ["html.parser", None])
+    def test_parse(self, backend):
+        """Test the selectors against the targeted tree."""
+        selector = "#main-2 > div:nth-child(2) > strong"
+        parser = HtmlParser([selector, "#indicators-section strong"], backend)
+        soup = parser.parse(PAGE)
+        assert soup.select(selector)[0].get_text() == "2,00"
+        assert soup.select("#indicators-section strong")[0].get_text() == "3,00"
+        assert "ignored" not in soup.get_text()
+
+    def test_parse_whole_page(self):
+        """Test the whole page is parsed without selectors."""
+        soup = HtmlParser().parse(PAGE)
+        assert soup.find(class_="value").get_text() == "4,00"
+
+    def test_getDefaultBackend(self):
+        """Test the default backend is one of the known parsers."""
+        assert HtmlParser.getDefaultBackend() in [
+            HtmlParser.FAST_BACKEND,
+            HtmlParser.DEFAULT_BACKEND,
+        ]
@@ -0,0 +1,223 @@
+"""This file has a shared HTTP session, useful to reuse web connections."""
+
+import contextvars
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from network_lib.circuit_breaker import CircuitBreaker, CircuitOpenError
+from network_lib.single_flight import SingleFlight
+from network_lib.time_budget import TimeBudget
+
+
+class HttpSession:
+    """Class used to perform HTTP requests through a keep-alive session.
+
+    The connections are pooled per host, then several requests to the same
+    website (Status Invest, for example) do not need to open a new TCP/TLS
+    connection each time. Also, every request has a timeout, in order to
+    avoid a hung request blocking the application.
+
+    The failed requests (connection errors, timeouts and server errors) are
+    retried with exponential backoff. A 'CircuitBreaker' stops requesting
+    the hosts that keep failing. Also, all the requests may share an
+    overall 'TimeBudget' (see 'startBudget'), where each timeout is limited
+    by the remaining time. The timeouts cut short by the budget are not
+    failures of the host, then they do not open its circuit.
+
+    The budget is scoped by the context ('contextvars') of the caller: it
+    limits the requests of the same thread and of the tasks it submits to
+    the shared pool ('ThreadPoolTasks') or to the 'AsyncFetcher'. The other
+    threads (the background revalidations, for example) are not limited.
+
+    The concurrent requests of the same URL share a single request
+    ('SingleFlight'). Inside a refresh scope (see 'startRefresh'), the
+    repeated requests of the same URL also reuse the first successful
+    response (2xx or 304).
+
+    Arguments:
+    - timeout: a (connect, read) tuple of seconds
+    - pool_maxsize: the maximum number of connections kept per host
+    - retries: the maximum amount of retries per request
+    - backoff: the delay (seconds) before the first retry, doubled after
+      each retry
+    - circuitBreaker: the 'CircuitBreaker' object
+    """
+
+    HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+    DEFAULT_TIMEOUT = (5, 15)
+    DEFAULT_POOL_MAXSIZE = 16
+    DEFAULT_RETRIES = 2
+    DEFAULT_BACKOFF = 0.5
+
+    # Status codes worth a retry (server overloaded or unavailable)
+    RETRY_STATUS_LIST = [429, 500, 502, 503, 504]
+
+    def __init__(
+        self,
+        timeout=None,
+        pool_maxsize=None,
+        retries=None,
+        backoff=None,
+        circuitBreaker=None,
+    ):
+        """Create the HttpSession object."""
+        if timeout is None:
+            timeout = HttpSession.DEFAULT_TIMEOUT
+        if pool_maxsize is None:
+            pool_maxsize = HttpSession.DEFAULT_POOL_MAXSIZE
+        if retries is None:
+            retries = HttpSession.DEFAULT_RETRIES
+        if backoff is None:
+            backoff = HttpSession.DEFAULT_BACKOFF
+        if circuitBreaker is None:
+            circuitBreaker = CircuitBreaker()
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff = backoff
+        self.circuitBreaker = circuitBreaker
+        self.__budget = contextvars.ContextVar("HttpSession.budget", default=None)
+        self.singleFlight = SingleFlight()
+        self.session = self.__createSession()
+
+    """Private methods."""
+
+    def __createSession(self):
+        session = requests.Session()
+        session.headers.update(HttpSession.HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_maxsize,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def __isHostFailure(self, error, timeout, attempt_timeout):
+        # A timeout limited by the budget does not mean the host is down
+        if isinstance(error, requests.Timeout):
+            return attempt_timeout == timeout
+        return True
+
+    def __isSuccess(self, page):
+        return 200 <= page.status_code < 300 or page.status_code == 304
+
+    def __waitBackoff(self, attempt):
+        # Return False if the budget is over before the next attempt
+        delay = self.backoff * (2**attempt)
+        remaining = self.budget.remaining()
+        if remaining is not None and remaining <= delay:
+            return False
+        time.sleep(delay)
+        return True
+
+    def __get(self, url, timeout, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            if not self.circuitBreaker.isAllowed(host):
+                raise CircuitOpenError("Too many failures of the host: " + host)
+            attempt_timeout = self.budget.getTimeout(timeout)
+            try:
+                page = self.session.get(url, timeout=attempt_timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if self.__isHostFailure(error, timeout, attempt_timeout):
+                    self.circuitBreaker.recordFailure(host)
+                if attempt >= self.retries or not self.__waitBackoff(attempt):
+                    raise
+            else:
+                if page.status_code not in HttpSession.RETRY_STATUS_LIST:
+                    self.circuitBreaker.recordSuccess(host)
+                    return page
+                self.circuitBreaker.recordFailure(host)
+                if attempt >= self.retries or not self.__waitBackoff(attempt):
+                    return page
+            attempt += 1
+
+    """Public methods."""
+
+    @property
+    def budget(self):
+        """Return the 'TimeBudget' of the current context (no limit if none)."""
+        budget = self.__budget.get()
+        if budget is None:
+            return TimeBudget()
+        return budget
+
+    def get(self, url, timeout=None, **kwargs):
+        """Perform a GET request and return the 'requests.Response'.
+
+        The 'requests.RequestException' is raised in case of connection
+        errors or timeouts, after the retries. Also, it is raised when the
+        host circuit is open ('CircuitOpenError') or the time budget is over
+        ('BudgetExpiredError').
+
+        The requests without extra arguments are coalesced by URL.
+        """
+        if kwargs:
+            return self.__get(url, timeout, **kwargs)
+        return self.singleFlight.do(
+            url,
+            lambda: self.__get(url, timeout),
+            keep=self.__isSuccess,
+        )
+
+    def startBudget(self, seconds):
+        """Start an overall time budget shared by the next requests.
+
+        The budget is set in the current context only. Return the
+        'TimeBudget' object.
+        """
+        budget = TimeBudget(seconds)
+        self.__budget.set(budget)
+        return budget
+
+    def clearBudget(self):
+        """Remove the time budget of the requests (current context)."""
+        self.__budget.set(None)
+
+    def startRefresh(self, seconds=None):
+        """Start a refresh: the time budget and the reuse of the responses.
+
+        The repeated requests of the same URL reuse the first successful
+        response until the matching 'endRefresh'. The refreshes may be nested.
+        """
+        self.singleFlight.startScope()
+        if seconds is not None:
+            self.startBudget(seconds)
+
+    def endRefresh(self):
+        """End the refresh started by 'startRefresh'.
+
+        The time budget is removed after the outer refresh.
+        """
+        if self.singleFlight.endScope():
+            self.clearBudget()
+
+    def getStatistics(self):
+        """Return a dictionary with the counts of the coalesced requests."""
+        return self.singleFlight.getStatistics()
+
+    def close(self):
+        """Close all the pooled connections."""
+        self.session.close()
+
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def getSharedSession():
+    """Return the HttpSession shared by the whole application."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = HttpSession()
+        return _shared_session
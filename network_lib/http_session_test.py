@@ -0,0 +1,141 @@
+"""This file is used to test the 'http_session.py'."""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.circuit_breaker import CircuitBreaker, CircuitOpenError
+from network_lib.http_session import HttpSession
+from network_lib.time_budget import BudgetExpiredError
+from portfolio_lib.multi_processing import ThreadPoolTasks
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Local stand-in server.
+
+    - '/flaky/N': fails (503) the first N requests, then returns 'ok'
+    - '/error': always fails (503)
+    - '/slow': hangs for 2 seconds
+    """
+
+    counter_dict = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        """Answer the GET requests."""
+        status = 200
+        if self.path.startswith("/flaky/"):
+            with FixtureHandler.lock:
+                count = FixtureHandler.counter_dict.get(self.path, 0)
+                FixtureHandler.counter_dict[self.path] = count + 1
+            if count < int(self.path.split("/")[-1]):
+                status = 503
+        elif self.path == "/error":
+            status = 503
+        elif self.path == "/slow":
+            time.sleep(2)
+        body = b"ok" if status == 200 else b"error"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Do not print the requests."""
+
+
+class Test_HttpSession:
+    """Tests for 'HttpSession' class."""
+
+    def test_get_retries(self, server_url):
+        """Test the failed requests are retried."""
+        session = HttpSession(retries=2, backoff=0.01)
+        page = session.get(server_url + "/flaky/2")
+        assert page.status_code == 200
+        assert page.content == b"ok"
+
+    def test_get_retries_exhausted(self, server_url):
+        """Test the last response is returned after the retries."""
+        session = HttpSession(retries=1, backoff=0.01)
+        page = session.get(server_url + "/flaky/5")
+        assert page.status_code == 503
+
+    def test_get_circuit_breaker(self, server_url):
+        """Test the host is not requested while the circuit is open."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        session = HttpSession(retries=0, circuitBreaker=breaker)
+        session.get(server_url + "/error")
+        session.get(server_url + "/error")
+        with pytest.raises(CircuitOpenError):
+            session.get(server_url + "/page")
+
+    def test_get_budget(self, server_url):
+        """Test the requests share the time budget."""
+        session = HttpSession(retries=2, backoff=0.01)
+        session.startBudget(0.5)
+        start = time.monotonic()
+        with pytest.raises(requests.Timeout):
+            session.get(server_url + "/slow")
+        with pytest.raises(BudgetExpiredError):
+            session.get(server_url + "/flaky/0")
+        assert time.monotonic() - start < 1.5
+        session.clearBudget()
+        assert session.get(server_url + "/flaky/0").status_code == 200
+
+    def test_get_budget_circuit_breaker(self, server_url):
+        """Test the timeouts cut short by the budget do not open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        session = HttpSession(retries=0, circuitBreaker=breaker)
+        session.startBudget(0.3)
+        with pytest.raises(requests.Timeout):
+            session.get(server_url + "/slow")
+        session.clearBudget()
+        assert breaker.isAllowed(urlsplit(server_url).netloc) is True
+
+    def test_budget_context(self):
+        """Test the budget is scoped by the context of the caller."""
+        session = HttpSession()
+        session.startBudget(10)
+        remaining_list = []
+        thread = threading.Thread(
+            target=lambda: remaining_list.append(session.budget.remaining()),
+        )
+        thread.start()
+        thread.join()
+        assert remaining_list == [None]
+
+        # The tasks of the shared pool keep the caller context
+        remaining_list = ThreadPoolTasks().runPool(
+            lambda value: session.budget.remaining(),
+            range(3),
+        )
+        assert all(remaining > 0 for remaining in remaining_list)
+        session.clearBudget()
+        assert session.budget.remaining() is None
+
+    def test_get_refresh(self, server_url):
+        """Test the repeated requests reuse the response during a refresh.
+
+        Only the successful responses are reused.
+        """
+        session = HttpSession(retries=0)
+        url = server_url + "/flaky/1"
+        session.startRefresh()
+        assert session.get(url).status_code == 503
+        assert session.get(url).status_code == 200
+        assert session.get(url).status_code == 200
+        session.endRefresh()
+        assert session.getStatistics() == {
+            "calls": 3,
+            "executions": 2,
+            "coalesced": 1,
+        }
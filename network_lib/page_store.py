@@ -0,0 +1,270 @@
+"""This file has a compressed, size-bounded store of web pages."""
+
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class PageStore:
+    """Class used to store web pages in a folder, with LRU eviction.
+
+    Each page (entry) is stored compressed ('gzip') in its own file. An
+    index file keeps, per entry, the compressed size, the time it was
+    stored, the time it was last checked (revalidated) and its HTTP
+    validators (ETag / Last-Modified). Then, the freshness of the entries
+    is known without any file system call per page.
+
+    The index keeps the entries in the order of the last access. When the
+    total size is beyond 'max_size', the least recently used entries are
+    removed (together with their sidecar files, if any).
+
+    All the methods are thread-safe. The index is saved after each change
+    of the entries, and also at exit (in order to keep the access order).
+
+    Arguments:
+    - folder_path: the folder of the entries and the index file
+    - max_size: the maximum total size (bytes) of the compressed entries
+    - sidecar_extension_list: extensions of other files related to each
+      entry ('BBAS3.gz' -> 'BBAS3.json'), removed together with it
+    - clock: function returning the current time in seconds
+    """
+
+    FILE_EXTENSION = ".gz"
+    INDEX_FILE_NAME = "index.json"
+
+    DEFAULT_MAX_SIZE = 20 * 1024 * 1024
+    COMPRESS_LEVEL = 6
+
+    def __init__(
+        self,
+        folder_path,
+        max_size=None,
+        sidecar_extension_list=None,
+        clock=None,
+    ):
+        """Create the PageStore object."""
+        if max_size is None:
+            max_size = PageStore.DEFAULT_MAX_SIZE
+        if sidecar_extension_list is None:
+            sidecar_extension_list = []
+        if clock is None:
+            clock = time.time
+        self.folder_path = folder_path
+        self.max_size = max_size
+        self.sidecar_extension_list = list(sidecar_extension_list)
+        self.clock = clock
+        self.__lock = threading.RLock()
+        self.__entry_dict = OrderedDict()
+        self.__size = 0
+        self.__evictions = 0
+        self.__changed = False
+        if not os.path.isdir(folder_path):
+            os.makedirs(folder_path)
+        self.load()
+        atexit.register(self.save)
+
+    """Private methods."""
+
+    def __getIndexPath(self):
+        return os.path.join(self.folder_path, PageStore.INDEX_FILE_NAME)
+
+    def __getTempPath(self, path):
+        return path + "." + str(threading.get_ident()) + ".tmp"
+
+    def __removeFiles(self, key):
+        path = self.getPath(key)
+        root = path[: -len(PageStore.FILE_EXTENSION)]
+        for file_path in [path] + [root + ext for ext in self.sidecar_extension_list]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+    def __removeEntry(self, key):
+        entry = self.__entry_dict.pop(key, None)
+        if entry is None:
+            return
+        self.__size -= entry["size"]
+        self.__removeFiles(key)
+        self.__changed = True
+
+    def __evict(self, keep_key):
+        # Remove the least recently used entries, except the 'keep_key'
+        for key in list(self.__entry_dict):
+            if self.__size <= self.max_size:
+                break
+            if key != keep_key:
+                self.__removeEntry(key)
+                self.__evictions += 1
+
+    def __removeUnknownFiles(self):
+        # Entries written but not indexed (interrupted application)
+        for file_name in os.listdir(self.folder_path):
+            if not file_name.endswith(PageStore.FILE_EXTENSION):
+                continue
+            key = file_name[: -len(PageStore.FILE_EXTENSION)]
+            if key not in self.__entry_dict:
+                self.__removeFiles(key)
+
+    """Public methods."""
+
+    def getPath(self, key):
+        """Return the file path of the entry."""
+        return os.path.join(self.folder_path, key + PageStore.FILE_EXTENSION)
+
+    def has(self, key):
+        """Return True if the entry is stored."""
+        with self.__lock:
+            return key in self.__entry_dict
+
+    def getStoredTime(self, key):
+        """Return the time the entry was stored or checked (None if missing)."""
+        with self.__lock:
+            entry = self.__entry_dict.get(key)
+            if entry is None:
+                return None
+            return max(entry["stored"], entry["checked"])
+
+    def getValidators(self, key):
+        """Return a dictionary with the 'etag' and 'last_modified' values."""
+        with self.__lock:
+            entry = self.__entry_dict.get(key, {})
+            return {
+                "etag": entry.get("etag"),
+                "last_modified": entry.get("last_modified"),
+            }
+
+    def read(self, key):
+        """Return the content (bytes) of the entry, or None if missing.
+
+        The entry becomes the most recently used one.
+        """
+        with self.__lock:
+            if key not in self.__entry_dict:
+                return None
+            self.__entry_dict.move_to_end(key)
+            self.__changed = True
+        try:
+            with gzip.open(self.getPath(key), "rb") as entry_file:
+                return entry_file.read()
+        except (OSError, EOFError):
+            self.remove(key)
+            return None
+
+    def write(self, key, content, etag=None, last_modified=None):
+        """Store the content (bytes) of the entry, with its validators.
+
+        The least recently used entries are removed if the total size is
+        beyond the limit.
+        """
+        path = self.getPath(key)
+        temp_path = self.__getTempPath(path)
+        data = gzip.compress(content, compresslevel=PageStore.COMPRESS_LEVEL)
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(data)
+        with self.__lock:
+            os.replace(temp_path, path)
+            entry = self.__entry_dict.pop(key, None)
+            if entry is not None:
+                self.__size -= entry["size"]
+            now = self.clock()
+            self.__entry_dict[key] = {
+                "size": len(data),
+                "stored": now,
+                "checked": now,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            self.__size += len(data)
+            self.__changed = True
+            self.__evict(key)
+        self.save()
+
+    def touch(self, key):
+        """Update the check time of the entry (the content is still valid).
+
+        Return False if the entry is not stored.
+        """
+        with self.__lock:
+            entry = self.__entry_dict.get(key)
+            if entry is None:
+                return False
+            entry["checked"] = self.clock()
+            self.__entry_dict.move_to_end(key)
+            self.__changed = True
+        self.save()
+        return True
+
+    def remove(self, key):
+        """Remove the entry (and its sidecar files)."""
+        with self.__lock:
+            self.__removeEntry(key)
+        self.save()
+
+    def getStatistics(self):
+        """Return a dictionary with the 'entries', 'size' and 'evictions'."""
+        with self.__lock:
+            return {
+                "entries": len(self.__entry_dict),
+                "size": self.__size,
+                "evictions": self.__evictions,
+            }
+
+    def save(self):
+        """Save the index file, if some entry was changed."""
+        with self.__lock:
+            if not self.__changed:
+                return
+            self.__changed = False
+            index_path = self.__getIndexPath()
+            temp_path = self.__getTempPath(index_path)
+            with open(temp_path, "w", encoding="utf-8") as json_file:
+                json.dump(list(self.__entry_dict.items()), json_file)
+            os.replace(temp_path, index_path)
+
+    def load(self):
+        """Load the index file and remove the files not indexed.
+
+        Return False if the index file is not available.
+        """
+        try:
+            with open(self.__getIndexPath(), encoding="utf-8") as json_file:
+                item_list = json.load(json_file)
+        except (OSError, ValueError):
+            item_list = None
+        with self.__lock:
+            self.__entry_dict.clear()
+            self.__size = 0
+            for key, entry in item_list or []:
+                self.__entry_dict[key] = entry
+                self.__size += entry["size"]
+            self.__removeUnknownFiles()
+            self.__evict(None)
+        return item_list is not None
+
+
+_shared_store_dict = {}
+_shared_store_lock = threading.Lock()
+
+
+def getSharedPageStore(folder_path, max_size=None, sidecar_extension_list=None):
+    """Return the PageStore shared by the whole application for the folder.
+
+    Only one store must manage each folder: otherwise, the last index
+    written wins, and the pages of the other stores are removed as unknown
+    files at the next load. The arguments are used only by the first call
+    of each folder.
+    """
+    key = os.path.normcase(os.path.abspath(folder_path))
+    with _shared_store_lock:
+        if key not in _shared_store_dict:
+            _shared_store_dict[key] = PageStore(
+                folder_path,
+                max_size=max_size,
+                sidecar_extension_list=sidecar_extension_list,
+            )
+        return _shared_store_dict[key]
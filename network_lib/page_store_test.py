@@ -0,0 +1,132 @@
+"""This file is used to test the 'page_store.py'."""
+
+import os
+import sys
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.page_store import PageStore, getSharedPageStore
+
+PAGE = b"<html><body>" + b"<div>BBAS3 42,00</div>" * 200 + b"</body></html>"
+
+
+class Test_PageStore:
+    """Tests for 'PageStore' class."""
+
+    def getStore(self, tmp_path, max_size=None, clock=None):
+        """Return the PageStore object under testing."""
+        return PageStore(
+            str(tmp_path),
+            max_size=max_size,
+            sidecar_extension_list=[".json"],
+            clock=clock,
+        )
+
+    def getEntrySize(self, tmp_path):
+        """Return the compressed size of the 'PAGE'."""
+        store = self.getStore(tmp_path / "size")
+        store.write("PAGE", PAGE)
+        return store.getStatistics()["size"]
+
+    def test_write_read(self, tmp_path):
+        """Test the 'write' and 'read' methods."""
+        store = self.getStore(tmp_path)
+        store.write("BBAS3", PAGE, etag='"v1"', last_modified="Mon, 02 Jan 2023")
+        assert store.has("BBAS3") is True
+        assert store.read("BBAS3") == PAGE
+        assert store.read("ITSA4") is None
+        assert store.getValidators("BBAS3") == {
+            "etag": '"v1"',
+            "last_modified": "Mon, 02 Jan 2023",
+        }
+
+        # The entries are compressed
+        assert os.path.getsize(store.getPath("BBAS3")) < len(PAGE) / 10
+        assert store.getStatistics()["entries"] == 1
+
+    def test_touch(self, tmp_path, clock):
+        """Test the 'touch' method."""
+        store = self.getStore(tmp_path, clock=clock)
+        store.write("BBAS3", PAGE)
+        assert store.getStoredTime("BBAS3") == 1000.0
+        clock.now = 2000.0
+        assert store.touch("BBAS3") is True
+        assert store.getStoredTime("BBAS3") == 2000.0
+        assert store.touch("ITSA4") is False
+        assert store.getStoredTime("ITSA4") is None
+
+    def test_eviction(self, tmp_path):
+        """Test the removal of the least recently used entries."""
+        entry_size = self.getEntrySize(tmp_path)
+        store = self.getStore(tmp_path / "store", max_size=entry_size * 2)
+        store.write("BBAS3", PAGE)
+        store.write("ITSA4", PAGE)
+        with open(str(tmp_path / "store" / "BBAS3.json"), "w") as json_file:
+            json_file.write("{}")
+
+        # The 'BBAS3' is the most recently used
+        store.read("BBAS3")
+        store.write("HGLG11", PAGE)
+        assert store.has("ITSA4") is False
+        assert not os.path.isfile(store.getPath("ITSA4"))
+
+        store.write("IVVB11", PAGE)
+        assert store.has("BBAS3") is False
+        assert not os.path.isfile(str(tmp_path / "store" / "BBAS3.json"))
+        assert store.getStatistics() == {
+            "entries": 2,
+            "size": entry_size * 2,
+            "evictions": 2,
+        }
+
+    def test_load(self, tmp_path, clock):
+        """Test the index file loaded by a new object."""
+        store = self.getStore(tmp_path, clock=clock)
+        store.write("BBAS3", PAGE, etag='"v1"')
+        store.write("ITSA4", PAGE)
+        store.remove("ITSA4")
+
+        # Entry not indexed (interrupted application)
+        with open(str(tmp_path / "HGLG11.gz"), "wb") as entry_file:
+            entry_file.write(b"")
+
+        new_store = self.getStore(tmp_path)
+        assert new_store.getStoredTime("BBAS3") == 1000.0
+        assert new_store.getValidators("BBAS3")["etag"] == '"v1"'
+        assert new_store.read("BBAS3") == PAGE
+        assert new_store.has("ITSA4") is False
+        assert not os.path.isfile(str(tmp_path / "HGLG11.gz"))
+
+    def test_shared_page_store(self, tmp_path):
+        """Test the folder is managed by only one shared store."""
+        store = getSharedPageStore(str(tmp_path / "shared"))
+        other_store = getSharedPageStore(str(tmp_path / "shared" / "."))
+        assert other_store is store
+        assert getSharedPageStore(str(tmp_path / "other")) is not store
+
+        # The entries of all the users are kept in the index
+        store.write("BBAS3", PAGE)
+        other_store.write("ITSA4", PAGE)
+        new_store = self.getStore(tmp_path / "shared")
+        assert new_store.read("BBAS3") == PAGE
+        assert new_store.read("ITSA4") == PAGE
+
+    def test_read_missing_file(self, tmp_path):
+        """Test the 'read' method when the entry file was removed."""
+        store = self.getStore(tmp_path)
+        store.write("BBAS3", PAGE)
+        os.remove(store.getPath("BBAS3"))
+        assert store.read("BBAS3") is None
+        assert store.has("BBAS3") is False
+
+    @pytest.mark.parametrize("max_size", [1, 10])
+    def test_write_beyond_limit(self, tmp_path, max_size):
+        """Test an entry bigger than the whole limit is still stored."""
+        store = self.getStore(tmp_path, max_size=max_size)
+        store.write("BBAS3", PAGE)
+        store.write("ITSA4", PAGE)
+        assert store.has("BBAS3") is False
+        assert store.read("ITSA4") == PAGE
@@ -0,0 +1,439 @@
+"""This file has an in-process cache of quotes, shared by the assets."""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+
+class QuoteCache:
+    """Class used to cache the parsed quotes collected from the web.
+
+    The values are keyed by '(ticker, market, field)', example:
+    - ('BBAS3', 'Ações', 'Cotação') -> 42.0
+
+    Each market has its own time-to-live (TTL), in seconds. The expired
+    values are treated as missing. Then, repeated refreshes inside the TTL
+    window (GUI refresh, Google Drive export, valuation window) do not need
+    any network request.
+
+    All the methods are thread-safe. The hits and misses are counted, in
+    order to check the cache efficiency.
+
+    In the stale-while-revalidate mode, the expired values are kept for
+    'max_stale' seconds more. The 'getOrFetchMany' returns them at once
+    (see 'getAge') and requests the fresh values in a background thread.
+    Then, the listeners ('addListener') are called with the updated keys.
+
+    Arguments:
+    - ttl_dict: the TTL (seconds) per market (default: 'TTL_DICT')
+    - default_ttl: the TTL of the markets not present in 'ttl_dict'
+    - file_path: optional JSON file used as a persisted tier. It is loaded
+      when the object is created and saved by 'save' (also at exit).
+    - clock: function returning the current time in seconds
+    - max_stale: the seconds an expired value is still returned in the
+      stale-while-revalidate mode (default: 'DEFAULT_MAX_STALE')
+    - stale_while_revalidate: if True, the stale-while-revalidate mode is
+      enabled (see 'setStaleWhileRevalidate')
+    """
+
+    DEFAULT_TTL = 15 * 60
+    DEFAULT_MAX_STALE = 24 * 60 * 60
+
+    TTL_DICT = {
+        "Ações": 15 * 60,
+        "FII": 15 * 60,
+        "ETF": 15 * 60,
+        "BDR": 15 * 60,
+        "Tesouro Direto": 60 * 60,
+    }
+
+    KEY_SEPARATOR = "|"
+
+    # Title of the column with the age of the values, in minutes
+    AGE_COLUMN = "Idade (min)"
+
+    def __init__(
+        self,
+        ttl_dict=None,
+        default_ttl=None,
+        file_path=None,
+        clock=None,
+        max_stale=None,
+        stale_while_revalidate=False,
+    ):
+        """Create the QuoteCache object."""
+        if ttl_dict is None:
+            ttl_dict = QuoteCache.TTL_DICT
+        if default_ttl is None:
+            default_ttl = QuoteCache.DEFAULT_TTL
+        if clock is None:
+            clock = time.time
+        if max_stale is None:
+            max_stale = QuoteCache.DEFAULT_MAX_STALE
+        self.ttl_dict = dict(ttl_dict)
+        self.default_ttl = default_ttl
+        self.file_path = file_path
+        self.clock = clock
+        self.max_stale = max_stale
+        self.__lock = threading.RLock()
+        self.__value_dict = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__changed = False
+        self.__stale_while_revalidate = stale_while_revalidate
+        self.__revalidating_set = set()
+        self.__thread_list = []
+        self.__listener_list = []
+        self.__ticker_listener_dict = {}
+        if file_path:
+            self.load()
+            atexit.register(self.save)
+
+    """Private methods."""
+
+    def __getTTL(self, market):
+        return self.ttl_dict.get(market, self.default_ttl)
+
+    def __isFresh(self, key, timestamp):
+        return (self.clock() - timestamp) < self.__getTTL(key[1])
+
+    def __isKept(self, key, timestamp):
+        # The stale values are kept only in the stale-while-revalidate mode
+        if not self.__stale_while_revalidate:
+            return self.__isFresh(key, timestamp)
+        max_age = self.__getTTL(key[1]) + self.max_stale
+        return (self.clock() - timestamp) < max_age
+
+    def __getFreshValue(self, key):
+        # Return a tuple: (found, value)
+        try:
+            value, timestamp = self.__value_dict[key]
+        except KeyError:
+            return False, None
+        if self.__isFresh(key, timestamp):
+            return True, value
+        if not self.__isKept(key, timestamp):
+            del self.__value_dict[key]
+        return False, None
+
+    def __getStaleValue(self, key):
+        # Return a tuple: (found, value) of an expired value still kept
+        try:
+            value, timestamp = self.__value_dict[key]
+        except KeyError:
+            return False, None
+        return True, value
+
+    def __revalidate(self, key_list, fetch_function, not_found):
+        try:
+            fetched_dict = fetch_function(key_list)
+        except Exception:
+            # Keep the stale values if the background request fails
+            fetched_dict = {}
+        finally:
+            with self.__lock:
+                self.__revalidating_set.difference_update(key_list)
+        updated_key_list = []
+        for key in key_list:
+            value = fetched_dict.get(key, not_found)
+            if value is not None and value != not_found:
+                self.set(*key, value)
+                updated_key_list.append(key)
+        if updated_key_list:
+            with self.__lock:
+                listener_list = list(self.__listener_list)
+            for listener in listener_list:
+                # A failing listener (example: a window already closed) must
+                # not stop the others, neither the background thread
+                try:
+                    listener(updated_key_list)
+                except Exception:
+                    pass
+
+    def __getStoreKey(self, key):
+        return QuoteCache.KEY_SEPARATOR.join(key)
+
+    def __getKey(self, store_key):
+        return tuple(store_key.split(QuoteCache.KEY_SEPARATOR))
+
+    """Public methods."""
+
+    def get(self, ticker, market, field, default=None):
+        """Return the cached value, or 'default' if missing or expired."""
+        with self.__lock:
+            found, value = self.__getFreshValue((ticker, market, field))
+            if found:
+                self.__hits += 1
+                return value
+            self.__misses += 1
+            return default
+
+    def set(self, ticker, market, field, value, timestamp=None):
+        """Store the value, starting its TTL window.
+
+        The 'timestamp' is the time the value was collected (default: now).
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        with self.__lock:
+            self.__value_dict[(ticker, market, field)] = (value, timestamp)
+            self.__changed = True
+
+    def getAge(self, ticker, market, field):
+        """Return the age (seconds) of the stored value (None if missing)."""
+        with self.__lock:
+            try:
+                value, timestamp = self.__value_dict[(ticker, market, field)]
+            except KeyError:
+                return None
+            return self.clock() - timestamp
+
+    def getOrFetch(self, ticker, market, field, fetch_function):
+        """Return the cached value, calling 'fetch_function()' if missing.
+
+        The fetched value is stored, except if it is None.
+        """
+        value_dict = self.getOrFetchMany(
+            [(ticker, market, field)],
+            lambda key_list: {key_list[0]: fetch_function()},
+        )
+        return value_dict.get((ticker, market, field))
+
+    def getOrFetchMany(self, key_list, fetch_function, not_found=None):
+        """Return a dictionary with the value of each key.
+
+        The missing keys are requested in a single call, where
+        'fetch_function(missing_key_list)' should return a dictionary
+        'key -> value'. The values equal to 'not_found' (and None) are
+        returned, but not stored.
+
+        In the stale-while-revalidate mode, the expired values still kept
+        are returned at once and requested again in background (see
+        'revalidate').
+
+        Arguments:
+        - key_list: list of '(ticker, market, field)' tuples
+        - fetch_function: the function used to request the missing keys
+        - not_found: the value returned for the keys not available
+        """
+        value_dict = {}
+        missing_key_list = []
+        stale_key_list = []
+        with self.__lock:
+            for key in dict.fromkeys(key_list):
+                found, value = self.__getFreshValue(key)
+                if found:
+                    self.__hits += 1
+                    value_dict[key] = value
+                    continue
+                self.__misses += 1
+                found, value = self.__getStaleValue(key)
+                if found:
+                    value_dict[key] = value
+                    stale_key_list.append(key)
+                else:
+                    missing_key_list.append(key)
+
+        # The request is done outside the lock
+        if missing_key_list:
+            fetched_dict = fetch_function(missing_key_list)
+            for key in missing_key_list:
+                value = fetched_dict.get(key, not_found)
+                value_dict[key] = value
+                if value is not None and value != not_found:
+                    self.set(*key, value)
+        if stale_key_list:
+            self.revalidate(stale_key_list, fetch_function, not_found)
+        return value_dict
+
+    def getCachedMany(self, key_list, not_found=None):
+        """Return a dictionary with the stored value of each key.
+
+        Nothing is requested: the keys not stored return 'not_found'. In the
+        stale-while-revalidate mode, the expired values still kept are
+        returned too (see 'getAge'), without any revalidation.
+        """
+        value_dict = {}
+        with self.__lock:
+            for key in dict.fromkeys(key_list):
+                found, value = self.__getFreshValue(key)
+                if not found:
+                    found, value = self.__getStaleValue(key)
+                value_dict[key] = value if found else not_found
+        return value_dict
+
+    def revalidate(self, key_list, fetch_function, not_found=None):
+        """Request the keys again in a background thread.
+
+        The fresh values are stored and then the listeners are called with
+        the list of updated keys. The keys already being requested are
+        skipped. Return the 'threading.Thread' (None if nothing to do).
+        """
+        with self.__lock:
+            key_list = [
+                key
+                for key in dict.fromkeys(key_list)
+                if key not in self.__revalidating_set
+            ]
+            if not key_list:
+                return None
+            self.__revalidating_set.update(key_list)
+            self.__thread_list = [
+                thread for thread in self.__thread_list if thread.is_alive()
+            ]
+            thread = threading.Thread(
+                target=self.__revalidate,
+                args=(key_list, fetch_function, not_found),
+                name="QuoteCacheRevalidate",
+                daemon=True,
+            )
+            self.__thread_list.append(thread)
+        thread.start()
+        return thread
+
+    def waitRevalidation(self, timeout=None):
+        """Wait the background requests.
+
+        Return True if all of them are finished.
+        """
+        with self.__lock:
+            thread_list = list(self.__thread_list)
+        for thread in thread_list:
+            thread.join(timeout)
+        return not any(thread.is_alive() for thread in thread_list)
+
+    def addListener(self, listener):
+        """Add a function 'listener(key_list)' called after a revalidation.
+
+        The listener is called by the background thread. Its exceptions are
+        ignored.
+        """
+        with self.__lock:
+            self.__listener_list.append(listener)
+
+    def removeListener(self, listener):
+        """Remove the listener added by 'addListener'."""
+        with self.__lock:
+            if listener in self.__listener_list:
+                self.__listener_list.remove(listener)
+
+    def addTickerListener(self, listener, field_list):
+        """Add a function 'listener(ticker_list)' called after a revalidation.
+
+        Only the updated keys of the fields in 'field_list' are considered,
+        and each ticker is listed once. The listener is not called if none
+        of them is updated. See 'addListener'.
+        """
+        field_set = set(field_list)
+
+        def onKeysUpdated(key_list):
+            ticker_list = [key[0] for key in key_list if key[2] in field_set]
+            if ticker_list:
+                listener(list(dict.fromkeys(ticker_list)))
+
+        with self.__lock:
+            self.removeTickerListener(listener)
+            self.__ticker_listener_dict[listener] = onKeysUpdated
+            self.__listener_list.append(onKeysUpdated)
+
+    def removeTickerListener(self, listener):
+        """Remove the listener added by 'addTickerListener'."""
+        with self.__lock:
+            onKeysUpdated = self.__ticker_listener_dict.pop(listener, None)
+            if onKeysUpdated is not None:
+                self.removeListener(onKeysUpdated)
+
+    def setStaleWhileRevalidate(self, enabled):
+        """Enable (or disable) the stale-while-revalidate mode."""
+        with self.__lock:
+            self.__stale_while_revalidate = enabled
+
+    def isStaleWhileRevalidate(self):
+        """Return True if the stale-while-revalidate mode is enabled."""
+        with self.__lock:
+            return self.__stale_while_revalidate
+
+    def invalidate(self, ticker=None, market=None):
+        """Remove the values of the ticker and/or market (all if None)."""
+        with self.__lock:
+            for key in list(self.__value_dict):
+                if ticker is not None and key[0] != ticker:
+                    continue
+                if market is not None and key[1] != market:
+                    continue
+                del self.__value_dict[key]
+                self.__changed = True
+
+    def clear(self):
+        """Remove all the values and reset the statistics."""
+        with self.__lock:
+            self.__value_dict.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__changed = True
+
+    def getStatistics(self):
+        """Return a dictionary with the 'hits', 'misses' and 'size'."""
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "size": len(self.__value_dict),
+            }
+
+    def save(self):
+        """Save the fresh (or kept) values into the persisted tier.
+
+        The file is written only if some value was stored since the last
+        'save'.
+        """
+        if not self.file_path:
+            return
+        with self.__lock:
+            if not self.__changed:
+                return
+            self.__changed = False
+            data = {
+                self.__getStoreKey(key): [value, timestamp]
+                for key, (value, timestamp) in self.__value_dict.items()
+                if self.__isKept(key, timestamp)
+            }
+        folder = os.path.dirname(self.file_path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+        with open(self.file_path, "w", encoding="utf-8") as json_file:
+            json.dump(data, json_file, ensure_ascii=False)
+
+    def load(self):
+        """Load the fresh (or kept) values from the persisted tier.
+
+        Return False if the file is not available.
+        """
+        if not self.file_path:
+            return False
+        try:
+            with open(self.file_path, encoding="utf-8") as json_file:
+                data = json.load(json_file)
+        except (OSError, ValueError):
+            return False
+        with self.__lock:
+            for store_key, (value, timestamp) in data.items():
+                key = self.__getKey(store_key)
+                if len(key) == 3 and self.__isKept(key, timestamp):
+                    self.__value_dict[key] = (value, timestamp)
+        return True
+
+
+_shared_quote_cache = None
+_shared_quote_cache_lock = threading.Lock()
+
+
+def getSharedQuoteCache():
+    """Return the QuoteCache shared by the whole application."""
+    global _shared_quote_cache
+    with _shared_quote_cache_lock:
+        if _shared_quote_cache is None:
+            _shared_quote_cache = QuoteCache()
+        return _shared_quote_cache
@@ -0,0 +1,281 @@
+"""This file is used to test the 'quote_cache.py'."""
+
+import os
+import sys
+import threading
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.quote_cache import QuoteCache
+
+
+def getCache(clock, file_path=None):
+    """Return the QuoteCache object under testing."""
+    return QuoteCache(
+        ttl_dict={"Ações": 60, "Tesouro Direto": 3600},
+        default_ttl=10,
+        file_path=file_path,
+        clock=clock,
+    )
+
+
+class Test_QuoteCache:
+    """Tests for 'QuoteCache' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - market, elapsed seconds, expected value
+    test_get_ttl_list = [
+        ("Ações", 59, 42.0),
+        ("Ações", 60, None),
+        ("Tesouro Direto", 3599, 42.0),
+        ("Tesouro Direto", 3600, None),
+        ("FII", 9, 42.0),
+        ("FII", 10, None),
+    ]
+
+    @pytest.mark.parametrize("market, elapsed, value", test_get_ttl_list)
+    def test_get_ttl(self, market, elapsed, value, clock):
+        """Test the 'get' method respects the TTL per market."""
+        cache = getCache(clock)
+        cache.set("BBAS3", market, "Cotação", 42.0)
+        clock.now += elapsed
+        assert cache.get("BBAS3", market, "Cotação") == value
+
+    def test_getStatistics(self, clock):
+        """Test the hits and misses are counted."""
+        cache = getCache(clock)
+        assert cache.get("BBAS3", "Ações", "Cotação") is None
+        cache.set("BBAS3", "Ações", "Cotação", 42.0)
+        assert cache.get("BBAS3", "Ações", "Cotação") == 42.0
+        assert cache.getStatistics() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_getOrFetchMany(self, clock):
+        """Test only the missing keys are fetched, in a single call."""
+        cache = getCache(clock)
+        cache.set("BBAS3", "Ações", "Cotação", 42.0)
+        fetch_calls = []
+
+        def fetch(key_list):
+            fetch_calls.append(key_list)
+            return {key: 10.0 for key in key_list if key[0] != "XXXX3"}
+
+        key_list = [
+            ("BBAS3", "Ações", "Cotação"),
+            ("PETR4", "Ações", "Cotação"),
+            ("XXXX3", "Ações", "Cotação"),
+        ]
+        output = cache.getOrFetchMany(key_list, fetch, not_found=0.0)
+        assert output == dict(zip(key_list, [42.0, 10.0, 0.0]))
+        assert fetch_calls == [key_list[1:]]
+
+        # The 'not_found' values are not stored
+        output = cache.getOrFetchMany(key_list, fetch, not_found=0.0)
+        assert fetch_calls[-1] == key_list[2:]
+
+    def test_getOrFetch(self, clock):
+        """Test the 'getOrFetch' method avoids repeated requests."""
+        cache = getCache(clock)
+        fetch_calls = []
+
+        def fetch():
+            fetch_calls.append(1)
+            return 42.0
+
+        for _ in range(3):
+            assert cache.getOrFetch("BBAS3", "Ações", "Cotação", fetch) == 42.0
+        assert len(fetch_calls) == 1
+
+    def test_invalidate(self, clock):
+        """Test the 'invalidate' method."""
+        cache = getCache(clock)
+        cache.set("BBAS3", "Ações", "Cotação", 42.0)
+        cache.set("CPTS11", "FII", "Cotação", 8.0)
+        cache.invalidate(market="FII")
+        assert cache.get("CPTS11", "FII", "Cotação") is None
+        assert cache.get("BBAS3", "Ações", "Cotação") == 42.0
+
+    def test_save_load(self, tmp_path, clock):
+        """Test the persisted tier keeps only the fresh values."""
+        file_path = os.path.join(tmp_path, "quotes.json")
+        cache = getCache(clock, file_path)
+        cache.set("BBAS3", "Ações", "Cotação", 42.0)
+        cache.set("SELIC 2027", "Tesouro Direto", "Cotação", 13115.47)
+        cache.save()
+
+        clock.now += 120
+        loaded_cache = getCache(clock, file_path)
+        assert loaded_cache.get("BBAS3", "Ações", "Cotação") is None
+        assert loaded_cache.get("SELIC 2027", "Tesouro Direto", "Cotação") == 13115.47
+
+    def test_thread_safety(self, clock):
+        """Test the concurrent writes and reads."""
+        cache = getCache(clock)
+
+        def worker(index):
+            for value in range(200):
+                cache.set(str(index), "Ações", "Cotação", float(value))
+                cache.get(str(index), "Ações", "Cotação")
+
+        threads = [threading.Thread(target=worker, args=(x,)) for x in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        statistics = cache.getStatistics()
+        assert statistics["hits"] == 8 * 200
+        assert statistics["size"] == 8
+
+
+class Test_QuoteCache_StaleWhileRevalidate:
+    """Tests for the stale-while-revalidate mode of 'QuoteCache' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - elapsed seconds, expected value, background request
+    test_getOrFetchMany_list = [
+        (30, 42.0, False),
+        (90, 42.0, True),
+        (200, 43.0, False),
+    ]
+
+    def getCache(self, clock):
+        """Return the QuoteCache object in the stale-while-revalidate mode."""
+        cache = getCache(clock)
+        cache.max_stale = 100
+        cache.setStaleWhileRevalidate(True)
+        return cache
+
+    @pytest.mark.parametrize(
+        "elapsed, value, background",
+        test_getOrFetchMany_list,
+    )
+    def test_getOrFetchMany(self, elapsed, value, background, clock):
+        """Test the 'getOrFetchMany' method returns the stale values."""
+        cache = self.getCache(clock)
+        cache.set("BBAS3", "Ações", "Cotação", 42.0)
+        clock.now += elapsed
+        updated_list = []
+        cache.addListener(updated_list.append)
+
+        key = ("BBAS3", "Ações", "Cotação")
+        value_dict = cache.getOrFetchMany([key], lambda key_list: {key: 43.0})
+        assert value_dict == {key: value}
+        assert cache.waitRevalidation(timeout=5) is True
+        if background:
+            assert updated_list == [[key]]
+            assert cache.get(*key) == 43.0
+            assert cache.getAge(*key) == 0
+        else:
+            assert updated_list == []
+
+    def test_revalidate_once(self, clock):
+        """Test the keys being revalidated are not requested again."""
+        cache = self.getCache(clock)
+        key = ("BBAS3", "Ações", "Cotação")
+        cache.set(*key, 42.0, timestamp=clock.now - 90)
+        assert cache.getAge(*key) == 90
+
+        started = threading.Event()
+        release = threading.Event()
+        call_list = []
+
+        def fetch(key_list):
+            call_list.append(key_list)
+            started.set()
+            release.wait(5)
+            return {key: 43.0}
+
+        assert cache.getOrFetchMany([key], fetch) == {key: 42.0}
+        assert started.wait(5)
+        assert cache.getOrFetchMany([key], fetch) == {key: 42.0}
+        release.set()
+        assert cache.waitRevalidation(timeout=5) is True
+        assert call_list == [[key]]
+
+    def test_revalidate_failure(self, clock):
+        """Test the stale value is kept if the background request fails."""
+        cache = self.getCache(clock)
+        key = ("BBAS3", "Ações", "Cotação")
+        cache.set(*key, 42.0, timestamp=clock.now - 90)
+
+        def fetch(key_list):
+            raise ConnectionError("Network not available")
+
+        updated_list = []
+        cache.addListener(updated_list.append)
+        cache.removeListener(updated_list.append)
+        assert cache.getOrFetchMany([key], fetch) == {key: 42.0}
+        assert cache.waitRevalidation(timeout=5) is True
+        assert cache.getOrFetchMany([key], lambda key_list: {}) == {key: 42.0}
+        assert cache.waitRevalidation(timeout=5) is True
+        assert updated_list == []
+
+    def test_getCachedMany(self, clock):
+        """Test the stored values (even if stale) are returned at once."""
+        cache = self.getCache(clock)
+        stale_key = ("BBAS3", "Ações", "Cotação")
+        fresh_key = ("CPTS11", "FII", "Cotação")
+        missing_key = ("XXXX3", "Ações", "Cotação")
+        cache.set(*stale_key, 42.0, timestamp=clock.now - 90)
+        cache.set(*fresh_key, 8.0)
+        updated_list = []
+        cache.addListener(updated_list.append)
+
+        key_list = [stale_key, fresh_key, missing_key]
+        output = cache.getCachedMany(key_list, not_found=0.0)
+        assert output == dict(zip(key_list, [42.0, 8.0, 0.0]))
+        assert cache.waitRevalidation(timeout=5) is True
+        assert updated_list == []
+
+    def test_revalidate_listener_failure(self, clock):
+        """Test a failing listener does not stop the other ones."""
+        cache = self.getCache(clock)
+        key = ("BBAS3", "Ações", "Cotação")
+        cache.set(*key, 42.0, timestamp=clock.now - 90)
+
+        def failing_listener(key_list):
+            raise RuntimeError("Window already closed")
+
+        updated_list = []
+        cache.addListener(failing_listener)
+        cache.addListener(updated_list.append)
+        cache.getOrFetchMany([key], lambda key_list: {key: 43.0})
+        assert cache.waitRevalidation(timeout=5) is True
+        assert updated_list == [[key]]
+        assert cache.get(*key) == 43.0
+
+    def test_addTickerListener(self, clock):
+        """Test the listener receives the updated tickers of the fields."""
+        cache = self.getCache(clock)
+        key_list = [
+            ("BBAS3", "Ações", "Cotação"),
+            ("BBAS3", "Ações", "Dividend-Yield"),
+            ("CPTS11", "FII", "P/VP"),
+        ]
+        for key in key_list:
+            cache.set(*key, 1.0, timestamp=clock.now - 90)
+
+        updated_list = []
+        cache.addTickerListener(updated_list.append, ["Cotação", "Dividend-Yield"])
+        cache.getOrFetchMany(key_list, lambda key_list: dict.fromkeys(key_list, 2.0))
+        assert cache.waitRevalidation(timeout=5) is True
+        assert updated_list == [["BBAS3"]]
+
+        # The listener is not called after its removal
+        cache.removeTickerListener(updated_list.append)
+        clock.now += 90
+        cache.getOrFetchMany(key_list, lambda key_list: dict.fromkeys(key_list, 3.0))
+        assert cache.waitRevalidation(timeout=5) is True
+        assert updated_list == [["BBAS3"]]
+
+    def test_disabled(self, clock):
+        """Test the expired values are not returned without the mode."""
+        cache = self.getCache(clock)
+        cache.setStaleWhileRevalidate(False)
+        key = ("BBAS3", "Ações", "Cotação")
+        cache.set(*key, 42.0, timestamp=clock.now - 90)
+        assert cache.getOrFetchMany([key], lambda key_list: {key: 43.0}) == {
+            key: 43.0,
+        }
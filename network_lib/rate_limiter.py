@@ -0,0 +1,135 @@
+"""This file has a token-bucket rate limiter of the web requests per host."""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Class used to limit the rate of some action (token bucket).
+
+    The bucket holds up to 'capacity' tokens and is refilled by 'rate'
+    tokens per second. Each action takes a token: while the bucket has
+    tokens, the actions run at once (burst). Then, they are spaced by
+    '1 / rate' seconds.
+
+    All the methods are thread-safe. The token is reserved under the lock,
+    but the waiting is done outside it, then the concurrent callers are
+    released in order, one per interval.
+
+    Arguments:
+    - rate: the tokens added per second
+    - capacity: the maximum amount of tokens (default: 'rate')
+    - clock: function returning the current time in seconds
+    - sleep: function used to wait some seconds
+    """
+
+    def __init__(self, rate, capacity=None, clock=None, sleep=None):
+        """Create the TokenBucket object."""
+        if rate <= 0:
+            raise ValueError("The rate must be positive.")
+        if capacity is None:
+            capacity = max(rate, 1)
+        if clock is None:
+            clock = time.monotonic
+        if sleep is None:
+            sleep = time.sleep
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.__lock = threading.Lock()
+        self.__tokens = float(capacity)
+        self.__last_time = clock()
+
+    """Private methods."""
+
+    def __refill(self):
+        now = self.clock()
+        elapsed = max(now - self.__last_time, 0.0)
+        self.__tokens = min(self.capacity, self.__tokens + elapsed * self.rate)
+        self.__last_time = now
+
+    """Public methods."""
+
+    def tryAcquire(self):
+        """Take a token if available, without waiting.
+
+        Return True if the token was taken.
+        """
+        with self.__lock:
+            self.__refill()
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return True
+            return False
+
+    def acquire(self):
+        """Take a token, waiting for it if necessary.
+
+        Return the waited time, in seconds.
+        """
+        with self.__lock:
+            self.__refill()
+            # The token may be reserved in advance (negative balance)
+            self.__tokens -= 1
+            wait_time = 0.0
+            if self.__tokens < 0:
+                wait_time = -self.__tokens / self.rate
+        if wait_time > 0:
+            self.sleep(wait_time)
+        return wait_time
+
+
+class HostRateLimiter:
+    """Class used to limit the rate of the requests to each host.
+
+    Each host (the URL 'netloc') has its own 'TokenBucket'. Then, several
+    websites may be requested concurrently, while each one receives at most
+    'rate' requests per second (after a burst of 'capacity' requests).
+
+    Arguments:
+    - rate: the requests per second allowed per host
+    - capacity: the burst of requests allowed per host
+    - clock: function returning the current time in seconds
+    - sleep: function used to wait some seconds
+    """
+
+    DEFAULT_RATE = 10.0
+
+    def __init__(self, rate=None, capacity=None, clock=None, sleep=None):
+        """Create the HostRateLimiter object."""
+        if rate is None:
+            rate = HostRateLimiter.DEFAULT_RATE
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.__lock = threading.Lock()
+        self.__bucket_dict = {}
+
+    """Private methods."""
+
+    def __getBucket(self, host):
+        with self.__lock:
+            if host not in self.__bucket_dict:
+                self.__bucket_dict[host] = TokenBucket(
+                    self.rate,
+                    self.capacity,
+                    clock=self.clock,
+                    sleep=self.sleep,
+                )
+            return self.__bucket_dict[host]
+
+    """Public methods."""
+
+    def getHost(self, url):
+        """Return the host of the URL."""
+        return urlsplit(url).netloc
+
+    def acquire(self, url):
+        """Wait until a request to the URL host is allowed.
+
+        Return the waited time, in seconds.
+        """
+        return self.__getBucket(self.getHost(url)).acquire()
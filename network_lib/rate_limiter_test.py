@@ -0,0 +1,73 @@
+"""This file is used to test the 'rate_limiter.py'."""
+
+import os
+import sys
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.rate_limiter import HostRateLimiter, TokenBucket
+
+
+class Test_TokenBucket:
+    """Tests for 'TokenBucket' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - rate, capacity, calls, expected total wait
+    test_acquire_list = [
+        (2, 2, 2, 0.0),
+        (2, 2, 4, 1.0),
+        (4, 1, 5, 1.0),
+        (10, 5, 15, 1.0),
+    ]
+
+    def getBucket(self, rate, capacity, clock):
+        """Return the TokenBucket object under testing."""
+        return TokenBucket(rate, capacity, clock=clock, sleep=clock.sleep)
+
+    @pytest.mark.parametrize("rate, capacity, calls, expected", test_acquire_list)
+    def test_acquire(self, rate, capacity, calls, expected, clock):
+        """Test the 'acquire' method."""
+        bucket = self.getBucket(rate, capacity, clock)
+        for index in range(calls):
+            bucket.acquire()
+        assert clock.now - 1000.0 == pytest.approx(expected)
+
+    def test_tryAcquire(self, clock):
+        """Test the 'tryAcquire' method."""
+        bucket = self.getBucket(2, 2, clock)
+        assert bucket.tryAcquire() is True
+        assert bucket.tryAcquire() is True
+        assert bucket.tryAcquire() is False
+        clock.now += 0.5
+        assert bucket.tryAcquire() is True
+        assert bucket.tryAcquire() is False
+
+    def test_refill_capacity(self, clock):
+        """Test the refill limited by the capacity."""
+        bucket = self.getBucket(2, 2, clock)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 60
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_invalid_rate(self):
+        """Test the object creation with an invalid rate."""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class Test_HostRateLimiter:
+    """Tests for 'HostRateLimiter' class."""
+
+    def test_acquire(self, clock):
+        """Test the 'acquire' method with several hosts."""
+        limiter = HostRateLimiter(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+        assert limiter.acquire("https://statusinvest.com.br/acoes/bbas3") == 0.0
+        assert limiter.acquire("https://www.tesourodireto.com.br/") == 0.0
+        assert limiter.acquire("https://statusinvest.com.br/fiis/hglg11") == 1.0
+        assert clock.sleep_list == [1.0]
@@ -0,0 +1,113 @@
+"""This file has a single-flight layer, used to coalesce repeated fetches."""
+
+import threading
+
+
+class SingleFlight:
+    """Class used to share a single fetch among the requests of the same key.
+
+    When several threads request the same key at the same time, only the
+    first one (leader) calls the fetch function. The others wait for it and
+    receive the same result (or exception).
+
+    Inside a scope (see 'startScope'), the results are also kept, then the
+    repeated requests of the same key (during a refresh, for example) reuse
+    the first result. The 'keep' function may reject some results (a
+    transient error, for example), then the next request fetches again.
+    The scopes may be nested: the results are removed when the outer scope
+    ends.
+
+    The amount of calls, executions and coalesced requests are counted.
+    All the methods are thread-safe.
+    """
+
+    def __init__(self):
+        """Create the SingleFlight object."""
+        self.__lock = threading.Lock()
+        self.__call_dict = {}
+        self.__result_dict = {}
+        self.__scope_depth = 0
+        self.__calls = 0
+        self.__executions = 0
+        self.__coalesced = 0
+
+    """Private methods."""
+
+    def __join(self, key):
+        # Return a tuple: (state, value), where the state is:
+        # - 'kept': the value is the result kept by the current scope
+        # - 'wait': the value is the in-flight call of another thread
+        # - 'lead': the value is the new call, to be fetched by this thread
+        with self.__lock:
+            self.__calls += 1
+            if key in self.__result_dict:
+                self.__coalesced += 1
+                return "kept", self.__result_dict[key]
+            call = self.__call_dict.get(key)
+            if call is not None:
+                self.__coalesced += 1
+                return "wait", call
+            call = {"event": threading.Event(), "result": None, "error": None}
+            self.__call_dict[key] = call
+            self.__executions += 1
+            return "lead", call
+
+    def __finish(self, key, call, keep):
+        with self.__lock:
+            del self.__call_dict[key]
+            if call["error"] is None and self.__scope_depth > 0:
+                if keep is None or keep(call["result"]):
+                    self.__result_dict[key] = call["result"]
+        call["event"].set()
+
+    """Public methods."""
+
+    def do(self, key, function, keep=None):
+        """Return the result of 'function()', shared among the same keys.
+
+        Inside a scope, the result is kept only if 'keep(result)' is True
+        (or if 'keep' is None).
+        """
+        state, value = self.__join(key)
+        if state == "kept":
+            return value
+        call = value
+        if state == "wait":
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+        try:
+            call["result"] = function()
+        except BaseException as error:
+            call["error"] = error
+            raise
+        finally:
+            self.__finish(key, call, keep)
+        return call["result"]
+
+    def startScope(self):
+        """Start keeping the results, until the matching 'endScope'."""
+        with self.__lock:
+            self.__scope_depth += 1
+
+    def endScope(self):
+        """End the scope, removing the kept results after the outer one.
+
+        Return True if the outer scope was ended.
+        """
+        with self.__lock:
+            self.__scope_depth = max(self.__scope_depth - 1, 0)
+            if self.__scope_depth == 0:
+                self.__result_dict.clear()
+                return True
+            return False
+
+    def getStatistics(self):
+        """Return a dictionary with 'calls', 'executions' and 'coalesced'."""
+        with self.__lock:
+            return {
+                "calls": self.__calls,
+                "executions": self.__executions,
+                "coalesced": self.__coalesced,
+            }
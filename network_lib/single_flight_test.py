@@ -0,0 +1,105 @@
+"""This file is used to test the 'single_flight.py'."""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.single_flight import SingleFlight
+
+
+class SlowFunction:
+    """Function counting its calls, where each call takes some time."""
+
+    def __init__(self, delay=0.2, error=None):
+        """Create the SlowFunction object."""
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        """Return the amount of calls (or raise the error)."""
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.calls
+
+
+def runThreads(flight, key, function, amount):
+    """Call 'flight.do' concurrently and return the results."""
+    result_list = [None] * amount
+
+    def run(index):
+        try:
+            result_list[index] = flight.do(key, function)
+        except ValueError as error:
+            result_list[index] = error
+
+    thread_list = [threading.Thread(target=run, args=(i,)) for i in range(amount)]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    return result_list
+
+
+class Test_SingleFlight:
+    """Tests for 'SingleFlight' class."""
+
+    def test_do_concurrent(self):
+        """Test the concurrent calls share a single execution."""
+        flight = SingleFlight()
+        function = SlowFunction()
+        assert runThreads(flight, "key", function, 8) == [1] * 8
+        assert function.calls == 1
+        assert flight.getStatistics() == {
+            "calls": 8,
+            "executions": 1,
+            "coalesced": 7,
+        }
+
+    def test_do_error(self):
+        """Test the exception is shared among the concurrent calls."""
+        flight = SingleFlight()
+        function = SlowFunction(error=ValueError("error"))
+        result_list = runThreads(flight, "key", function, 4)
+        assert all(isinstance(result, ValueError) for result in result_list)
+        assert function.calls == 1
+
+        # The errors are not kept
+        with pytest.raises(ValueError):
+            flight.do("key", function)
+        assert function.calls == 2
+
+    def test_do_scope(self):
+        """Test the results are kept only inside the scope."""
+        flight = SingleFlight()
+        function = SlowFunction(delay=0.0)
+        assert flight.do("key", function) == 1
+        assert flight.do("key", function) == 2
+
+        flight.startScope()
+        flight.startScope()
+        assert flight.do("key", function) == 3
+        assert flight.endScope() is False
+        assert flight.do("key", function) == 3
+        assert flight.endScope() is True
+        assert flight.do("key", function) == 4
+        assert flight.getStatistics()["coalesced"] == 1
+
+    def test_do_scope_keep(self):
+        """Test the results rejected by 'keep' are not kept by the scope."""
+        flight = SingleFlight()
+        function = SlowFunction(delay=0.0)
+        flight.startScope()
+        assert flight.do("key", function, keep=lambda value: value > 1) == 1
+        assert flight.do("key", function, keep=lambda value: value > 1) == 2
+        assert flight.do("key", function, keep=lambda value: value > 1) == 2
+        flight.endScope()
+        assert function.calls == 2
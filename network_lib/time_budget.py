@@ -0,0 +1,57 @@
+"""This file has an overall time budget shared by several web requests."""
+
+import time
+
+import requests
+
+
+class BudgetExpiredError(requests.Timeout):
+    """Raised when a request is started after the time budget is over."""
+
+
+class TimeBudget:
+    """Class used to share an overall time budget among several requests.
+
+    Each request takes its timeout from the remaining budget, then a slow or
+    hung host cannot block the whole refresh for longer than the budget.
+
+    Arguments:
+    - seconds: the total budget (None means no limit)
+    - clock: function returning the current time in seconds
+    """
+
+    def __init__(self, seconds=None, clock=None):
+        """Create the TimeBudget object."""
+        if clock is None:
+            clock = time.monotonic
+        self.seconds = seconds
+        self.clock = clock
+        self.start_time = clock()
+
+    """Public methods."""
+
+    def remaining(self):
+        """Return the remaining seconds (None if there is no limit)."""
+        if self.seconds is None:
+            return None
+        return max(self.seconds - (self.clock() - self.start_time), 0.0)
+
+    def isExpired(self):
+        """Return True if the budget is over."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+    def getTimeout(self, timeout):
+        """Return the timeout limited by the remaining budget.
+
+        The 'timeout' may be a number or a (connect, read) tuple. The
+        'BudgetExpiredError' is raised if the budget is over.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0.0:
+            raise BudgetExpiredError("The time budget of the requests is over.")
+        if isinstance(timeout, tuple):
+            return tuple(min(value, remaining) for value in timeout)
+        return min(timeout, remaining)
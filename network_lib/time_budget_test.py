@@ -0,0 +1,47 @@
+"""This file is used to test the 'time_budget.py'."""
+
+import os
+import sys
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.time_budget import BudgetExpiredError, TimeBudget
+
+
+class Test_TimeBudget:
+    """Tests for 'TimeBudget' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - elapsed seconds, timeout, expected timeout
+    test_getTimeout_list = [
+        (0, (5, 15), (5, 10)),
+        (7, (5, 15), (3, 3)),
+        (7, 15, 3),
+        (2, 4, 4),
+    ]
+
+    @pytest.mark.parametrize("elapsed, timeout, expected", test_getTimeout_list)
+    def test_getTimeout(self, elapsed, timeout, expected, clock):
+        """Test the 'getTimeout' method."""
+        budget = TimeBudget(10, clock)
+        clock.now += elapsed
+        assert budget.getTimeout(timeout) == expected
+
+    def test_expired(self, clock):
+        """Test the 'BudgetExpiredError' after the budget."""
+        budget = TimeBudget(10, clock)
+        clock.now += 10
+        assert budget.isExpired() is True
+        assert budget.remaining() == 0.0
+        with pytest.raises(BudgetExpiredError):
+            budget.getTimeout((5, 15))
+
+    def test_no_limit(self):
+        """Test the budget without limit."""
+        budget = TimeBudget()
+        assert budget.remaining() is None
+        assert budget.isExpired() is False
+        assert budget.getTimeout((5, 15)) == (5, 15)
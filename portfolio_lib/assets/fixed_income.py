@@ -7,6 +7,8 @@ from portfolio_lib.assets.portfolio_assets import PortfolioAssets
 class FixedIncomeAssets(PortfolioAssets):
     """Class used to manipulate the Fixed Income assets."""
 
+    NET_OF_TAX = True
+
     def __init__(self):
         """Create the FixedIncomeAssets object."""
         super().__init__()
@@ -37,6 +39,9 @@ class FixedIncomeAssets(PortfolioAssets):
         # Calculate values related to the wallet default columns
         self.calculateWalletDefaultColumns(market_list)
 
+        # Estimate the current values discounted by the income tax
+        self.calculateNetOfTaxColumn()
+
         return wallet
 
     """Protected methods."""
@@ -119,11 +124,13 @@ class FixedIncomeAssets(PortfolioAssets):
         - Dividendos
         - JCP
         - Cotação
+        - Cotação líquida
         - Preço mercado
         - Mercado-pago
         - Mercado-pago(%)
         - Líquido parcial
         - Líquido parcial(%)
+        - Líquido parcial real(%)
         - Porcentagem carteira
         """
         self.wallet = self.__currentRendaFixa()
@@ -126,11 +126,13 @@ class Test_FixedIncomeAssets_currentRendaFixa:
             "Dividendos",
             "JCP",
             "Cotação",
+            "Cotação líquida",
             "Preço mercado",
             "Mercado-pago",
             "Mercado-pago(%)",
             "Líquido parcial",
             "Líquido parcial(%)",
+            "Líquido parcial real(%)",
             "Porcentagem carteira",
         ]
         assets = FixedIncomeAssets()
@@ -0,0 +1,250 @@
+"""This file has a facade related to the market data of Variable Income."""
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from network_lib.http_session import getSharedSession
+from network_lib.time_budget import BudgetExpiredError
+
+from portfolio_lib.assets.sector_store import getSharedSectorStore
+from portfolio_lib.multi_processing import ThreadPoolTasks
+
+
+class MarketDataProvider:
+    """Class used to get the market data of a whole list of tickers.
+
+    The price, the dividends paid in the last 12 months and the sector are
+    requested for all the tickers at once:
+    - a single 'yf.download' call returns the prices and the dividends
+    - the sectors are read from the local 'SectorStore'. Only the missing
+      ones are requested (concurrently) and then stored. As before, the
+      ticker is looked up as it is (foreign tickers) and then with the
+      '.SA' suffix.
+
+    The dividend yield is the sum of the dividends paid in the last 12
+    months (yfinance) over the last 'Close' price. It is no longer read
+    from the Status Invest pages (see 'currentMarketYieldByTickerList').
+
+    The B3 tickers are identified by the '.SA' suffix in the yfinance
+    library. This class is the only place where the suffix is handled: the
+    inputs may have it or not, and the outputs never have it.
+
+    Arguments:
+    - sectorStore: the 'SectorStore' object (default: the shared one)
+    """
+
+    YAHOO_SUFFIX = ".SA"
+
+    VALUE_NOT_FOUND = 0.0
+    SECTOR_NOT_FOUND = "Sector not found"
+
+    PRICE_COLUMN = "Cotação"
+    DIVIDENDS_COLUMN = "Dividendos 12M"
+    YIELD_COLUMN = "Dividend-Yield"
+    SECTOR_COLUMN = "Setor"
+
+    # Period of the downloaded data (also used to sum the dividends)
+    DOWNLOAD_PERIOD = "1y"
+    DOWNLOAD_TIMEOUT = 10
+
+    HISTORY_COLUMN_LIST = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+    def __init__(self, sectorStore=None):
+        """Create the MarketDataProvider object."""
+        if sectorStore is None:
+            sectorStore = getSharedSectorStore()
+        self.sectorStore = sectorStore
+
+    """Private methods."""
+
+    def __getColumnDataframe(self, dataframe, column, yahoo_list):
+        # The 'yf.download' returns one column per ticker for each field
+        if column not in dataframe.columns.get_level_values(0):
+            return pd.DataFrame(index=dataframe.index, columns=yahoo_list)
+        data = dataframe[column]
+        if isinstance(data, pd.Series):
+            data = data.to_frame(name=yahoo_list[0])
+        return data.reindex(columns=yahoo_list).astype(float)
+
+    def __getLastValues(self, dataframe):
+        if dataframe.empty:
+            return pd.Series(np.nan, index=dataframe.columns, dtype=float)
+        return dataframe.ffill().iloc[-1]
+
+    def __getSectorByTicker(self, ticker):
+        # The raw ticker first (foreign tickers), then the B3 one ('.SA')
+        sector = self._getSectorByYahooTicker(ticker)
+        if sector == MarketDataProvider.SECTOR_NOT_FOUND:
+            sector = self._getSectorByYahooTicker(self.getYahooTicker(ticker))
+        return sector
+
+    def __fetchSectorDict(self, ticker_list):
+        sector_list = ThreadPoolTasks().runPool(
+            self.__getSectorByTicker,
+            ticker_list,
+        )
+        return dict(zip(ticker_list, sector_list))
+
+    """Protected methods."""
+
+    def _download(self, yahoo_list):
+        """Return the 'yf.download' dataframe of the yfinance tickers.
+
+        The timeout is limited by the time budget of the shared session. If
+        the budget is over, an empty dataframe is returned.
+        """
+        try:
+            timeout = getSharedSession().budget.getTimeout(
+                MarketDataProvider.DOWNLOAD_TIMEOUT,
+            )
+        except BudgetExpiredError:
+            return pd.DataFrame()
+        return yf.download(
+            yahoo_list,
+            period=MarketDataProvider.DOWNLOAD_PERIOD,
+            actions=True,
+            auto_adjust=False,
+            group_by="column",
+            progress=False,
+            timeout=timeout,
+        )
+
+    def _downloadHistory(self, yahoo_ticker, start_date, end_date):
+        """Return the 'yf.download' daily history of the yfinance ticker.
+
+        The 'end_date' is not included.
+        """
+        return yf.download(
+            yahoo_ticker,
+            start=start_date,
+            end=end_date,
+            interval="1d",
+            actions=False,
+            auto_adjust=False,
+            progress=False,
+        )
+
+    def _getSectorByYahooTicker(self, yahoo_ticker):
+        """Return the sector of the yfinance ticker."""
+        try:
+            return yf.Ticker(yahoo_ticker).info["sector"]
+        except Exception:
+            # The yfinance raises several types of errors for unknown
+            # tickers or network issues
+            return MarketDataProvider.SECTOR_NOT_FOUND
+
+    """Public methods."""
+
+    def getYahooTicker(self, ticker):
+        """Return the ticker with the '.SA' suffix (yfinance format)."""
+        if ticker.endswith(MarketDataProvider.YAHOO_SUFFIX):
+            return ticker
+        return ticker + MarketDataProvider.YAHOO_SUFFIX
+
+    def getBaseTicker(self, ticker):
+        """Return the ticker without the '.SA' suffix."""
+        if ticker.endswith(MarketDataProvider.YAHOO_SUFFIX):
+            return ticker[: -len(MarketDataProvider.YAHOO_SUFFIX)]
+        return ticker
+
+    def getHistoryDataframe(self, ticker, start_date, end_date):
+        """Return the daily OHLC history of the ticker.
+
+        The dataframe is indexed by date, with the 'HISTORY_COLUMN_LIST'
+        columns. The 'end_date' is not included.
+        """
+        column_list = MarketDataProvider.HISTORY_COLUMN_LIST
+        yahoo_ticker = self.getYahooTicker(ticker)
+        dataframe = self._downloadHistory(yahoo_ticker, start_date, end_date)
+        if isinstance(dataframe.columns, pd.MultiIndex):
+            dataframe = dataframe.xs(yahoo_ticker, axis=1, level=-1)
+        dataframe = dataframe.reindex(columns=column_list).astype(float)
+        return dataframe.dropna(subset=["Close"])
+
+    def getSector(self, ticker):
+        """Return the sector of the ticker."""
+        return self.getSectorDict([ticker])[self.getBaseTicker(ticker)]
+
+    def getSectorDict(self, ticker_list):
+        """Return a dictionary with the sector of each ticker.
+
+        The keys are the tickers without the '.SA' suffix. The sectors not
+        found are not stored, then they are requested again next time.
+        """
+        base_list = list(dict.fromkeys(map(self.getBaseTicker, ticker_list)))
+        return self.sectorStore.getSectorDict(
+            base_list,
+            self.__fetchSectorDict,
+            not_found=MarketDataProvider.SECTOR_NOT_FOUND,
+        )
+
+    def warmupSectors(self, ticker_list):
+        """Request and store the sectors of the tickers not stored yet.
+
+        Return the amount of tickers stored (fresh) after the warmup.
+        """
+        sector_dict = self.getSectorDict(ticker_list)
+        return sum(
+            sector != MarketDataProvider.SECTOR_NOT_FOUND
+            for sector in sector_dict.values()
+        )
+
+    def getMarketDataframe(self, ticker_list, sector=True):
+        """Return a dataframe with the market data of the tickers.
+
+        The dataframe is indexed by the tickers (without the '.SA' suffix)
+        and has the following columns:
+        - Cotação: the last price ('Adj Close')
+        - Dividendos 12M: the dividends per share paid in the last 12 months
+        - Dividend-Yield: the 'Dividendos 12M' over the last 'Close' price
+        - Setor: the sector (only if 'sector=True')
+
+        The values not available are filled with 'VALUE_NOT_FOUND' (or
+        'SECTOR_NOT_FOUND').
+        """
+        base_list = list(dict.fromkeys(map(self.getBaseTicker, ticker_list)))
+        yahoo_list = [self.getYahooTicker(ticker) for ticker in base_list]
+        market_df = pd.DataFrame(index=pd.Index(base_list, name="Ticker"))
+        if not base_list:
+            market_df[MarketDataProvider.PRICE_COLUMN] = []
+            market_df[MarketDataProvider.DIVIDENDS_COLUMN] = []
+            market_df[MarketDataProvider.YIELD_COLUMN] = []
+            if sector:
+                market_df[MarketDataProvider.SECTOR_COLUMN] = []
+            return market_df
+
+        # Prices and dividends in a single request
+        dataframe = self._download(yahoo_list)
+        if not isinstance(dataframe.columns, pd.MultiIndex):
+            dataframe.columns = pd.MultiIndex.from_product(
+                [dataframe.columns, yahoo_list],
+            )
+        adj_close = self.__getColumnDataframe(dataframe, "Adj Close", yahoo_list)
+        close = self.__getColumnDataframe(dataframe, "Close", yahoo_list)
+        dividends = self.__getColumnDataframe(dataframe, "Dividends", yahoo_list)
+
+        prices = self.__getLastValues(adj_close).to_numpy()
+        last_close = self.__getLastValues(close).to_numpy()
+        dividends_sum = dividends.fillna(0.0).sum(axis=0).to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dividend_yield = dividends_sum / last_close
+
+        not_found = MarketDataProvider.VALUE_NOT_FOUND
+        market_df[MarketDataProvider.PRICE_COLUMN] = np.nan_to_num(
+            prices,
+            nan=not_found,
+        )
+        market_df[MarketDataProvider.DIVIDENDS_COLUMN] = dividends_sum
+        market_df[MarketDataProvider.YIELD_COLUMN] = np.nan_to_num(
+            dividend_yield,
+            nan=not_found,
+            posinf=not_found,
+        )
+
+        # Sectors from the local store (only the missing ones are requested)
+        if sector:
+            sector_dict = self.getSectorDict(base_list)
+            market_df[MarketDataProvider.SECTOR_COLUMN] = market_df.index.map(
+                sector_dict,
+            )
+        return market_df
@@ -0,0 +1,164 @@
+"""This file is used to test the 'market_data.py'."""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.market_data import MarketDataProvider
+from portfolio_lib.assets.sector_store import SectorStore, getSharedSectorStore
+
+
+class FixtureMarketDataProvider(MarketDataProvider):
+    """Market data provider with fixed (offline) data."""
+
+    SECTOR_DICT = {
+        "BBAS3.SA": "Financial Services",
+        "CPTS11.SA": "Real Estate",
+        "AAPL": "Technology",
+    }
+
+    def __init__(self, sectorStore):
+        """Create the FixtureMarketDataProvider object."""
+        super().__init__(sectorStore)
+        self.download_calls = []
+        self.sector_calls = []
+
+    def _download(self, yahoo_list):
+        """Return 3 days of prices, with dividends paid by 'BBAS3.SA'."""
+        self.download_calls.append(yahoo_list)
+        index = pd.date_range("2023-06-01", periods=3)
+        data = {
+            "BBAS3.SA": {
+                "Adj Close": [40.0, 41.0, 42.0],
+                "Close": [40.0, 41.0, 40.0],
+                "Dividends": [0.0, 2.0, 2.0],
+            },
+            "CPTS11.SA": {
+                "Adj Close": [8.0, 8.5, float("nan")],
+                "Close": [8.0, 8.5, float("nan")],
+                "Dividends": [0.0, 0.0, 0.0],
+            },
+        }
+        columns = {}
+        for field in ["Adj Close", "Close", "Dividends"]:
+            for ticker in yahoo_list:
+                if ticker in data:
+                    columns[(field, ticker)] = data[ticker][field]
+        dataframe = pd.DataFrame(columns, index=index)
+        dataframe.columns = pd.MultiIndex.from_tuples(dataframe.columns)
+        return dataframe
+
+    def _getSectorByYahooTicker(self, yahoo_ticker):
+        """Return the sector from the fixed dictionary."""
+        self.sector_calls.append(yahoo_ticker)
+        return FixtureMarketDataProvider.SECTOR_DICT.get(
+            yahoo_ticker,
+            MarketDataProvider.SECTOR_NOT_FOUND,
+        )
+
+
+def getSectorStore(tmp_path):
+    """Return a SectorStore object in the temporary folder."""
+    return SectorStore(os.path.join(tmp_path, "sector_store.json"))
+
+
+class Test_MarketDataProvider:
+    """Tests for 'MarketDataProvider' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - ticker, yahoo ticker, base ticker
+    test_getYahooTicker_list = [
+        ("BBAS3", "BBAS3.SA", "BBAS3"),
+        ("BBAS3.SA", "BBAS3.SA", "BBAS3"),
+        ("CPTS11", "CPTS11.SA", "CPTS11"),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - ticker, price, dividends, dividend yield, sector
+    test_getMarketDataframe_list = [
+        ("BBAS3", 42.0, 4.0, 0.1, "Financial Services"),
+        ("CPTS11", 8.5, 0.0, 0.0, "Real Estate"),
+        ("XXXX3", 0.0, 0.0, 0.0, "Sector not found"),
+    ]
+
+    def test_shared_sector_store(self):
+        """Test the providers share a single 'SectorStore' by default."""
+        assert MarketDataProvider().sectorStore is MarketDataProvider().sectorStore
+        assert MarketDataProvider().sectorStore is getSharedSectorStore()
+
+    @pytest.mark.parametrize("ticker, yahoo, base", test_getYahooTicker_list)
+    def test_getYahooTicker(self, ticker, yahoo, base):
+        """Test the 'getYahooTicker' and 'getBaseTicker' methods."""
+        provider = MarketDataProvider(SectorStore(file_path=""))
+        assert provider.getYahooTicker(ticker) == yahoo
+        assert provider.getBaseTicker(ticker) == base
+
+    @pytest.mark.parametrize(
+        "ticker, price, dividends, dividend_yield, sector",
+        test_getMarketDataframe_list,
+    )
+    def test_getMarketDataframe(
+        self, tmp_path, ticker, price, dividends, dividend_yield, sector
+    ):
+        """Test the 'getMarketDataframe' method."""
+        provider = FixtureMarketDataProvider(getSectorStore(tmp_path))
+        ticker_list = ["BBAS3", "CPTS11.SA", "XXXX3", "BBAS3"]
+        market_df = provider.getMarketDataframe(ticker_list)
+        assert market_df.index.tolist() == ["BBAS3", "CPTS11", "XXXX3"]
+        assert market_df.at[ticker, "Cotação"] == pytest.approx(price)
+        assert market_df.at[ticker, "Dividendos 12M"] == pytest.approx(dividends)
+        assert market_df.at[ticker, "Dividend-Yield"] == pytest.approx(dividend_yield)
+        assert market_df.at[ticker, "Setor"] == sector
+        assert provider.download_calls == [["BBAS3.SA", "CPTS11.SA", "XXXX3.SA"]]
+
+    def test_getMarketDataframe_empty(self, tmp_path):
+        """Test the 'getMarketDataframe' method with an empty list."""
+        provider = FixtureMarketDataProvider(getSectorStore(tmp_path))
+        market_df = provider.getMarketDataframe([])
+        assert market_df.empty
+        assert "Cotação" in market_df.columns
+        assert provider.download_calls == []
+
+    def test_getSector(self, tmp_path):
+        """Test the 'getSector' method stores the sectors."""
+        provider = FixtureMarketDataProvider(getSectorStore(tmp_path))
+        assert provider.getSector("BBAS3") == "Financial Services"
+        assert provider.getSector("BBAS3.SA") == "Financial Services"
+        assert provider.getSectorDict(["BBAS3", "CPTS11"]) == {
+            "BBAS3": "Financial Services",
+            "CPTS11": "Real Estate",
+        }
+        assert sorted(provider.sector_calls) == [
+            "BBAS3",
+            "BBAS3.SA",
+            "CPTS11",
+            "CPTS11.SA",
+        ]
+
+    def test_getSector_lookup_order(self, tmp_path):
+        """Test the raw ticker is looked up before the '.SA' one."""
+        provider = FixtureMarketDataProvider(getSectorStore(tmp_path))
+        assert provider.getSector("AAPL") == "Technology"
+        assert provider.getSector("XXXX3") == "Sector not found"
+        assert provider.sector_calls == ["AAPL", "XXXX3", "XXXX3.SA"]
+
+    def test_warmupSectors(self, tmp_path):
+        """Test the sectors are persisted between objects."""
+        provider = FixtureMarketDataProvider(getSectorStore(tmp_path))
+        assert provider.warmupSectors(["BBAS3", "CPTS11", "XXXX3"]) == 2
+        assert len(provider.sector_calls) == 6
+
+        # Only the sector not found is requested again
+        new_provider = FixtureMarketDataProvider(getSectorStore(tmp_path))
+        sector_dict = new_provider.getSectorDict(["BBAS3.SA", "CPTS11", "XXXX3"])
+        assert sector_dict == {
+            "BBAS3": "Financial Services",
+            "CPTS11": "Real Estate",
+            "XXXX3": "Sector not found",
+        }
+        assert new_provider.sector_calls == ["XXXX3", "XXXX3.SA"]
@@ -3,7 +3,9 @@
 from datetime import datetime
 
 import pandas as pd
+from indexer_lib.income_tax import RegressiveIncomeTax
 from indexer_lib.months_indexers import TwelveMonthsIndexer
+from indexer_lib.real_return import RealReturnCalculation
 from portfolio_lib.portfolio_history import OperationsHistory
 
 
@@ -16,11 +18,17 @@ class PortfolioAssets:
     behaviors and necessities.
     """
 
+    # The wallets with the 'Cotação líquida' column (see
+    # 'calculateNetOfTaxColumn')
+    NET_OF_TAX = False
+
     def __init__(self):
         """Create the PortfolioAssets object."""
         self.wallet = self._getAssetsDefaultDataframe()
         self.openedOperations = self._getAssetsDefaultDataframe()
         self.indexers = TwelveMonthsIndexer()
+        self.realReturn = None
+        self.incomeTax = RegressiveIncomeTax()
         self.history = None
 
     """Private methods."""
@@ -161,8 +169,11 @@ class PortfolioAssets:
             "Mercado-pago(%)",
             "Líquido parcial",
             "Líquido parcial(%)",
+            "Líquido parcial real(%)",
             "Porcentagem carteira",
         ]
+        if self.NET_OF_TAX:
+            col_list.insert(col_list.index("Cotação") + 1, "Cotação líquida")
         return pd.DataFrame(columns=col_list)
 
     def _getDefaultDataframe(self):
@@ -225,6 +236,22 @@ class PortfolioAssets:
                 msg += ", ".join(exp_market_list)
                 raise ValueError(msg)
 
+    def _getQuoteAgeList(self, quoteCache, field_list):
+        """Return the age (minutes) of the cached quotes of each wallet row.
+
+        The age of a row is the oldest one of its 'field_list' quotes. The
+        rows without cached quotes return None.
+        """
+        wallet = self.wallet
+        if "Ticker" not in wallet or not len(wallet):
+            return []
+        age_list = []
+        for ticker, market in zip(wallet["Ticker"], wallet["Mercado"]):
+            row_list = [quoteCache.getAge(ticker, market, f) for f in field_list]
+            row_list = [age for age in row_list if age is not None]
+            age_list.append(max(row_list) / 60 if row_list else None)
+        return age_list
+
     """Public methods."""
 
     def getAdjustedYield(self, yield_val, adjust_type):
@@ -253,6 +280,19 @@ class PortfolioAssets:
         """Return a list of expected column titles."""
         return list(self.wallet)
 
+    def getMissingQuotesList(self):
+        """Return the list of wallet tickers without the 'Cotação' value.
+
+        The quotes not collected (network errors, timeouts or the time
+        budget over) are kept as zero in the wallet, then they are flagged
+        by this method.
+        """
+        wallet = self.wallet
+        if "Cotação" not in wallet or not len(wallet):
+            return []
+        missing = wallet["Cotação"].fillna(0.0) == 0.0
+        return wallet.loc[missing, "Ticker"].tolist()
+
     def setOpenedOperations(self, openedOperations):
         """Set the opened operations."""
         self._checkDataframeType(openedOperations)
@@ -325,7 +365,32 @@ class PortfolioAssets:
         netResult = totalPriceAdjusted - totalBuy
         self.wallet["Líquido parcial"] = netResult
         self.wallet["Líquido parcial(%)"] = netResult / buyPrice
+        # The IPCA series is loaded only when the first wallet is calculated
+        if self.realReturn is None:
+            self.realReturn = RealReturnCalculation()
+        self.realReturn.addRealReturnColumn(
+            self.wallet,
+            "Líquido parcial(%)",
+            "Líquido parcial real(%)",
+        )
 
         # Calculate the ticker percentage per market
         for mkt in market_list:
             self.__setTickerPercentage(mkt)
+
+    def calculateNetOfTaxColumn(self):
+        """Calculate the 'Cotação líquida' column.
+
+        The 'Cotação' is discounted by the regressive income tax (IR) related
+        to the estimated gains per unit, according to the holding period.
+        The column is present only in the wallets with 'NET_OF_TAX' True.
+        """
+        holding_days = self.incomeTax.getHoldingDaysArray(
+            self.wallet["Data Inicial"],
+            self.wallet["Data Final"],
+        )
+        self.wallet["Cotação líquida"] = self.incomeTax.getNetPriceArray(
+            self.wallet["Preço médio"],
+            self.wallet["Cotação"],
+            holding_days,
+        )
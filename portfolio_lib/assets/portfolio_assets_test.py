@@ -100,6 +100,7 @@ class Test_PortfolioAssets_getColumnsTitleList:
             "Mercado-pago(%)",
             "Líquido parcial",
             "Líquido parcial(%)",
+            "Líquido parcial real(%)",
             "Porcentagem carteira",
         ]
         assets = PortfolioAssets()
@@ -153,6 +154,7 @@ class Test_PortfolioAssets_createWalletDefaultColumns:
             "Mercado-pago(%)",
             "Líquido parcial",
             "Líquido parcial(%)",
+            "Líquido parcial real(%)",
             "Porcentagem carteira",
         ]
         assets = PortfolioAssets()
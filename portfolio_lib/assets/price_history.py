@@ -0,0 +1,283 @@
+"""This file has a local store of the price history of Variable Income."""
+
+import json
+import os
+import threading
+
+import numpy as np
+
+from portfolio_lib.assets.market_data import MarketDataProvider
+
+
+class PriceHistoryStore:
+    """Class used to keep the daily OHLC history of the tickers locally.
+
+    Each ticker has a folder with one binary file per column (columnar),
+    where the new days are appended to the end of the files. Also, a small
+    JSON file keeps the period of the stored days. Then, only the missing
+    date ranges are downloaded: usually, just the days after the last
+    update. The empty downloads (network errors, holidays) are not
+    recorded, so they are requested again next time.
+
+    The last stored day is always requested again: it may be a partial
+    bar, and its 'Adj Close' changes after a dividend. In this case, the
+    whole stored 'Adj Close' column is rescaled, then all the rows share
+    the same adjustment.
+
+    The reads return NumPy arrays, found by binary search over the sorted
+    dates, so returns, risk and timeline calculations run locally.
+
+    Arguments:
+    - marketData: the 'MarketDataProvider' used to download the history
+    - folder_path: the local folder of the store
+    """
+
+    FOLDER_PATH = os.path.join(
+        os.path.curdir,
+        "portfolio_lib",
+        "assets",
+        "temp",
+        "price_history",
+    )
+
+    DATE_COLUMN = "Date"
+    ADJUSTED_COLUMN = "Adj Close"
+    COLUMN_LIST = MarketDataProvider.HISTORY_COLUMN_LIST
+    META_FILE = "meta.json"
+
+    def __init__(self, marketData=None, folder_path=None):
+        """Create the PriceHistoryStore object."""
+        if marketData is None:
+            marketData = MarketDataProvider()
+        if folder_path is None:
+            folder_path = PriceHistoryStore.FOLDER_PATH
+        self.marketData = marketData
+        self.folder_path = folder_path
+        self.__lock = threading.Lock()
+
+    """Private methods."""
+
+    def __getTickerFolder(self, ticker):
+        return os.path.join(self.folder_path, self.marketData.getBaseTicker(ticker))
+
+    def __getColumnPath(self, ticker, column):
+        file_name = column.replace(" ", "_") + ".bin"
+        return os.path.join(self.__getTickerFolder(ticker), file_name)
+
+    def __getDtype(self, column):
+        if column == PriceHistoryStore.DATE_COLUMN:
+            return np.int64
+        return np.float64
+
+    def __readMeta(self, ticker):
+        meta_path = os.path.join(
+            self.__getTickerFolder(ticker),
+            PriceHistoryStore.META_FILE,
+        )
+        try:
+            with open(meta_path, encoding="utf-8") as json_file:
+                meta = json.load(json_file)
+        except (OSError, ValueError):
+            return None
+        return (
+            np.datetime64(meta["first_date"], "D"),
+            np.datetime64(meta["last_date"], "D"),
+        )
+
+    def __writeMeta(self, ticker):
+        # The period is the one of the stored rows (not the requested one)
+        dates = self.__readColumn(ticker, PriceHistoryStore.DATE_COLUMN)
+        if not len(dates):
+            return
+        meta_path = os.path.join(
+            self.__getTickerFolder(ticker),
+            PriceHistoryStore.META_FILE,
+        )
+        first_date, last_date = dates[[0, -1]].astype("datetime64[D]")
+        with open(meta_path, "w", encoding="utf-8") as json_file:
+            json.dump(
+                {"first_date": str(first_date), "last_date": str(last_date)},
+                json_file,
+            )
+
+    def __readColumn(self, ticker, column):
+        path = self.__getColumnPath(ticker, column)
+        if not os.path.isfile(path):
+            return np.array([], dtype=self.__getDtype(column))
+        return np.fromfile(path, dtype=self.__getDtype(column))
+
+    def __getColumnDict(self, dataframe):
+        days = dataframe.index.values.astype("datetime64[D]")
+        column_dict = {PriceHistoryStore.DATE_COLUMN: days.astype(np.int64)}
+        for column in PriceHistoryStore.COLUMN_LIST:
+            column_dict[column] = dataframe[column].to_numpy(dtype=np.float64)
+        return column_dict
+
+    def __filterRows(self, column_dict, mask):
+        return {column: values[mask] for column, values in column_dict.items()}
+
+    def __writeColumns(self, ticker, column_dict, mode):
+        # mode: 'ab' to append the rows, 'wb' to rewrite the files
+        for column, values in column_dict.items():
+            with open(self.__getColumnPath(ticker, column), mode) as bin_file:
+                values.astype(self.__getDtype(column)).tofile(bin_file)
+
+    def __truncateColumns(self, ticker, rows):
+        # Keep only the first 'rows' rows of the files
+        for column in [PriceHistoryStore.DATE_COLUMN] + PriceHistoryStore.COLUMN_LIST:
+            itemsize = np.dtype(self.__getDtype(column)).itemsize
+            with open(self.__getColumnPath(ticker, column), "r+b") as bin_file:
+                bin_file.truncate(rows * itemsize)
+
+    def __getAdjustFactor(self, stored_value, new_value):
+        # Ratio between two 'Adj Close' values of the same day
+        if not (np.isfinite(stored_value) and np.isfinite(new_value)):
+            return 1.0
+        if stored_value <= 0 or new_value <= 0:
+            return 1.0
+        return new_value / stored_value
+
+    def __download(self, ticker, first_date, last_date):
+        # Both dates are included
+        return self.marketData.getHistoryDataframe(
+            ticker,
+            str(first_date),
+            str(last_date + 1),
+        )
+
+    def __prependRows(self, ticker, start, first_date):
+        # Download the days before the stored ones (the first stored day is
+        # requested again, in order to align the 'Adj Close' values)
+        new_dict = self.__getColumnDict(self.__download(ticker, start, first_date))
+        first_day = first_date.astype(np.int64)
+        dates = new_dict[PriceHistoryStore.DATE_COLUMN]
+        column_dict = {column: self.__readColumn(ticker, column) for column in new_dict}
+        adjusted = new_dict[PriceHistoryStore.ADJUSTED_COLUMN]
+        if np.any(dates == first_day):
+            adjusted *= self.__getAdjustFactor(
+                adjusted[dates == first_day][0],
+                column_dict[PriceHistoryStore.ADJUSTED_COLUMN][0],
+            )
+        new_dict = self.__filterRows(new_dict, dates < first_day)
+        if not len(new_dict[PriceHistoryStore.DATE_COLUMN]):
+            return 0
+        column_dict = {
+            column: np.concatenate((new_dict[column], column_dict[column]))
+            for column in new_dict
+        }
+        self.__writeColumns(ticker, column_dict, "wb")
+        return len(new_dict[PriceHistoryStore.DATE_COLUMN])
+
+    def __appendRows(self, ticker, last_date, end):
+        # Download the days after the stored ones. The last stored day is
+        # requested again: it may be a partial bar (today), and its 'Adj
+        # Close' changes after a dividend. Then, the stored 'Adj Close'
+        # values are rescaled, keeping a single adjustment basis.
+        new_dict = self.__getColumnDict(self.__download(ticker, last_date, end))
+        last_day = last_date.astype(np.int64)
+        dates = new_dict[PriceHistoryStore.DATE_COLUMN]
+        if np.any(dates == last_day):
+            adjusted = self.__readColumn(ticker, PriceHistoryStore.ADJUSTED_COLUMN)
+            factor = self.__getAdjustFactor(
+                adjusted[-1],
+                new_dict[PriceHistoryStore.ADJUSTED_COLUMN][dates == last_day][0],
+            )
+            if not np.isclose(factor, 1.0):
+                self.__writeColumns(
+                    ticker,
+                    {PriceHistoryStore.ADJUSTED_COLUMN: adjusted * factor},
+                    "wb",
+                )
+            self.__truncateColumns(ticker, len(adjusted) - 1)
+        new_dict = self.__filterRows(new_dict, dates >= last_day)
+        self.__writeColumns(ticker, new_dict, "ab")
+        return int(np.sum(new_dict[PriceHistoryStore.DATE_COLUMN] > last_day))
+
+    """Public methods."""
+
+    def update(self, ticker, start_date, end_date=None):
+        """Download the missing history of the ticker, between the dates.
+
+        Only the days before and after the stored ones are downloaded,
+        where the last stored day is always requested again. The
+        'end_date' is included (default: today).
+
+        Return the amount of new rows.
+        """
+        start = np.datetime64(start_date, "D")
+        today = np.datetime64("today", "D")
+        end = today if end_date is None else np.datetime64(end_date, "D")
+        end = min(end, today)
+        if end < start:
+            return 0
+
+        with self.__lock:
+            meta = self.__readMeta(ticker)
+            if meta is None:
+                dataframe = self.__download(ticker, start, end)
+                if dataframe.empty:
+                    return 0
+                os.makedirs(self.__getTickerFolder(ticker), exist_ok=True)
+                self.__writeColumns(ticker, self.__getColumnDict(dataframe), "wb")
+                self.__writeMeta(ticker)
+                return len(dataframe)
+
+            first_date, last_date = meta
+            rows = 0
+            if end >= last_date:
+                rows += self.__appendRows(ticker, last_date, end)
+            if start < first_date:
+                rows += self.__prependRows(ticker, start, first_date)
+            self.__writeMeta(ticker)
+            return rows
+
+    def updateTickerList(self, ticker_list, start_date, end_date=None):
+        """Update the history of several tickers.
+
+        Return a dictionary 'ticker -> amount of new rows'.
+        """
+        return {
+            ticker: self.update(ticker, start_date, end_date) for ticker in ticker_list
+        }
+
+    def getPeriod(self, ticker):
+        """Return the '(first_date, last_date)' of the stored days.
+
+        Return None if the ticker is not stored.
+        """
+        return self.__readMeta(ticker)
+
+    def getRangeDict(self, ticker, start_date=None, end_date=None):
+        """Return a dictionary 'column -> array' of the stored history.
+
+        The 'Date' column is a 'datetime64[D]' array. Both dates are
+        included (default: the whole history).
+        """
+        dates = self.__readColumn(ticker, PriceHistoryStore.DATE_COLUMN)
+        first = 0
+        last = len(dates)
+        if start_date is not None:
+            start = np.datetime64(start_date, "D").astype(np.int64)
+            first = np.searchsorted(dates, start, side="left")
+        if end_date is not None:
+            end = np.datetime64(end_date, "D").astype(np.int64)
+            last = np.searchsorted(dates, end, side="right")
+        range_dict = {
+            PriceHistoryStore.DATE_COLUMN: dates[first:last].astype("datetime64[D]")
+        }
+        for column in PriceHistoryStore.COLUMN_LIST:
+            values = self.__readColumn(ticker, column)
+            range_dict[column] = values[first:last]
+        return range_dict
+
+    def getRange(self, ticker, start_date=None, end_date=None, column="Adj Close"):
+        """Return the '(dates, values)' arrays of a single column."""
+        range_dict = self.getRangeDict(ticker, start_date, end_date)
+        return range_dict[PriceHistoryStore.DATE_COLUMN], range_dict[column]
+
+    def getReturnArray(self, ticker, start_date=None, end_date=None):
+        """Return the array of daily returns, based on the 'Adj Close'."""
+        dates, prices = self.getRange(ticker, start_date, end_date)
+        if len(prices) < 2:
+            return np.array([])
+        return prices[1:] / prices[:-1] - 1
@@ -0,0 +1,151 @@
+"""This file is used to test the 'price_history.py'."""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.market_data import MarketDataProvider
+from portfolio_lib.assets.price_history import PriceHistoryStore
+from portfolio_lib.assets.sector_store import SectorStore
+
+
+class FixtureHistoryProvider(MarketDataProvider):
+    """Market data provider with a fixed (offline) daily history.
+
+    The 'Adj Close' is the 'Close' times the 'adjust_factor'. If 'offline'
+    is True, the downloads return an empty dataframe.
+    """
+
+    def __init__(self, sectorStore):
+        """Create the FixtureHistoryProvider object."""
+        super().__init__(sectorStore)
+        self.history_calls = []
+        self.adjust_factor = 1.0
+        self.offline = False
+
+    def _downloadHistory(self, yahoo_ticker, start_date, end_date):
+        """Return the business days of June 2023, where 'Close' is the day."""
+        self.history_calls.append((yahoo_ticker, start_date, end_date))
+        index = pd.bdate_range("2023-06-01", "2023-06-30")
+        index = index[(index >= start_date) & (index < end_date)]
+        if self.offline:
+            index = index[:0]
+        days = index.day.to_numpy(dtype=float)
+        columns = pd.MultiIndex.from_product(
+            [MarketDataProvider.HISTORY_COLUMN_LIST, [yahoo_ticker]],
+        )
+        adjusted = days * self.adjust_factor
+        data = np.column_stack([days, days + 1, days - 1, days, adjusted, days * 100])
+        return pd.DataFrame(data, index=index, columns=columns)
+
+
+class Test_PriceHistoryStore:
+    """Tests for 'PriceHistoryStore' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - start_date, end_date, expected 'Close' values
+    test_getRange_list = [
+        ("2023-06-01", "2023-06-02", [1.0, 2.0]),
+        ("2023-06-03", "2023-06-06", [5.0, 6.0]),
+        ("2023-06-29", None, [29.0, 30.0]),
+        ("2023-07-01", "2023-07-31", []),
+    ]
+
+    def getStore(self, tmp_path):
+        """Return the PriceHistoryStore object under testing."""
+        sectorStore = SectorStore(os.path.join(tmp_path, "sectors.json"))
+        provider = FixtureHistoryProvider(sectorStore)
+        return PriceHistoryStore(provider, os.path.join(tmp_path, "history"))
+
+    @pytest.mark.parametrize("start_date, end_date, close_list", test_getRange_list)
+    def test_getRange(self, tmp_path, start_date, end_date, close_list):
+        """Test the 'getRange' method."""
+        store = self.getStore(tmp_path)
+        store.update("BBAS3", "2023-06-01", "2023-06-30")
+        dates, values = store.getRange("BBAS3.SA", start_date, end_date, "Close")
+        assert values.tolist() == close_list
+        assert dates.dtype == np.dtype("datetime64[D]")
+
+    def test_update_missingRanges(self, tmp_path):
+        """Test that only the missing date ranges are downloaded."""
+        store = self.getStore(tmp_path)
+        calls = store.marketData.history_calls
+        assert store.update("BBAS3", "2023-06-12", "2023-06-16") == 5
+
+        # Only the last stored day is requested again
+        assert store.update("BBAS3", "2023-06-12", "2023-06-16") == 0
+        assert calls[1:] == [("BBAS3.SA", "2023-06-16", "2023-06-17")]
+
+        # Appended (after) and rewritten (before)
+        assert store.update("BBAS3", "2023-06-12", "2023-06-23") == 5
+        assert store.update("BBAS3", "2023-06-01", "2023-06-23") == 7
+        assert calls[2:] == [
+            ("BBAS3.SA", "2023-06-16", "2023-06-24"),
+            ("BBAS3.SA", "2023-06-23", "2023-06-24"),
+            ("BBAS3.SA", "2023-06-01", "2023-06-13"),
+        ]
+        dates, values = store.getRange("BBAS3", column="Close")
+        assert np.all(np.diff(dates.astype(np.int64)) > 0)
+        assert values[0] == 1.0 and values[-1] == 23.0
+        assert store.getPeriod("BBAS3") == (
+            np.datetime64("2023-06-01"),
+            np.datetime64("2023-06-23"),
+        )
+
+    def test_persistence(self, tmp_path):
+        """Test that a new object reads the stored history."""
+        self.getStore(tmp_path).update("BBAS3", "2023-06-01", "2023-06-30")
+        store = self.getStore(tmp_path)
+        assert store.update("BBAS3", "2023-06-01", "2023-06-30") == 0
+        assert store.marketData.history_calls == [
+            ("BBAS3.SA", "2023-06-30", "2023-07-01"),
+        ]
+        range_dict = store.getRangeDict("BBAS3", "2023-06-05", "2023-06-05")
+        assert range_dict["Volume"].tolist() == [500.0]
+        assert range_dict["High"].tolist() == [6.0]
+
+    def test_update_empty(self, tmp_path):
+        """Test that the empty downloads are not recorded."""
+        store = self.getStore(tmp_path)
+        store.marketData.offline = True
+        assert store.update("BBAS3", "2023-06-01", "2023-06-30") == 0
+        assert store.getPeriod("BBAS3") is None
+
+        # Weekend and holiday: only the stored days are recorded
+        store.marketData.offline = False
+        assert store.update("BBAS3", "2023-05-27", "2023-06-04") == 2
+        assert store.getPeriod("BBAS3") == (
+            np.datetime64("2023-06-01"),
+            np.datetime64("2023-06-02"),
+        )
+        store.marketData.offline = True
+        assert store.update("BBAS3", "2023-06-01", "2023-06-30") == 0
+        store.marketData.offline = False
+        assert store.update("BBAS3", "2023-06-01", "2023-06-30") == 20
+
+    def test_update_adjusted(self, tmp_path):
+        """Test the stored 'Adj Close' is rescaled after a dividend."""
+        store = self.getStore(tmp_path)
+        store.update("BBAS3", "2023-06-12", "2023-06-16")
+        store.marketData.adjust_factor = 0.5
+        store.update("BBAS3", "2023-06-12", "2023-06-23")
+        store.update("BBAS3", "2023-06-01", "2023-06-23")
+        dates, values = store.getRange("BBAS3")
+        days = dates.astype(object)
+        assert values.tolist() == [day.day * 0.5 for day in days]
+        returns = store.getReturnArray("BBAS3", "2023-06-15", "2023-06-19")
+        assert returns.tolist() == pytest.approx([16 / 15 - 1, 19 / 16 - 1])
+
+    def test_getReturnArray(self, tmp_path):
+        """Test the 'getReturnArray' method."""
+        store = self.getStore(tmp_path)
+        store.update("BBAS3", "2023-06-01", "2023-06-30")
+        returns = store.getReturnArray("BBAS3", "2023-06-01", "2023-06-02")
+        assert returns.tolist() == pytest.approx([1.0])
+        assert store.getReturnArray("PETR4").tolist() == []
@@ -0,0 +1,311 @@
+"""This file has the sources of quotes used by the portfolio assets."""
+
+import abc
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+import requests
+from network_lib.html_parser import HtmlParser
+from network_lib.http_session import getSharedSession
+
+from portfolio_lib.assets.market_data import MarketDataProvider
+from portfolio_lib.assets.treasury_classifier import TreasuryTitleClassifier
+from portfolio_lib.assets.treasury_prices import TreasuryPriceProvider
+from portfolio_lib.multi_processing import ThreadPoolTasks
+
+
+class QuoteProvider(abc.ABC):
+    """Interface of the quote sources used by the portfolio assets.
+
+    A quote provider returns, for a whole list of tickers at once:
+    - the market data of Variable Income (price, dividends, sector)
+    - the prices of Treasuries
+
+    Then, the assets do not depend on the source (web, local files...).
+    The other inputs of the portfolio refresh are local: the 12 months
+    indexers come from the local series (see 'TwelveMonthsIndexer', whose
+    website fallback is disabled by default). The Status Invest pages of
+    the valuation window ('HtmlCacheManager') are not covered.
+    """
+
+    VALUE_NOT_FOUND = MarketDataProvider.VALUE_NOT_FOUND
+    SECTOR_NOT_FOUND = MarketDataProvider.SECTOR_NOT_FOUND
+
+    """Protected methods."""
+
+    def _getBaseTicker(self, ticker):
+        """Return the ticker without the '.SA' suffix (yfinance format)."""
+        suffix = MarketDataProvider.YAHOO_SUFFIX
+        if ticker.endswith(suffix):
+            return ticker[: -len(suffix)]
+        return ticker
+
+    """Public methods."""
+
+    @abc.abstractmethod
+    def getMarketDataframe(self, ticker_list, sector=True):
+        """Return a dataframe with the market data of the tickers.
+
+        The same format of the 'MarketDataProvider.getMarketDataframe'.
+        """
+
+    @abc.abstractmethod
+    def getSectorDict(self, ticker_list):
+        """Return a dictionary with the sector of each ticker."""
+
+    def getSector(self, ticker):
+        """Return the sector of the ticker."""
+        sector_dict = self.getSectorDict([ticker])
+        return sector_dict.get(
+            self._getBaseTicker(ticker),
+            QuoteProvider.SECTOR_NOT_FOUND,
+        )
+
+    @abc.abstractmethod
+    def getTreasuryPriceDict(self, ticker_list):
+        """Return a dictionary with the last price of each Treasury ticker.
+
+        The tickers not available are not present in the dictionary.
+        """
+
+    def getTreasuryPrice(self, ticker):
+        """Return the last price of the Treasury ticker."""
+        return self.getTreasuryPriceDict([ticker]).get(
+            ticker,
+            QuoteProvider.VALUE_NOT_FOUND,
+        )
+
+
+class WebQuoteProvider(QuoteProvider):
+    """Quote provider related to the web sources.
+
+    - Variable Income: the yfinance library ('MarketDataProvider')
+    - Treasuries: the public CSV file of the Tesouro Nacional (bulk), where
+      the titles not found there are collected from the Status Invest
+      website (if 'scraping' is enabled).
+
+    Arguments:
+    - marketData: the 'MarketDataProvider' object
+    - treasuryPrices: the 'TreasuryPriceProvider' object
+    - scraping: if False, the Status Invest website is not requested
+    """
+
+    def __init__(self, marketData=None, treasuryPrices=None, scraping=True):
+        """Create the WebQuoteProvider object."""
+        if marketData is None:
+            marketData = MarketDataProvider()
+        if treasuryPrices is None:
+            treasuryPrices = TreasuryPriceProvider()
+        self.marketData = marketData
+        self.treasuryPrices = treasuryPrices
+        self.scraping = scraping
+        self.classifier = TreasuryTitleClassifier()
+        self.treasuryParser = HtmlParser()
+
+    """Private methods."""
+
+    def __getTitleKey(self, ticker):
+        title = self.classifier.classify(ticker)
+        if title:
+            return title.kind, title.maturity_year
+        return None
+
+    """Public methods."""
+
+    def getMarketDataframe(self, ticker_list, sector=True):
+        """Return a dataframe with the market data of the tickers."""
+        return self.marketData.getMarketDataframe(ticker_list, sector)
+
+    def getSectorDict(self, ticker_list):
+        """Return a dictionary with the sector of each ticker."""
+        return self.marketData.getSectorDict(ticker_list)
+
+    def getSector(self, ticker):
+        """Return the sector of the ticker."""
+        return self.marketData.getSector(ticker)
+
+    def getTreasuryPriceDict(self, ticker_list):
+        """Return a dictionary with the last price of each Treasury ticker.
+
+        The bulk CSV file is refreshed once. Only the tickers missing there
+        are collected (concurrently) from the Status Invest website.
+        """
+        self.treasuryPrices.refresh()
+        prices_dict = {}
+        missing_ticker_list = []
+        for ticker in dict.fromkeys(ticker_list):
+            title_key = self.__getTitleKey(ticker)
+            if title_key and self.treasuryPrices.hasPrice(*title_key):
+                prices_dict[ticker] = self.treasuryPrices.getPrice(*title_key)
+            else:
+                missing_ticker_list.append(ticker)
+        if missing_ticker_list and self.scraping:
+            price_list = ThreadPoolTasks().runPool(
+                self.getTreasuryPrice,
+                missing_ticker_list,
+            )
+            prices_dict.update(zip(missing_ticker_list, price_list))
+        return prices_dict
+
+    def getTreasuryPrice(self, ticker):
+        """Return the last price of the Treasury from website Status Invest."""
+        url = self.classifier.getURL(ticker)
+        if not url:
+            return WebQuoteProvider.VALUE_NOT_FOUND
+
+        try:
+            # Get information from URL
+            page = getSharedSession().get(url)
+            soup = self.treasuryParser.parse(page.content)
+
+            # Get the current value from ticker
+            value = soup.find(class_="value").get_text()
+
+            # Replace the point to empty in order to transform
+            # the string in a number.
+            value = value.replace(".", "")
+
+            # Replace comma to point because Python uses point
+            # as decimal spacer.
+            value = value.replace(",", ".")
+            return float(value)
+
+        except ValueError:
+            return WebQuoteProvider.VALUE_NOT_FOUND
+
+        except AttributeError:
+            return WebQuoteProvider.VALUE_NOT_FOUND
+
+        except requests.RequestException:
+            return WebQuoteProvider.VALUE_NOT_FOUND
+
+
+class OfflineQuoteProvider(QuoteProvider):
+    """Deterministic quote provider, based on a local JSON file.
+
+    It is useful to run (and to measure) the portfolio refresh without the
+    internet (see 'QuoteProvider'). The file has the following format:
+    {
+        "Renda Variável": {
+            "BBAS3": {"Cotação": 42.0, "Dividend-Yield": 0.09, "Setor": ...}
+        },
+        "Tesouro Direto": {"SELIC 2027": 13115.47}
+    }
+
+    Each public call simulates a single (batched) network request, waiting
+    for 'latency' seconds. The amount of requests and tickers are counted.
+
+    The Treasury tickers are matched by their '(kind, maturity_year)', then
+    'LFT 010327' finds the price of 'SELIC 2027'.
+
+    Arguments:
+    - file_path: the JSON file (default: the fixture of the assets tests)
+    - latency: the delay (seconds) of each simulated request
+    """
+
+    FILE_PATH = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "fixtures",
+        "quotes.json",
+    )
+
+    VARIABLE_INCOME_KEY = "Renda Variável"
+    TREASURIES_KEY = "Tesouro Direto"
+
+    def __init__(self, file_path=None, latency=0.0):
+        """Create the OfflineQuoteProvider object."""
+        if file_path is None:
+            file_path = OfflineQuoteProvider.FILE_PATH
+        self.file_path = file_path
+        self.latency = latency
+        self.classifier = TreasuryTitleClassifier()
+        self.__lock = threading.Lock()
+        self.__requests = 0
+        self.__tickers = 0
+        with open(file_path, encoding="utf-8") as json_file:
+            data = json.load(json_file)
+        self.__quote_dict = data.get(OfflineQuoteProvider.VARIABLE_INCOME_KEY, {})
+        self.__treasury_dict = {}
+        for ticker, price in data.get(OfflineQuoteProvider.TREASURIES_KEY, {}).items():
+            self.__treasury_dict[self.__getTitleKey(ticker)] = float(price)
+
+    """Private methods."""
+
+    def __getTitleKey(self, ticker):
+        title = self.classifier.classify(ticker)
+        if title:
+            return title.kind, title.maturity_year
+        return ticker
+
+    def __request(self, ticker_list):
+        # Simulate a single network request
+        with self.__lock:
+            self.__requests += 1
+            self.__tickers += len(ticker_list)
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    """Public methods."""
+
+    def getMarketDataframe(self, ticker_list, sector=True):
+        """Return a dataframe with the market data of the tickers.
+
+        The tickers not present in the file are 'VALUE_NOT_FOUND' (or
+        'SECTOR_NOT_FOUND').
+        """
+        marketData = MarketDataProvider
+        base_list = list(dict.fromkeys(map(self._getBaseTicker, ticker_list)))
+        self.__request(base_list)
+        not_found = OfflineQuoteProvider.VALUE_NOT_FOUND
+        column_list = [
+            marketData.PRICE_COLUMN,
+            marketData.DIVIDENDS_COLUMN,
+            marketData.YIELD_COLUMN,
+        ]
+        data = {column: [] for column in column_list}
+        for ticker in base_list:
+            quote = self.__quote_dict.get(ticker, {})
+            price = float(quote.get(marketData.PRICE_COLUMN, not_found))
+            dividend_yield = float(quote.get(marketData.YIELD_COLUMN, not_found))
+            data[marketData.PRICE_COLUMN].append(price)
+            data[marketData.DIVIDENDS_COLUMN].append(price * dividend_yield)
+            data[marketData.YIELD_COLUMN].append(dividend_yield)
+        market_df = pd.DataFrame(
+            data,
+            index=pd.Index(base_list, name="Ticker"),
+            columns=column_list,
+        )
+        if sector:
+            sector_dict = self.getSectorDict(base_list)
+            market_df[marketData.SECTOR_COLUMN] = market_df.index.map(sector_dict)
+        return market_df
+
+    def getSectorDict(self, ticker_list):
+        """Return a dictionary with the sector of each ticker."""
+        base_list = dict.fromkeys(map(self._getBaseTicker, ticker_list))
+        return {
+            ticker: self.__quote_dict.get(ticker, {}).get(
+                MarketDataProvider.SECTOR_COLUMN,
+                OfflineQuoteProvider.SECTOR_NOT_FOUND,
+            )
+            for ticker in base_list
+        }
+
+    def getTreasuryPriceDict(self, ticker_list):
+        """Return a dictionary with the last price of each Treasury ticker."""
+        unique_ticker_list = list(dict.fromkeys(ticker_list))
+        self.__request(unique_ticker_list)
+        prices_dict = {}
+        for ticker in unique_ticker_list:
+            title_key = self.__getTitleKey(ticker)
+            if title_key in self.__treasury_dict:
+                prices_dict[ticker] = self.__treasury_dict[title_key]
+        return prices_dict
+
+    def getStatistics(self):
+        """Return a dictionary with the amount of 'requests' and 'tickers'."""
+        with self.__lock:
+            return {"requests": self.__requests, "tickers": self.__tickers}
@@ -0,0 +1,101 @@
+"""This file is used to test the 'quote_provider.py'."""
+
+import os
+import sys
+import time
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.quote_provider import (
+    OfflineQuoteProvider,
+    QuoteProvider,
+    WebQuoteProvider,
+)
+from portfolio_lib.assets.treasury_prices import TreasuryPriceProvider
+
+CSV_PATH = os.path.join(SCRIPT_DIR, "fixtures", "PrecoTaxaTesouroDireto.csv")
+
+
+class Test_QuoteProvider:
+    """Tests for 'QuoteProvider' interface."""
+
+    def test_abstract_methods(self):
+        """Test the interface methods must be implemented."""
+        with pytest.raises(TypeError):
+            QuoteProvider()
+
+        class PartialProvider(QuoteProvider):
+            def getSectorDict(self, ticker_list):
+                return {}
+
+        with pytest.raises(TypeError):
+            PartialProvider()
+
+
+class Test_OfflineQuoteProvider:
+    """Tests for 'OfflineQuoteProvider' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - ticker, price, dividend yield, sector
+    test_getMarketDataframe_list = [
+        ("BBAS3", 42.0, 0.0984, "Financial Services"),
+        ("CPTS11.SA", 8.5, 0.1152, "Real Estate"),
+        ("XXXX3", 0.0, 0.0, "Sector not found"),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - ticker, price
+    test_getTreasuryPrice_list = [
+        ("SELIC 2027", 13115.47),
+        ("LFT 010327", 13115.47),
+        ("Tesouro Prefixado 2026", 749.35),
+        ("SELIC 2099", 0.0),
+        ("Tesouro XYZ", 0.0),
+    ]
+
+    @pytest.mark.parametrize(
+        "ticker, price, dividend_yield, sector",
+        test_getMarketDataframe_list,
+    )
+    def test_getMarketDataframe(self, ticker, price, dividend_yield, sector):
+        """Test the 'getMarketDataframe' method."""
+        provider = OfflineQuoteProvider()
+        market_df = provider.getMarketDataframe([ticker])
+        base_ticker = ticker.replace(".SA", "")
+        assert market_df.at[base_ticker, "Cotação"] == pytest.approx(price)
+        assert market_df.at[base_ticker, "Dividend-Yield"] == pytest.approx(
+            dividend_yield,
+        )
+        assert market_df.at[base_ticker, "Setor"] == sector
+        assert provider.getSector(ticker) == sector
+
+    @pytest.mark.parametrize("ticker, price", test_getTreasuryPrice_list)
+    def test_getTreasuryPrice(self, ticker, price):
+        """Test the 'getTreasuryPrice' method."""
+        provider = OfflineQuoteProvider()
+        assert provider.getTreasuryPrice(ticker) == pytest.approx(price)
+
+    def test_latency(self):
+        """Test that each batched call is a single simulated request."""
+        provider = OfflineQuoteProvider(latency=0.05)
+        start = time.monotonic()
+        provider.getMarketDataframe(["BBAS3", "ITSA4", "WEGE3"], sector=False)
+        provider.getTreasuryPriceDict(["SELIC 2027", "SELIC 2027"])
+        assert time.monotonic() - start >= 0.1
+        assert provider.getStatistics() == {"requests": 2, "tickers": 4}
+
+
+class Test_WebQuoteProvider:
+    """Tests for 'WebQuoteProvider' class (without the network)."""
+
+    def test_getTreasuryPriceDict(self):
+        """Test the bulk prices, without scraping the missing tickers."""
+        provider = WebQuoteProvider(
+            treasuryPrices=TreasuryPriceProvider(CSV_PATH),
+            scraping=False,
+        )
+        prices_dict = provider.getTreasuryPriceDict(["SELIC 2027", "SELIC 2099"])
+        assert prices_dict == {"SELIC 2027": pytest.approx(13115.47)}
@@ -0,0 +1,90 @@
+"""This file has a persistent store of the sectors of Variable Income."""
+
+import os
+import threading
+
+from network_lib.quote_cache import QuoteCache
+
+
+class SectorStore(QuoteCache):
+    """Class used to keep the sectors of the tickers in a local file.
+
+    The sector of a company almost never changes, then the sectors are
+    kept for a long time-to-live ('TTL') in a local JSON file, shared
+    between the application executions. It is a 'QuoteCache' keyed by
+    '(ticker, SOURCE, FIELD)', saved after each batch of new sectors.
+
+    Arguments:
+    - file_path: the local JSON file (default: 'FILE_PATH')
+    - clock: function returning the current time in seconds
+    """
+
+    TTL = 90 * 24 * 60 * 60
+
+    FILE_PATH = os.path.join(
+        os.path.curdir,
+        "portfolio_lib",
+        "assets",
+        "temp",
+        "sector_store.json",
+    )
+
+    SOURCE = "yfinance"
+    FIELD = "Setor"
+
+    def __init__(self, file_path=None, clock=None):
+        """Create the SectorStore object."""
+        if file_path is None:
+            file_path = SectorStore.FILE_PATH
+        super().__init__(
+            ttl_dict={},
+            default_ttl=SectorStore.TTL,
+            file_path=file_path,
+            clock=clock,
+        )
+
+    """Public methods."""
+
+    def getKey(self, ticker):
+        """Return the store key related to the ticker."""
+        return (ticker, SectorStore.SOURCE, SectorStore.FIELD)
+
+    def getSectorDict(self, ticker_list, fetch_function, not_found=None):
+        """Return a dictionary 'ticker -> sector'.
+
+        The tickers not stored (or expired) are requested in a single call,
+        where 'fetch_function(missing_ticker_list)' should return a
+        dictionary 'ticker -> sector'. The new sectors are saved at once.
+        """
+        fetched_list = []
+
+        def fetchKeys(missing_key_list):
+            missing_ticker_list = [key[0] for key in missing_key_list]
+            sector_dict = fetch_function(missing_ticker_list)
+            fetched_list.extend(missing_ticker_list)
+            return {
+                self.getKey(ticker): sector_dict.get(ticker)
+                for ticker in missing_ticker_list
+            }
+
+        value_dict = self.getOrFetchMany(
+            [self.getKey(ticker) for ticker in ticker_list],
+            fetchKeys,
+            not_found=not_found,
+        )
+        if fetched_list:
+            self.save()
+        return {key[0]: value for key, value in value_dict.items()}
+
+
+_shared_sector_store = None
+_shared_sector_store_lock = threading.Lock()
+
+
+def getSharedSectorStore():
+    """Return the SectorStore (local file) shared by the whole application."""
+    global _shared_sector_store
+    with _shared_sector_store_lock:
+        if _shared_sector_store is None:
+            _shared_sector_store = SectorStore()
+        return _shared_sector_store
@@ -1,12 +1,16 @@
 """File useful to get several stock parameters from Status Invest."""
 
+import json
 import locale
 import os
-import urllib.request
+import threading
 from datetime import datetime
 
 import pandas as pd
-from bs4 import BeautifulSoup
+from network_lib.html_parser import HtmlParser
+from network_lib.http_session import getSharedSession
+from network_lib.page_store import getSharedPageStore
+from network_lib.rate_limiter import HostRateLimiter
 
 from portfolio_lib.assets.selector_bdrs import \
     BDRS_HTML_SELECTOR_DICT as bdrs_selector
@@ -18,20 +22,44 @@ from portfolio_lib.assets.selector_stocks import \
     STOCKS_HTML_SELECTOR_DICT as stocks_selector
 from portfolio_lib.assets.selector_tesouro import \
     TESOURO_HTML_SELECTOR_DICT as tesouro_selector
-from portfolio_lib.assets.treasuries import TreasuriesAssets
+from portfolio_lib.assets.treasury_classifier import TreasuryTitleClassifier
 
 
 class HtmlCacheManager:
-    """Class used to manage HTML files for caching purpose."""
+    """Class used to manage HTML files for caching purpose.
+
+    The pages are requested through the shared 'HttpSession', limited by a
+    per-host 'HostRateLimiter'. The methods receiving the ticker (instead of
+    using the 'set_ticker_market' state) may be called by several threads.
+
+    The pages are kept compressed in a size-bounded 'PageStore' (the 'temp'
+    folder), where the least recently used pages are removed beyond
+    'CACHE_MAX_SIZE'. Its index has the time each page was stored and its
+    validators (ETag / Last-Modified). Then, the freshness is checked
+    without reading the files, and an expired page is revalidated by a
+    conditional request: if the website answers '304 Not Modified', only
+    the check time of the page is updated.
+
+    Arguments:
+    - session: the 'HttpSession' object (default: the shared one)
+    - rate_limiter: the 'HostRateLimiter' object (default: the shared one)
+    - store: the 'PageStore' object (default: the shared one of the 'temp'
+      folder)
+    """
 
     STATUS_INVEST_URL = r"https://statusinvest.com.br/"
 
-    TEMP_FOLDER_PATH = r"\portfolio_lib\assets\temp"
-
     TIME_IN_MINUTES_FOR_CACHING = 15
     TIME_IN_SECONDS_FOR_CACHING = TIME_IN_MINUTES_FOR_CACHING * 60
 
-    def __init__(self):
+    # Requests per second (and burst) allowed to the Status Invest website
+    REQUESTS_PER_SECOND = 10
+    REQUESTS_BURST = 10
+
+    # Maximum size of the compressed pages (about 250 pages)
+    CACHE_MAX_SIZE = 20 * 1024 * 1024
+
+    def __init__(self, session=None, rate_limiter=None, store=None):
         """Cheate the HtmlCacheManager object."""
         locale.setlocale(locale.LC_ALL, "pt_BR.UTF-8")
 
@@ -49,10 +77,21 @@ class HtmlCacheManager:
         self._ticker_cache_path = None
         self._ticker_url = None
 
-        self._url_opener = urllib.request.URLopener()
-        self._url_opener.addheader("User-Agent", "Mozilla/5.0")
-
-        self._treasuries_assets = TreasuriesAssets()
+        if session is None:
+            session = getSharedSession()
+        if rate_limiter is None:
+            rate_limiter = get_shared_rate_limiter()
+        if store is None:
+            store = getSharedPageStore(
+                self._temporary_folder_path,
+                max_size=HtmlCacheManager.CACHE_MAX_SIZE,
+                sidecar_extension_list=[ScrapedFieldsCache.FILE_EXTENSION],
+            )
+        self._session = session
+        self._rate_limiter = rate_limiter
+        self._store = store
+
+        self._treasury_classifier = TreasuryTitleClassifier()
 
         self.register_local_time()
 
@@ -72,24 +111,35 @@ class HtmlCacheManager:
         elif market == "BDR":
             return main_url + "bdrs/" + ticker
         elif market == "Tesouro Direto":
-            return self._treasuries_assets._getURL(ticker)
+            return self._treasury_classifier.getURL(ticker)
 
     def _get_ticker_cache_path(self, ticker):
         """Get the path where the ticker cache is stored."""
-        return os.path.join(self._temporary_folder_path, ticker + ".html")
-
-    def _get_ticker_cache_modified_time(self, ticker_cache_path):
-        """Get the date time when the ticker cache was saved."""
-        mtime = os.path.getmtime(ticker_cache_path)
-        return datetime.fromtimestamp(mtime)
+        return self._store.getPath(ticker)
+
+    def _get_ticker_cache_modified_time(self, ticker):
+        """Get the date time when the ticker cache was saved (or revalidated)."""
+        return datetime.fromtimestamp(self._store.getStoredTime(ticker))
+
+    def _get_conditional_headers(self, ticker):
+        """Return the headers of the conditional request of the page."""
+        headers = {}
+        if not self._ticker_cache_exists(ticker):
+            return headers
+        validators = self._store.getValidators(ticker)
+        if validators["etag"]:
+            headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"]:
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
 
     def _get_diff_to_local_time_in_seconds(self, ticker_cache_time):
         """Return the difference between 2 times, in seconds."""
         return (self._local_time - ticker_cache_time).total_seconds()
 
-    def _ticker_cache_exists(self, ticker_cache_path):
-        """Return True if the cache file already exists."""
-        return os.path.isfile(ticker_cache_path)
+    def _ticker_cache_exists(self, ticker):
+        """Return True if the cache of the ticker already exists."""
+        return self._store.has(ticker)
 
     """Public methods."""
 
@@ -102,8 +152,12 @@ class HtmlCacheManager:
 
         Return True if the cache file does not exist.
         """
-        if self._ticker_cache_exists(self._ticker_cache_path):
-            cache_time = self._get_ticker_cache_modified_time(self._ticker_cache_path)
+        return self.is_ticker_data_not_updated(self._ticker)
+
+    def is_ticker_data_not_updated(self, ticker):
+        """Return True if the ticker cache is not updated (or not exists)."""
+        if self._ticker_cache_exists(ticker):
+            cache_time = self._get_ticker_cache_modified_time(ticker)
             diff_time = self._get_diff_to_local_time_in_seconds(cache_time)
             return diff_time > HtmlCacheManager.TIME_IN_SECONDS_FOR_CACHING
         else:
@@ -111,8 +165,54 @@ class HtmlCacheManager:
 
     def download_new_ticker_data(self):
         """Download the new ticker data and store in the cache temp folder."""
-        self._url_opener.retrieve(self._ticker_url, self._ticker_cache_path)
-        print("donwloading new data for", self._ticker, ":", self._market)
+        self.download_ticker_data(self._ticker, self._market)
+
+    def download_ticker_data(self, ticker, market):
+        """Download the ticker data and store in the cache temp folder.
+
+        If the page is already cached, it is revalidated by a conditional
+        request. Return False if the page was not modified.
+
+        The 'requests.RequestException' is raised if the page is not
+        available.
+        """
+        ticker_url = self._get_ticker_url(ticker, market).lower()
+        headers = self._get_conditional_headers(ticker)
+
+        self._rate_limiter.acquire(ticker_url)
+        if headers:
+            page = self._session.get(ticker_url, headers=headers)
+        else:
+            page = self._session.get(ticker_url)
+
+        if headers and page.status_code == 304:
+            self._store.touch(ticker)
+            return False
+        page.raise_for_status()
+
+        self._store.write(
+            ticker,
+            page.content,
+            etag=page.headers.get("ETag"),
+            last_modified=page.headers.get("Last-Modified"),
+        )
+        print("donwloading new data for", ticker, ":", market)
+        return True
+
+    def has_ticker_data(self, ticker):
+        """Return True if the ticker page is cached (even if expired)."""
+        return self._ticker_cache_exists(ticker)
+
+    def get_ticker_data_time(self, ticker):
+        """Return the time (seconds) the ticker page was stored or checked.
+
+        Return None if the page is not cached.
+        """
+        return self._store.getStoredTime(ticker)
+
+    def read_ticker_data(self, ticker):
+        """Return the cached page (bytes) of the ticker (None if missing)."""
+        return self._store.read(ticker)
 
     def set_ticker_market(self, ticker, market):
         """Set the ticker and market."""
@@ -122,13 +222,120 @@ class HtmlCacheManager:
         self._ticker = ticker
 
     def get_ticker_cache_file_path(self):
-        """Return the cache file path."""
+        """Return the cache file path (compressed page)."""
         return self._ticker_cache_path
 
+    def get_cache_file_path(self, ticker):
+        """Return the cache file path (compressed page) of the ticker."""
+        return self._get_ticker_cache_path(ticker)
+
+
+_shared_rate_limiter = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter():
+    """Return the HostRateLimiter shared by all the HtmlCacheManager objects.
+
+    Then, the Status Invest rate is respected by the whole application,
+    whatever the amount of managers.
+    """
+    global _shared_rate_limiter
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = HostRateLimiter(
+                HtmlCacheManager.REQUESTS_PER_SECOND,
+                HtmlCacheManager.REQUESTS_BURST,
+            )
+        return _shared_rate_limiter
+
+
+class ScrapedFieldsCache:
+    """Class used to keep the fields scraped from the local HTML pages.
+
+    The fields of each (ticker, market) are stored in a small JSON file next
+    to the HTML file ('BBAS3.gz' -> 'BBAS3.json'), together with the
+    modification time and the size of the HTML file. While the HTML file is
+    not replaced, the fields are read from the JSON file, without parsing
+    the page. The last read files are also kept in memory.
+    """
+
+    FILE_EXTENSION = ".json"
+
+    def __init__(self):
+        """Create the ScrapedFieldsCache object."""
+        self._lock = threading.Lock()
+        self._memory_dict = {}
+
+    def _get_fields_path(self, html_path):
+        """Return the JSON file path related to the HTML file."""
+        root, extension = os.path.splitext(html_path)
+        return root + ScrapedFieldsCache.FILE_EXTENSION
+
+    def _get_html_signature(self, html_path):
+        """Return the '[mtime, size]' of the HTML file (None if missing)."""
+        try:
+            stat = os.stat(html_path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _read_fields_file(self, fields_path):
+        """Return the JSON file content (None if not available)."""
+        try:
+            with open(fields_path, encoding="utf-8") as json_file:
+                return json.load(json_file)
+        except (OSError, ValueError):
+            return None
+
+    """Public methods."""
+
+    def get_fields(self, html_path, ticker, market):
+        """Return the dictionary 'field -> value' of the ticker.
+
+        Return None if the fields are not stored or the HTML file was
+        replaced after them.
+        """
+        signature = self._get_html_signature(html_path)
+        if signature is None:
+            return None
+        with self._lock:
+            data = self._memory_dict.get(html_path)
+        if data is None or data["html"] != signature:
+            data = self._read_fields_file(self._get_fields_path(html_path))
+            if data is None:
+                return None
+            with self._lock:
+                self._memory_dict[html_path] = data
+        if data["html"] != signature or data["ticker"] != ticker:
+            return None
+        if data["market"] != market:
+            return None
+        return dict(data["fields"])
+
+    def set_fields(self, html_path, ticker, market, field_dict):
+        """Store the fields of the ticker, related to the HTML file."""
+        signature = self._get_html_signature(html_path)
+        if signature is None:
+            return
+        data = {
+            "html": signature,
+            "ticker": ticker,
+            "market": market,
+            "fields": {field: float(value) for field, value in field_dict.items()},
+        }
+        with open(self._get_fields_path(html_path), "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        with self._lock:
+            self._memory_dict[html_path] = data
+
 
 class LocalScraper:
     """Class used to get values from local HTML pages."""
 
+    # Parsers shared by all the objects, per market
+    _parser_dict = {}
+
     def __init__(self):
         """Create the LocalScraper object."""
         self._soup = None
@@ -136,6 +343,13 @@ class LocalScraper:
         self._ticker = None
         self._market = None
 
+    def _get_parser(self, market):
+        """Return the HtmlParser related to the market selectors."""
+        if market not in LocalScraper._parser_dict:
+            selector_list = list(self._selector_dict.values())
+            LocalScraper._parser_dict[market] = HtmlParser(selector_list)
+        return LocalScraper._parser_dict[market]
+
     def _get_text_from_selector(self, selector_str):
         """Return the scraped text."""
         if selector_str:
@@ -164,11 +378,18 @@ class LocalScraper:
     """Public methods."""
 
     def set_html_file_properties(self, local_html_file, ticker, market):
-        """Set the HTML file and prepare the BeautifulSoup."""
-        self._soup = BeautifulSoup(
-            open(local_html_file, encoding="utf8"),
-            "html.parser",
-        )
+        """Set the HTML file and prepare the BeautifulSoup.
+
+        Only the page containers used by the market selectors are parsed.
+        """
+        with open(local_html_file, encoding="utf8") as html_file:
+            self.set_html_content_properties(html_file, ticker, market)
+
+    def set_html_content_properties(self, content, ticker, market):
+        """Set the HTML content (string, bytes or file) and prepare the soup.
+
+        Only the page containers used by the market selectors are parsed.
+        """
         if market == "FII":
             self._selector_dict = fiis_selector
         elif market == "ETF":
@@ -179,6 +400,7 @@ class LocalScraper:
             self._selector_dict = bdrs_selector
         elif market == "Tesouro Direto":
             self._selector_dict = tesouro_selector
+        self._soup = self._get_parser(market).parse(content)
         self._ticker = ticker
         self._market = market
 
@@ -0,0 +1,147 @@
+"""This file has a benchmark of the HTML parsing of Status Invest pages.
+
+Usage (from the repository folder):
+    python -m portfolio_lib.assets.status_invest_benchmark [HTML files]
+
+The cached pages (the compressed '.gz' files of the 'temp' folder of the
+HtmlCacheManager) may be given as arguments. By default, the fixture pages
+are used, padded with filler content in order to have the size of a real
+Status Invest page.
+"""
+
+import gzip
+import os
+import statistics
+import sys
+import time
+
+from network_lib.html_parser import HtmlParser
+
+from portfolio_lib.assets.selector_bdrs import BDRS_HTML_SELECTOR_DICT
+from portfolio_lib.assets.selector_etfs import ETFS_HTML_SELECTOR_DICT
+from portfolio_lib.assets.selector_fiis import FIIS_HTML_SELECTOR_DICT
+from portfolio_lib.assets.selector_stocks import STOCKS_HTML_SELECTOR_DICT
+from portfolio_lib.assets.selector_tesouro import TESOURO_HTML_SELECTOR_DICT
+from portfolio_lib.assets.variable_income import VariableIncomeAssets
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+FIXTURE_LIST = ["statusinvest_acoes.html", "statusinvest_fii.html"]
+
+# Filler blocks added to the fixture pages (about 500 kB per page)
+FILLER_BLOCKS = 2000
+
+REPEAT = 5
+
+
+def getSelectorList():
+    """Return all the selectors used by the Status Invest scrapers."""
+    selector_list = list(VariableIncomeAssets.YIELD_SELECTOR_DICT.values())
+    for selector_dict in [
+        BDRS_HTML_SELECTOR_DICT,
+        ETFS_HTML_SELECTOR_DICT,
+        FIIS_HTML_SELECTOR_DICT,
+        STOCKS_HTML_SELECTOR_DICT,
+        TESOURO_HTML_SELECTOR_DICT,
+    ]:
+        selector_list += [value for value in selector_dict.values() if value]
+    return selector_list
+
+
+def getPaddedPage(content):
+    """Return the page with filler content outside the scraped containers."""
+    block = (
+        '<div class="card"><a href="/acoes/xxxx3">XXXX3</a>'
+        + "<span>Lorem ipsum dolor sit amet</span><ul><li>1,00</li>"
+        + "<li>2,00</li></ul></div>\n"
+    )
+    filler = "<nav>" + block * (FILLER_BLOCKS // 2) + "</nav>"
+    footer = "<footer>" + block * (FILLER_BLOCKS // 2) + "</footer>"
+    content = content.replace("<body>", "<body>" + filler, 1)
+    return content.replace("</body>", footer + "</body>", 1)
+
+
+def getPageDict(path_list):
+    """Return a dictionary 'page name -> content'."""
+    page_dict = {}
+    if not path_list:
+        for file_name in FIXTURE_LIST:
+            path = os.path.join(FIXTURES_PATH, file_name)
+            with open(path, encoding="utf8") as html_file:
+                page_dict[file_name] = getPaddedPage(html_file.read())
+        return page_dict
+    for path in path_list:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf8") as html_file:
+            page_dict[os.path.basename(path)] = html_file.read()
+    return page_dict
+
+
+def getScrapedTextList(soup, selector_list):
+    """Return the texts found by the selectors."""
+    return [item.get_text() for sel in selector_list for item in soup.select(sel)]
+
+
+def measure(parser, content, selector_list):
+    """Return the median time (seconds) to parse and scrape the page."""
+    time_list = []
+    for index in range(REPEAT):
+        start = time.perf_counter()
+        soup = parser.parse(content)
+        getScrapedTextList(soup, selector_list)
+        time_list.append(time.perf_counter() - start)
+    return statistics.median(time_list)
+
+
+def run(path_list=None):
+    """Run the benchmark and return a list of result dictionaries."""
+    selector_list = getSelectorList()
+    baseline = HtmlParser(backend=HtmlParser.DEFAULT_BACKEND)
+    targeted = HtmlParser(selector_list)
+    result_list = []
+    for name, content in getPageDict(path_list).items():
+        # The targeted parsing should scrape the same texts
+        same_values = getScrapedTextList(
+            baseline.parse(content),
+            selector_list,
+        ) == getScrapedTextList(targeted.parse(content), selector_list)
+        baseline_time = measure(baseline, content, selector_list)
+        targeted_time = measure(targeted, content, selector_list)
+        result_list.append(
+            {
+                "page": name,
+                "size": len(content),
+                "baseline": baseline_time,
+                "targeted": targeted_time,
+                "speedup": baseline_time / targeted_time,
+                "same_values": same_values,
+            }
+        )
+    return result_list
+
+
+def main():
+    """Print the benchmark results."""
+    backend = HtmlParser.getDefaultBackend()
+    print("Baseline: html.parser (whole page)")
+    print("Targeted: " + backend + " + strainer")
+    print(
+        "%-28s %10s %12s %12s %8s %6s"
+        % ("page", "size(kB)", "baseline(ms)", "targeted(ms)", "speedup", "same")
+    )
+    for result in run(sys.argv[1:]):
+        print(
+            "%-28s %10.1f %12.2f %12.2f %7.1fx %6s"
+            % (
+                result["page"],
+                result["size"] / 1024,
+                result["baseline"] * 1000,
+                result["targeted"] * 1000,
+                result["speedup"],
+                result["same_values"],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
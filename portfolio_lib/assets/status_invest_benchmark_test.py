@@ -0,0 +1,22 @@
+"""This file is used to test the 'status_invest_benchmark.py'."""
+
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets import status_invest_benchmark
+
+
+class Test_StatusInvestBenchmark:
+    """Tests for the 'status_invest_benchmark' module."""
+
+    def test_run(self, monkeypatch):
+        """Test the targeted parsing scrapes the same values."""
+        monkeypatch.setattr(status_invest_benchmark, "FILLER_BLOCKS", 20)
+        monkeypatch.setattr(status_invest_benchmark, "REPEAT", 1)
+        result_list = status_invest_benchmark.run()
+        assert len(result_list) == len(status_invest_benchmark.FIXTURE_LIST)
+        assert all(result["same_values"] for result in result_list)
+        assert all(result["targeted"] > 0.0 for result in result_list)
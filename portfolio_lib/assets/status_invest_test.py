@@ -0,0 +1,167 @@
+"""This file is used to test the 'status_invest.py'."""
+
+import locale
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+from network_lib.http_session import HttpSession
+from network_lib.page_store import PageStore
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.status_invest import (
+    HtmlCacheManager,
+    ScrapedFieldsCache,
+    get_shared_rate_limiter,
+)
+
+FIELD_DICT = {"Cotação": 42.5, "P/L": 4.1, "ROE": 21.0}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Local stand-in of the Status Invest website.
+
+    The pages have an ETag, answering '304 Not Modified' when it matches.
+    """
+
+    ETAG = '"bbas3-v1"'
+
+    request_list = []
+
+    def do_GET(self):
+        """Answer the GET requests."""
+        FixtureHandler.request_list.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == FixtureHandler.ETAG:
+            self.send_response(304)
+            self.send_header("ETag", FixtureHandler.ETAG)
+            self.end_headers()
+            return
+        body = b"<html><body>BBAS3</body></html>"
+        self.send_response(200)
+        self.send_header("ETag", FixtureHandler.ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Do not print the requests."""
+
+
+class Test_ScrapedFieldsCache:
+    """Tests for 'ScrapedFieldsCache' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - ticker, market, found
+    test_get_fields_list = [
+        ("BBAS3", "Ações", True),
+        ("BBAS3", "FII", False),
+        ("ITSA4", "Ações", False),
+    ]
+
+    def getHtmlPath(self, tmp_path):
+        """Return the path of a cached HTML file."""
+        html_path = str(tmp_path / "BBAS3.html")
+        with open(html_path, "w", encoding="utf-8") as html_file:
+            html_file.write("<html><body>BBAS3</body></html>")
+        return html_path
+
+    @pytest.mark.parametrize("ticker, market, found", test_get_fields_list)
+    def test_get_fields(self, tmp_path, ticker, market, found):
+        """Test the 'get_fields' method."""
+        html_path = self.getHtmlPath(tmp_path)
+        ScrapedFieldsCache().set_fields(html_path, "BBAS3", "Ações", FIELD_DICT)
+        assert os.path.isfile(str(tmp_path / "BBAS3.json"))
+
+        # A new object reads the JSON file
+        field_dict = ScrapedFieldsCache().get_fields(html_path, ticker, market)
+        if found:
+            assert field_dict == FIELD_DICT
+        else:
+            assert field_dict is None
+
+    def test_get_fields_html_replaced(self, tmp_path):
+        """Test the 'get_fields' method after a new download of the page."""
+        html_path = self.getHtmlPath(tmp_path)
+        cache = ScrapedFieldsCache()
+        cache.set_fields(html_path, "BBAS3", "Ações", FIELD_DICT)
+        with open(html_path, "w", encoding="utf-8") as html_file:
+            html_file.write("<html><body>BBAS3 (new page)</body></html>")
+        assert cache.get_fields(html_path, "BBAS3", "Ações") is None
+
+    def test_get_fields_not_stored(self, tmp_path):
+        """Test the 'get_fields' method without the stored fields."""
+        html_path = self.getHtmlPath(tmp_path)
+        cache = ScrapedFieldsCache()
+        assert cache.get_fields(html_path, "BBAS3", "Ações") is None
+        assert cache.get_fields(html_path + ".missing", "BBAS3", "Ações") is None
+
+
+class Test_HtmlCacheManager:
+    """Tests for 'HtmlCacheManager' class."""
+
+    def getCache(self, monkeypatch, tmp_path, server_url, clock=None):
+        """Return the HtmlCacheManager object, using the local server."""
+        # The 'pt_BR' locale may not be installed
+        monkeypatch.setattr(locale, "setlocale", lambda *args: None)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(HtmlCacheManager, "STATUS_INVEST_URL", server_url + "/")
+        FixtureHandler.request_list.clear()
+        store = PageStore(str(tmp_path / "temp"), clock=clock)
+        return HtmlCacheManager(session=HttpSession(retries=0), store=store)
+
+    def test_shared_rate_limiter(self, monkeypatch, tmp_path, server_url):
+        """Test all the managers share the same rate limiter."""
+        cache = self.getCache(monkeypatch, tmp_path, server_url)
+        other_cache = self.getCache(monkeypatch, tmp_path, server_url)
+        assert cache._rate_limiter is get_shared_rate_limiter()
+        assert other_cache._rate_limiter is cache._rate_limiter
+
+    def test_shared_page_store(self, monkeypatch, tmp_path, server_url):
+        """Test the managers of the 'temp' folder share the same store."""
+        self.getCache(monkeypatch, tmp_path, server_url)
+        session = HttpSession(retries=0)
+        cache = HtmlCacheManager(session=session)
+        other_cache = HtmlCacheManager(session=session)
+        assert other_cache._store is cache._store
+
+        # No page is lost when the index is loaded again
+        cache.download_ticker_data("BBAS3", "Ações")
+        other_cache.download_ticker_data("ITSA4", "Ações")
+        store = PageStore(str(tmp_path / "portfolio_lib" / "assets" / "temp"))
+        assert store.has("BBAS3") is True
+        assert store.has("ITSA4") is True
+        assert cache._store.getStatistics()["entries"] == 2
+
+    def test_download_ticker_data(self, monkeypatch, tmp_path, server_url):
+        """Test the 'download_ticker_data' method."""
+        cache = self.getCache(monkeypatch, tmp_path, server_url)
+        assert cache.is_ticker_data_not_updated("BBAS3") is True
+        assert cache.read_ticker_data("BBAS3") is None
+
+        assert cache.download_ticker_data("BBAS3", "Ações") is True
+        assert cache.is_ticker_data_not_updated("BBAS3") is False
+        assert cache.read_ticker_data("BBAS3") == b"<html><body>BBAS3</body></html>"
+        assert FixtureHandler.request_list == [None]
+
+    def test_download_ticker_data_not_modified(
+        self, monkeypatch, tmp_path, server_url, clock
+    ):
+        """Test the revalidation of an expired page ('304 Not Modified')."""
+        # The page was stored some time ago
+        clock.now = time.time() - HtmlCacheManager.TIME_IN_SECONDS_FOR_CACHING - 60
+        cache = self.getCache(monkeypatch, tmp_path, server_url, clock)
+        cache.download_ticker_data("BBAS3", "Ações")
+        html_path = cache.get_cache_file_path("BBAS3")
+        mtime = os.path.getmtime(html_path)
+        assert cache.is_ticker_data_not_updated("BBAS3") is True
+
+        # Only the check time is updated
+        clock.now = time.time()
+        assert cache.download_ticker_data("BBAS3", "Ações") is False
+        assert FixtureHandler.request_list == [None, FixtureHandler.ETAG]
+        assert os.path.getmtime(html_path) == mtime
+        assert cache.is_ticker_data_not_updated("BBAS3") is False
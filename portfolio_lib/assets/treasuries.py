@@ -1,109 +1,146 @@
 """This file has a set of methods related to Treasuries assets."""
 
-import re
-
-import requests
-from bs4 import BeautifulSoup
+from network_lib.quote_cache import QuoteCache, getSharedQuoteCache
 
 from portfolio_lib.assets.portfolio_assets import PortfolioAssets
+from portfolio_lib.assets.quote_provider import WebQuoteProvider
+from portfolio_lib.assets.treasury_classifier import TreasuryTitleClassifier
+from portfolio_lib.assets.treasury_prices import TreasuryPriceProvider
+from portfolio_lib.assets.treasury_pricing import TreasuryPricingModel
 
 
 class TreasuriesAssets(PortfolioAssets):
     """Class used to manipulate the Treasuries assets."""
 
+    NET_OF_TAX = True
+
     VALUE_NOT_FOUND = 0.0
 
-    def __init__(self):
-        """Create the TreasuriesAssets object."""
+    def __init__(
+        self,
+        priceProvider=None,
+        pricingModel=None,
+        scraping=True,
+        quoteCache=None,
+        quoteProvider=None,
+    ):
+        """Create the TreasuriesAssets object.
+
+        Arguments:
+        - priceProvider: the 'TreasuryPriceProvider' used as the bulk
+          source of prices. The titles not found there are collected from
+          the Status Invest website.
+        - pricingModel: the 'TreasuryPricingModel' used to estimate the
+          prices still not found, from the contracted rates (offline).
+        - scraping: if False, the Status Invest website is not requested,
+          then the missing prices come only from the 'pricingModel'.
+        - quoteCache: the 'QuoteCache' used to reuse the prices between
+          refreshes (default: the shared one, or a private one for an
+          injected 'quoteProvider').
+        - quoteProvider: the 'QuoteProvider' used to get the prices. If
+          None, a 'WebQuoteProvider' is created from the 'priceProvider'
+          and 'scraping' arguments.
+        """
         super().__init__()
-        self.__initRegexPatterns()
+        self.missingQuotesList = []
+        self.classifier = TreasuryTitleClassifier()
+        if pricingModel is None:
+            pricingModel = TreasuryPricingModel()
+        self.pricingModel = pricingModel
+        if quoteCache is None:
+            # The shared cache keeps only the web quotes
+            if quoteProvider is None:
+                quoteCache = getSharedQuoteCache()
+            else:
+                quoteCache = QuoteCache()
+        self.quoteCache = quoteCache
+        if quoteProvider is None:
+            if priceProvider is None:
+                priceProvider = TreasuryPriceProvider()
+            quoteProvider = WebQuoteProvider(
+                treasuryPrices=priceProvider,
+                scraping=scraping,
+            )
+        self.quoteProvider = quoteProvider
+
+    """Protected methods."""
+
+    def _getURL(self, text):
+        return self.classifier.getURL(text)
+
+    def _getTitleKey(self, text):
+        """Return the '(kind, maturity_year)' tuple of the title.
+
+        Return None if the title is not recognized.
+        """
+        title = self.classifier.classify(text)
+        if title:
+            return title.kind, title.maturity_year
+        return None
 
     """Private methods."""
 
-    def __regexCompile(self, stringA, stringB):
-        return re.compile(stringA + self.dig4 + stringB + self.dig6)
-
-    def __initRegexPatterns(self):
-        # Main link
-        self.init_link = r"https://statusinvest.com.br/tesouro/"
-
-        # Regex patterns
-        juros = " com Juros Semestrais) "
-        self.dig4 = r"(\d\d\d\d)"
-        self.dig6 = r"(\d\d\d\d\d\d)"
-        self.rxselic = self.__regexCompile(r"(SELIC) ", r"|(LFT) ")
-        self.rxpre = self.__regexCompile(r"(Prefixado) ", r"|(LTN) ")
-        self.rxprej = self.__regexCompile(r"(Prefixado" + juros, r"|(NTN-F) ")
-        self.rxipca = self.__regexCompile(r"(IPCA\+) ", r"|(NTN-B Principal) ")
-        self.rxipcaj = self.__regexCompile(r"(IPCA\+" + juros, r"|(NTN-B) ")
-
-        # Regex patterns dictionary
-        self.pattern_dict = {
-            "SELIC": [
-                self.rxselic,
-                self.init_link + "tesouro-selic-",
-            ],
-            "Prefixado": [
-                self.rxpre,
-                self.init_link + "tesouro-prefixado-",
-            ],
-            "Prefixado com Juros Semestrais": [
-                self.rxprej,
-                self.init_link + "tesouro-prefixado-com-juros-semestrais-",
-            ],
-            "IPCA+": [
-                self.rxipca,
-                self.init_link + "tesouro-ipca-",
-            ],
-            "IPCA+ com Juros Semestrais": [
-                self.rxipcaj,
-                self.init_link + "tesouro-ipca-com-juros-semestrais-",
-            ],
+    def __fetchPrices(self, key_list):
+        # Return the '(ticker, market, field) -> price' of the missing quotes
+        ticker_list = [key[0] for key in key_list]
+        prices_dict = self.currentPriceTesouroByTickerList(ticker_list)
+        return {
+            key: prices_dict.get(key[0], TreasuriesAssets.VALUE_NOT_FOUND)
+            for key in key_list
         }
 
-    def __getYearPattern(self, rgx, text):
-        matching = rgx.search(text)
-        if matching:
-            if matching.group(2):
-                return matching.group(2)
-            elif matching.group(4):
-                slc = matching.group(4)[4:]
-                return "20" + slc
-            else:
-                return None
-        else:
-            return None
+    def __setModelPrices(self, wallet):
+        # Estimate the prices not found from the contracted rates
+        cotacao = wallet["Cotação"].fillna(TreasuriesAssets.VALUE_NOT_FOUND)
+        missing = cotacao == TreasuriesAssets.VALUE_NOT_FOUND
+        self.missingQuotesList = wallet.loc[missing, "Ticker"].tolist()
+        if missing.any():
+            cotacao[missing] = self.pricingModel.getPriceArrayByTicker(
+                wallet.loc[missing, "Ticker"].tolist(),
+                wallet.loc[missing, "Taxa-média Contratada"].to_numpy(dtype=float),
+            )
+        wallet["Cotação"] = cotacao
 
-    def _getURL(self, text):
-        url = False
-        for value_list in self.pattern_dict.values():
-            rgx = value_list[0]
-            link = value_list[1]
-            year = self.__getYearPattern(rgx, text)
-            if year:
-                url = link + year
-                break
-        return url
-
-    def __currentTesouroDireto(self):
+    def __currentTesouroDireto(self, cache_only):
         # Prepare the default wallet dataframe
         market_list = ["Tesouro Direto"]
+        self.missingQuotesList = []
         # self.setOpenedOperations(self.openedOperations)
         wallet = self.createWalletDefaultColumns(market_list)
 
         # Insert the current market values
-        for index, row in wallet.iterrows():
-            ticker = row["Ticker"]
-            indexer = row["Indexador"]
-            rate = row["Taxa-média Contratada"]
-            wallet.at[index, "Cotação"] = self.currentMarketTesouro(ticker)
-            wallet.at[index, "Taxa-média Ajustada"] = self.getAdjustedYield(
-                rate, indexer
-            )
+        if len(wallet):
+            key_list = [
+                (ticker, market, "Cotação")
+                for ticker, market in zip(wallet["Ticker"], wallet["Mercado"])
+            ]
+            if cache_only:
+                value_dict = self.quoteCache.getCachedMany(
+                    key_list,
+                    not_found=TreasuriesAssets.VALUE_NOT_FOUND,
+                )
+            else:
+                value_dict = self.quoteCache.getOrFetchMany(
+                    key_list,
+                    self.__fetchPrices,
+                    not_found=TreasuriesAssets.VALUE_NOT_FOUND,
+                )
+            wallet["Cotação"] = [value_dict[key] for key in key_list]
+            self.__setModelPrices(wallet)
+            wallet["Taxa-média Ajustada"] = [
+                self.getAdjustedYield(rate, indexer)
+                for rate, indexer in zip(
+                    wallet["Taxa-média Contratada"],
+                    wallet["Indexador"],
+                )
+            ]
 
         # Calculate values related to the wallet default columns
         self.calculateWalletDefaultColumns(market_list)
 
+        # Estimate the current values discounted by the income tax
+        self.calculateNetOfTaxColumn()
+
         return wallet
 
     """Public methods."""
@@ -123,36 +160,25 @@ class TreasuriesAssets(PortfolioAssets):
             -> Tesouro IPCA com cupons semestrais
         """
         self._checkStringType(ticker)
+        return self.quoteProvider.getTreasuryPrice(ticker)
 
-        url = self._getURL(ticker)
-
-        try:
-            # Get information from URL
-            headers = {"User-Agent": "Mozilla/5.0"}
-            page = requests.get(url, headers=headers)
-            soup = BeautifulSoup(page.content, "html.parser")
-
-            # Get the current value from ticker
-            value = soup.find(class_="value").get_text()
+    def currentPriceTesouroByTickerList(self, ticker_list):
+        """Return a dictionary with the last price of each ticker.
 
-            # Replace the point to empty in order to transform
-            # the string in a number.
-            value = value.replace(".", "")
-
-            # Replace comma to point because Python uses point
-            # as decimal spacer.
-            value = value.replace(",", ".")
-            return float(value)
-
-        except ValueError:
-            return TreasuriesAssets.VALUE_NOT_FOUND
-
-        except AttributeError:
-            return TreasuriesAssets.VALUE_NOT_FOUND
+        The prices come from the 'quoteProvider'. For the web provider, the
+        bulk CSV file is read once and only the tickers missing there are
+        collected from the Status Invest website, if 'scraping' is enabled.
+        """
+        self._checkStringListType(ticker_list)
+        return self.quoteProvider.getTreasuryPriceDict(ticker_list)
 
-    def currentTesouroDireto(self):
+    def currentTesouroDireto(self, cache_only=False):
         """Create a dataframe with all opened operations of Tesouro Direto.
 
+        If 'cache_only' is True, only the prices stored in the 'QuoteCache'
+        (even if stale) are used, without any network request. The prices
+        not stored are estimated by the 'pricingModel'.
+
         The following columns are present
         - Ticker
         - Mercado
@@ -175,12 +201,30 @@ class TreasuriesAssets(PortfolioAssets):
         - Dividendos
         - JCP
         - Cotação
+        - Cotação líquida
         - Preço mercado
         - Mercado-pago
         - Mercado-pago(%)
         - Líquido parcial
         - Líquido parcial(%)
+        - Líquido parcial real(%)
         - Porcentagem carteira:
         """
-        self.wallet = self.__currentTesouroDireto()
+        self.wallet = self.__currentTesouroDireto(cache_only)
         return self.wallet.copy()
+
+    def getMissingQuotesList(self):
+        """Return the list of wallet tickers without the collected price.
+
+        The prices estimated by the 'pricingModel' are not collected, then
+        their tickers are also flagged by this method.
+        """
+        return self.missingQuotesList.copy()
+
+    def getQuoteAgeList(self):
+        """Return the age (minutes) of the price of each wallet row.
+
+        It is the age of the price in the 'QuoteCache', or None if not
+        cached (example: the prices estimated by the 'pricingModel').
+        """
+        return self._getQuoteAgeList(self.quoteCache, ["Cotação"])
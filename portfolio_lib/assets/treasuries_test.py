@@ -10,7 +10,20 @@ import pytest
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
+from network_lib.quote_cache import QuoteCache
+from portfolio_lib.assets.quote_provider import OfflineQuoteProvider
 from portfolio_lib.assets.treasuries import TreasuriesAssets
+from portfolio_lib.extrato_manager import ExtratoFileManager
+
+
+class ConstantPricingModel:
+    """Pricing model stand-in, estimating the same price for all titles."""
+
+    PRICE = 1.0
+
+    def getPriceArrayByTicker(self, ticker_list, rates, reference_date=None):
+        """Return the constant price per ticker."""
+        return [ConstantPricingModel.PRICE] * len(ticker_list)
 
 
 def date(string):
@@ -104,11 +117,13 @@ class Test_TreasuriesAssets_currentTesouroDireto:
             "Dividendos",
             "JCP",
             "Cotação",
+            "Cotação líquida",
             "Preço mercado",
             "Mercado-pago",
             "Mercado-pago(%)",
             "Líquido parcial",
             "Líquido parcial(%)",
+            "Líquido parcial real(%)",
             "Porcentagem carteira",
         ]
         assets = TreasuriesAssets()
@@ -117,3 +132,19 @@ class Test_TreasuriesAssets_currentTesouroDireto:
         assert isinstance(df, pd.DataFrame) is True
         assert all(item in title_list for item in list(df)) is True
         assert title_list == expected_title_list
+
+    def test_getMissingQuotesList(self):
+        """Test the model prices are flagged as missing quotes."""
+        file = os.path.join(os.path.dirname(SCRIPT_DIR), "PORTFOLIO_TEMPLATE.xlsx")
+        assets = TreasuriesAssets(
+            pricingModel=ConstantPricingModel(),
+            quoteCache=QuoteCache(),
+            quoteProvider=OfflineQuoteProvider(),
+        )
+        assets.setExtratoDataframe(ExtratoFileManager(file).getExtrato())
+        wallet = assets.currentTesouroDireto().set_index("Ticker")
+
+        # 'Tesouro SELIC 2023' is not present in the provider file
+        assert wallet.at["Tesouro SELIC 2023", "Cotação"] == ConstantPricingModel.PRICE
+        assert wallet.at["Tesouro IPCA+ 2035", "Cotação"] > 0.0
+        assert assets.getMissingQuotesList() == ["Tesouro SELIC 2023"]
@@ -0,0 +1,130 @@
+"""This file has a classifier related to Treasuries titles."""
+
+import re
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+TreasuryTitle = namedtuple(
+    "TreasuryTitle",
+    ["kind", "maturity_year", "url", "maturity_date"],
+)
+TreasuryTitle.__doc__ = """Record related to a classified Treasury title.
+
+- kind: 'SELIC', 'Prefixado', 'Prefixado com Juros Semestrais', 'IPCA+' or
+  'IPCA+ com Juros Semestrais'
+- maturity_year: the maturity year (int)
+- url: the Status Invest URL related to the title
+- maturity_date: the maturity date (datetime), if present in the title code
+  (example: 'NTN-B 150824'). Otherwise, None.
+"""
+
+
+class TreasuryTitleClassifier:
+    """Class used to classify Treasury titles from their names.
+
+    The titles are accepted by their public names or codes:
+    - 'SELIC 2024' or 'LFT 030124'
+    - 'Prefixado 2024' or 'LTN 010724'
+    - 'Prefixado com Juros Semestrais 2027' or 'NTN-F 010727'
+    - 'IPCA+ 2024' or 'NTN-B Principal 150824'
+    - 'IPCA+ com Juros Semestrais 2024' or 'NTN-B 150824'
+
+    All the patterns are joined in a single regex, compiled once. Also, the
+    results are memoized per title string. The classifier has no network
+    side effects, then it is cheap to import and to create.
+    """
+
+    STATUS_INVEST_URL = r"https://statusinvest.com.br/tesouro/"
+
+    # Tuples with the following order:
+    # - kind, name pattern, code pattern, url suffix
+    TITLE_KIND_LIST = [
+        ("SELIC", r"SELIC", r"LFT", "tesouro-selic-"),
+        (
+            "Prefixado com Juros Semestrais",
+            r"Prefixado com Juros Semestrais",
+            r"NTN-F",
+            "tesouro-prefixado-com-juros-semestrais-",
+        ),
+        ("Prefixado", r"Prefixado", r"LTN", "tesouro-prefixado-"),
+        (
+            "IPCA+ com Juros Semestrais",
+            r"IPCA\+ com Juros Semestrais",
+            r"NTN-B",
+            "tesouro-ipca-com-juros-semestrais-",
+        ),
+        ("IPCA+", r"IPCA\+", r"NTN-B Principal", "tesouro-ipca-"),
+    ]
+
+    _regex = None
+    _cache = {}
+    _lock = threading.Lock()
+
+    def __init__(self):
+        """Create the TreasuryTitleClassifier object."""
+        if TreasuryTitleClassifier._regex is None:
+            TreasuryTitleClassifier._regex = self.__compileRegex()
+
+    """Private methods."""
+
+    def __compileRegex(self):
+        # Each kind has 2 named groups:
+        # - 'yN': the 4 digits year, after the title name
+        # - 'dN': the 6 digits date (ddmmyy), after the title code
+        pattern_list = []
+        for index, kind_tuple in enumerate(TreasuryTitleClassifier.TITLE_KIND_LIST):
+            name, code = kind_tuple[1], kind_tuple[2]
+            pattern_list.append(name + r" (?P<y" + str(index) + r">\d{4})")
+            pattern_list.append(code + r" (?P<d" + str(index) + r">\d{6})")
+        return re.compile("|".join(pattern_list))
+
+    def __classify(self, text):
+        matching = TreasuryTitleClassifier._regex.search(text)
+        if not matching:
+            return None
+        group = matching.lastgroup
+        digits = matching.group(group)
+        kind_tuple = TreasuryTitleClassifier.TITLE_KIND_LIST[int(group[1:])]
+        if group[0] == "y":
+            year = digits
+            maturity_date = None
+        else:
+            year = "20" + digits[4:]
+            try:
+                maturity_date = datetime.strptime(digits, "%d%m%y")
+            except ValueError:
+                maturity_date = None
+        url = TreasuryTitleClassifier.STATUS_INVEST_URL + kind_tuple[3] + year
+        return TreasuryTitle(kind_tuple[0], int(year), url, maturity_date)
+
+    """Public methods."""
+
+    def classify(self, text):
+        """Return the 'TreasuryTitle' record related to the title.
+
+        Return None if the title is not recognized.
+        """
+        cache = TreasuryTitleClassifier._cache
+        try:
+            return cache[text]
+        except KeyError:
+            title = self.__classify(text)
+            with TreasuryTitleClassifier._lock:
+                cache[text] = title
+            return title
+
+    def getURL(self, text):
+        """Return the Status Invest URL related to the title.
+
+        Return False if the title is not recognized.
+        """
+        title = self.classify(text)
+        if title:
+            return title.url
+        return False
+
+    def clearCache(self):
+        """Clear the memoized results."""
+        with TreasuryTitleClassifier._lock:
+            TreasuryTitleClassifier._cache.clear()
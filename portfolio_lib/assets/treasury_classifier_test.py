@@ -0,0 +1,95 @@
+"""This file is used to test the 'treasury_classifier.py'."""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.treasury_classifier import TreasuryTitleClassifier
+
+URL = "https://statusinvest.com.br/tesouro/"
+
+
+class Test_TreasuryTitleClassifier:
+    """Tests for 'TreasuryTitleClassifier' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - title, kind, maturity_year, url
+    test_classify_valid_list = [
+        ("SELIC 2024", "SELIC", 2024, URL + "tesouro-selic-2024"),
+        ("LFT 030124", "SELIC", 2024, URL + "tesouro-selic-2024"),
+        ("Tesouro Prefixado 2025", "Prefixado", 2025, URL + "tesouro-prefixado-2025"),
+        ("LTN 010724", "Prefixado", 2024, URL + "tesouro-prefixado-2024"),
+        (
+            "Prefixado com Juros Semestrais 2027",
+            "Prefixado com Juros Semestrais",
+            2027,
+            URL + "tesouro-prefixado-com-juros-semestrais-2027",
+        ),
+        (
+            "NTN-F 010727",
+            "Prefixado com Juros Semestrais",
+            2027,
+            URL + "tesouro-prefixado-com-juros-semestrais-2027",
+        ),
+        ("IPCA+ 2024", "IPCA+", 2024, URL + "tesouro-ipca-2024"),
+        ("NTN-B Principal 150824", "IPCA+", 2024, URL + "tesouro-ipca-2024"),
+        (
+            "IPCA+ com Juros Semestrais 2024",
+            "IPCA+ com Juros Semestrais",
+            2024,
+            URL + "tesouro-ipca-com-juros-semestrais-2024",
+        ),
+        (
+            "NTN-B 150824",
+            "IPCA+ com Juros Semestrais",
+            2024,
+            URL + "tesouro-ipca-com-juros-semestrais-2024",
+        ),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - title:
+    test_classify_invalid_list = [
+        ("A 2000"),
+        ("SELIC 24"),
+        ("selic 2024"),
+        (""),
+    ]
+
+    @pytest.mark.parametrize(
+        "title, kind, maturity_year, url",
+        test_classify_valid_list,
+    )
+    def test_classify_valid_data(self, title, kind, maturity_year, url):
+        """Test the 'classify' method against valid data."""
+        classifier = TreasuryTitleClassifier()
+        record = classifier.classify(title)
+        assert record.kind == kind
+        assert record.maturity_year == maturity_year
+        assert record.url == url
+        assert classifier.getURL(title) == url
+
+    @pytest.mark.parametrize("title", test_classify_invalid_list)
+    def test_classify_invalid_data(self, title):
+        """Test the 'classify' method against invalid data."""
+        classifier = TreasuryTitleClassifier()
+        assert classifier.classify(title) is None
+        assert classifier.getURL(title) is False
+
+    def test_classify_maturity_date(self):
+        """Test the 'maturity_date' field."""
+        classifier = TreasuryTitleClassifier()
+        record = classifier.classify("NTN-B Principal 150824")
+        assert record.maturity_date == datetime(2024, 8, 15)
+        assert classifier.classify("IPCA+ 2024").maturity_date is None
+
+    def test_classify_memoization(self):
+        """Test that the records are memoized per title."""
+        classifier = TreasuryTitleClassifier()
+        record = classifier.classify("SELIC 2024")
+        assert TreasuryTitleClassifier().classify("SELIC 2024") is record
@@ -0,0 +1,187 @@
+"""This file has a local store of historical Treasuries prices."""
+
+import os
+
+import numpy as np
+
+from portfolio_lib.assets.treasury_classifier import TreasuryTitleClassifier
+from portfolio_lib.assets.treasury_prices import TreasuryPriceProvider
+
+
+class TreasuryHistoryStore:
+    """Class used to store the historical unit prices (PU) of Treasuries.
+
+    Each title, identified by its '(kind, maturity_year)', has one sorted
+    array of dates and one array of prices. Then, the price 'as of' any date
+    is found by binary search, without any network request.
+
+    The store may be filled by the public historical CSV files published by
+    the Tesouro Nacional (the same format used by 'TreasuryPriceProvider'),
+    and saved/loaded to/from a local '.npz' file.
+
+    Arguments:
+    - file_path: the local '.npz' file used by 'save' and 'load'
+    """
+
+    VALUE_NOT_FOUND = 0.0
+
+    FILE_PATH = os.path.join(
+        os.path.curdir,
+        "portfolio_lib",
+        "assets",
+        "temp",
+        "treasury_history.npz",
+    )
+
+    KEY_SEPARATOR = "|"
+
+    def __init__(self, file_path=None):
+        """Create the TreasuryHistoryStore object."""
+        if file_path is None:
+            file_path = TreasuryHistoryStore.FILE_PATH
+        self.file_path = file_path
+        self.classifier = TreasuryTitleClassifier()
+        self.__series_dict = {}
+
+    """Private methods."""
+
+    def __getStoreKey(self, title_key, array_name):
+        kind, maturity_year = title_key
+        separator = TreasuryHistoryStore.KEY_SEPARATOR
+        return separator.join([kind, str(maturity_year), array_name])
+
+    def __getTitleKey(self, store_key):
+        kind, maturity_year, array_name = store_key.split(
+            TreasuryHistoryStore.KEY_SEPARATOR,
+        )
+        return (kind, int(maturity_year)), array_name
+
+    def __mergeSeries(self, title_key, dates, prices):
+        if title_key in self.__series_dict:
+            old_dates, old_prices = self.__series_dict[title_key]
+            dates = np.concatenate((old_dates, dates))
+            prices = np.concatenate((old_prices, prices))
+
+        # Sort per date, keeping the last imported price of repeated dates
+        order = np.argsort(dates, kind="stable")[::-1]
+        unique_dates, unique_index = np.unique(dates[order], return_index=True)
+        self.__series_dict[title_key] = (
+            unique_dates,
+            prices[order][unique_index],
+        )
+
+    def __getSeries(self, kind, maturity_year):
+        return self.__series_dict.get((kind, int(maturity_year)))
+
+    """Public methods."""
+
+    def importDataframe(self, dataframe):
+        """Import the prices from a dataframe parsed by the price provider.
+
+        The new prices are merged with the stored ones. For repeated dates,
+        the new prices replace the stored ones.
+        """
+        kind_dict = TreasuryPriceProvider.TITLE_KIND_DICT
+        title_col = TreasuryPriceProvider.TITLE_COLUMN
+        dataframe = dataframe[dataframe[title_col].isin(kind_dict.keys())]
+        kinds = dataframe[title_col].map(kind_dict)
+        years = dataframe[TreasuryPriceProvider.MATURITY_COLUMN].dt.year
+        grouped = dataframe.groupby([kinds, years], sort=False)
+        for title_key, title_df in grouped:
+            dates = title_df[TreasuryPriceProvider.DATE_COLUMN].to_numpy()
+            prices = title_df[TreasuryPriceProvider.PRICE_COLUMN].to_numpy()
+            self.__mergeSeries(
+                (title_key[0], int(title_key[1])),
+                dates.astype("datetime64[D]"),
+                prices.astype(float),
+            )
+
+    def importCSV(self, csv_path):
+        """Import the prices from a public historical CSV file.
+
+        Return False if the file is not available.
+        """
+        dataframe = TreasuryPriceProvider(csv_path).readDataframe()
+        if dataframe is None:
+            return False
+        self.importDataframe(dataframe)
+        return True
+
+    def save(self):
+        """Save the store into the local '.npz' file."""
+        arrays_dict = {}
+        for title_key, (dates, prices) in self.__series_dict.items():
+            arrays_dict[self.__getStoreKey(title_key, "dates")] = dates
+            arrays_dict[self.__getStoreKey(title_key, "prices")] = prices
+        folder = os.path.dirname(self.file_path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+        with open(self.file_path, "wb") as npz_file:
+            np.savez_compressed(npz_file, **arrays_dict)
+
+    def load(self):
+        """Load the store from the local '.npz' file.
+
+        Return False if the file does not exist.
+        """
+        if not os.path.isfile(self.file_path):
+            return False
+        arrays_dict = {}
+        with np.load(self.file_path, allow_pickle=False) as npz_file:
+            for store_key in npz_file.files:
+                title_key, array_name = self.__getTitleKey(store_key)
+                arrays_dict.setdefault(title_key, {})
+                arrays_dict[title_key][array_name] = npz_file[store_key]
+        self.__series_dict = {
+            title_key: (arrays["dates"], arrays["prices"])
+            for title_key, arrays in arrays_dict.items()
+        }
+        return True
+
+    def getTitleKeysList(self):
+        """Return a list of available '(kind, maturity_year)' titles."""
+        return sorted(self.__series_dict.keys())
+
+    def getPriceSeries(self, kind, maturity_year):
+        """Return the '(dates, prices)' arrays related to the title.
+
+        Return empty arrays if the title is not available.
+        """
+        series = self.__getSeries(kind, maturity_year)
+        if series is None:
+            return np.array([], dtype="datetime64[D]"), np.array([])
+        return series[0].copy(), series[1].copy()
+
+    def getPriceAsOfArray(self, kind, maturity_year, dates):
+        """Return an array of prices 'as of' each date.
+
+        The price 'as of' a date is the last price available on or before
+        that date. The dates before the first available price return
+        'VALUE_NOT_FOUND'.
+        """
+        days = np.asarray(dates).astype("datetime64[D]")
+        series = self.__getSeries(kind, maturity_year)
+        if series is None:
+            return np.full(days.shape, TreasuryHistoryStore.VALUE_NOT_FOUND)
+        series_dates, series_prices = series
+        position = np.searchsorted(series_dates, days, side="right") - 1
+        prices = series_prices[np.maximum(position, 0)]
+        return np.where(
+            position >= 0,
+            prices,
+            TreasuryHistoryStore.VALUE_NOT_FOUND,
+        )
+
+    def getPriceAsOf(self, kind, maturity_year, date):
+        """Return the price of the title 'as of' the date."""
+        return float(self.getPriceAsOfArray(kind, maturity_year, [date])[0])
+
+    def getPriceAsOfByTicker(self, ticker, date):
+        """Return the price 'as of' the date, given the Treasury ticker.
+
+        Example of tickers: 'SELIC 2024', 'NTN-B 150824'.
+        """
+        title = self.classifier.classify(ticker)
+        if title is None:
+            return TreasuryHistoryStore.VALUE_NOT_FOUND
+        return self.getPriceAsOf(title.kind, title.maturity_year, date)
@@ -0,0 +1,88 @@
+"""This file is used to test the 'treasury_history.py'."""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.treasury_history import TreasuryHistoryStore
+
+FIXTURE_PATH = os.path.join(SCRIPT_DIR, "fixtures", "PrecoTaxaTesouroDireto.csv")
+
+
+def date(string):
+    """Return the datetime object, given the string 'yyyy-mm-dd'."""
+    return datetime.strptime(string, "%Y-%m-%d")
+
+
+class Test_TreasuryHistoryStore:
+    """Tests for 'TreasuryHistoryStore' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - kind, maturity_year, date, price
+    test_getPriceAsOf_list = [
+        ("SELIC", 2027, date("2023-05-31"), 0.0),
+        ("SELIC", 2027, date("2023-06-01"), 13110.24),
+        ("SELIC", 2027, date("2023-06-02"), 13115.47),
+        ("SELIC", 2027, date("2024-01-01"), 13115.47),
+        ("Prefixado", 2026, date("2023-06-02"), 749.35),
+        ("SELIC", 1980, date("2023-06-02"), 0.0),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - ticker, date, price
+    test_getPriceAsOfByTicker_list = [
+        ("SELIC 2027", date("2023-06-02"), 13115.47),
+        ("LFT 010327", date("2023-06-01"), 13110.24),
+        ("Tesouro XYZ", date("2023-06-02"), 0.0),
+    ]
+
+    def getStore(self, tmp_path):
+        """Return the TreasuryHistoryStore object under testing."""
+        store = TreasuryHistoryStore(os.path.join(tmp_path, "history.npz"))
+        assert store.importCSV(FIXTURE_PATH) is True
+        return store
+
+    @pytest.mark.parametrize(
+        "kind, maturity_year, date, price",
+        test_getPriceAsOf_list,
+    )
+    def test_getPriceAsOf(self, tmp_path, kind, maturity_year, date, price):
+        """Test the 'getPriceAsOf' method."""
+        store = self.getStore(tmp_path)
+        assert store.getPriceAsOf(kind, maturity_year, date) == pytest.approx(price)
+
+    @pytest.mark.parametrize("ticker, date, price", test_getPriceAsOfByTicker_list)
+    def test_getPriceAsOfByTicker(self, tmp_path, ticker, date, price):
+        """Test the 'getPriceAsOfByTicker' method."""
+        store = self.getStore(tmp_path)
+        assert store.getPriceAsOfByTicker(ticker, date) == pytest.approx(price)
+
+    def test_importCSV_repeated(self, tmp_path):
+        """Test the 'importCSV' method with repeated dates."""
+        store = self.getStore(tmp_path)
+        assert store.importCSV(FIXTURE_PATH) is True
+        dates, prices = store.getPriceSeries("SELIC", 2027)
+        assert len(dates) == len(prices) == 2
+        assert list(prices) == pytest.approx([13110.24, 13115.47])
+        assert len(store.getTitleKeysList()) == 5
+
+    def test_importCSV_not_available(self, tmp_path):
+        """Test the 'importCSV' method against a missing file."""
+        store = TreasuryHistoryStore(os.path.join(tmp_path, "history.npz"))
+        assert store.importCSV(FIXTURE_PATH + ".missing") is False
+        assert store.getTitleKeysList() == []
+
+    def test_save_load(self, tmp_path):
+        """Test the 'save' and 'load' methods."""
+        store = self.getStore(tmp_path)
+        store.save()
+        loaded_store = TreasuryHistoryStore(store.file_path)
+        assert loaded_store.load() is True
+        assert loaded_store.getTitleKeysList() == store.getTitleKeysList()
+        price = loaded_store.getPriceAsOf("SELIC", 2027, date("2023-06-01"))
+        assert price == pytest.approx(13110.24)
@@ -0,0 +1,212 @@
+"""This file has a bulk price source related to Treasuries assets."""
+
+import io
+import time
+
+import pandas as pd
+import requests
+from network_lib.http_session import getSharedSession
+
+
+class TreasuryPriceProvider:
+    """Class used to get the Tesouro Direto prices from a single document.
+
+    All the public treasury prices are published by the Tesouro Nacional in
+    a single CSV file. Then, instead of requesting one web page per title,
+    this class downloads (or reads) the CSV once per 'refresh' and keeps an
+    in-memory dictionary, where the price lookup per title is O(1).
+
+    The CSV file has the whole history, but only the last price per title
+    is kept in memory. The refreshes inside the 'CACHE_TTL' window reuse
+    the last download.
+
+    The titles are identified by their kind and maturity year, where the
+    available kinds are:
+    - SELIC (LFT)
+    - Prefixado (LTN)
+    - Prefixado com Juros Semestrais (NTN-F)
+    - IPCA+ (NTN-B Principal)
+    - IPCA+ com Juros Semestrais (NTN-B)
+
+    Arguments:
+    - source: the URL or local path of the CSV file
+    - clock: function returning the current time in seconds
+    """
+
+    CSV_URL = (
+        r"https://www.tesourotransparente.gov.br/ckan/dataset/"
+        + r"df56aa42-484a-4a59-8184-7676580c81e3/resource/"
+        + r"796d2059-14e9-44e3-80c9-2d9e30b405c1/download/"
+        + r"PrecoTaxaTesouroDireto.csv"
+    )
+
+    # The CSV file is big, then the read timeout is longer
+    DOWNLOAD_TIMEOUT = (5, 60)
+
+    # The prices are published once per business day
+    CACHE_TTL = 60 * 60
+
+    VALUE_NOT_FOUND = 0.0
+
+    TITLE_COLUMN = "Tipo Titulo"
+    MATURITY_COLUMN = "Data Vencimento"
+    DATE_COLUMN = "Data Base"
+    PRICE_COLUMN = "PU Venda Manha"
+    COLUMN_LIST = [TITLE_COLUMN, MATURITY_COLUMN, DATE_COLUMN, PRICE_COLUMN]
+
+    TITLE_KIND_DICT = {
+        "Tesouro Selic": "SELIC",
+        "Tesouro Prefixado": "Prefixado",
+        "Tesouro Prefixado com Juros Semestrais": "Prefixado com Juros Semestrais",
+        "Tesouro IPCA+": "IPCA+",
+        "Tesouro IPCA+ com Juros Semestrais": "IPCA+ com Juros Semestrais",
+    }
+
+    def __init__(self, source=None, clock=None):
+        """Create the TreasuryPriceProvider object."""
+        if source is None:
+            source = TreasuryPriceProvider.CSV_URL
+        if clock is None:
+            clock = time.time
+        self.source = source
+        self.clock = clock
+        self.__dataframe = None
+        self.__price_dict = {}
+        self.__reference_date = None
+        self.__refresh_time = None
+
+    """Private methods."""
+
+    def __isURL(self):
+        return str(self.source).startswith(("http://", "https://"))
+
+    def __readSourceText(self):
+        if self.__isURL():
+            page = getSharedSession().get(
+                self.source,
+                timeout=TreasuryPriceProvider.DOWNLOAD_TIMEOUT,
+            )
+            page.raise_for_status()
+            page.encoding = page.encoding or "latin-1"
+            return page.text
+        with open(self.source, encoding="latin-1") as csv_file:
+            return csv_file.read()
+
+    def __isUpdated(self):
+        if self.__refresh_time is None:
+            return False
+        return (self.clock() - self.__refresh_time) < TreasuryPriceProvider.CACHE_TTL
+
+    """Protected methods."""
+
+    def _parseDataframe(self, text):
+        """Return the dataframe related to the CSV text."""
+        dataframe = pd.read_csv(io.StringIO(text), sep=";", decimal=",")
+        missing_list = [
+            column
+            for column in TreasuryPriceProvider.COLUMN_LIST
+            if column not in dataframe.columns
+        ]
+        if missing_list:
+            raise KeyError(f"Columns not found: {missing_list}")
+        for column in [
+            TreasuryPriceProvider.MATURITY_COLUMN,
+            TreasuryPriceProvider.DATE_COLUMN,
+        ]:
+            dataframe[column] = pd.to_datetime(
+                dataframe[column],
+                format="%d/%m/%Y",
+            )
+        return dataframe
+
+    def _getLastPricesDataframe(self, dataframe):
+        """Return the last available price per title."""
+        kind_dict = TreasuryPriceProvider.TITLE_KIND_DICT
+        title_col = TreasuryPriceProvider.TITLE_COLUMN
+        dataframe = dataframe[dataframe[title_col].isin(kind_dict.keys())]
+        dataframe = dataframe.sort_values(by=[TreasuryPriceProvider.DATE_COLUMN])
+        return dataframe.drop_duplicates(
+            subset=[title_col, TreasuryPriceProvider.MATURITY_COLUMN],
+            keep="last",
+        )
+
+    def _setPriceDict(self, dataframe):
+        """Fill the price dictionary: '(kind, maturity_year) -> price'."""
+        last_df = self._getLastPricesDataframe(dataframe)
+        kinds = last_df[TreasuryPriceProvider.TITLE_COLUMN].map(
+            TreasuryPriceProvider.TITLE_KIND_DICT,
+        )
+        years = last_df[TreasuryPriceProvider.MATURITY_COLUMN].dt.year
+        prices = last_df[TreasuryPriceProvider.PRICE_COLUMN].astype(float)
+        self.__price_dict = dict(zip(zip(kinds, years), prices))
+        if len(last_df):
+            self.__reference_date = last_df[TreasuryPriceProvider.DATE_COLUMN].max()
+        else:
+            self.__reference_date = None
+
+    """Public methods."""
+
+    def readDataframe(self):
+        """Download (or read) and return the whole parsed CSV (all dates).
+
+        The dataframe is not kept in memory. Return None if the source is
+        not available, or if its content is not the expected CSV (an HTML
+        error page or a truncated download, for example).
+        """
+        try:
+            text = self.__readSourceText()
+            return self._parseDataframe(text)
+        except (
+            requests.RequestException,
+            OSError,
+            pd.errors.ParserError,
+            ValueError,
+            KeyError,
+        ):
+            return None
+
+    def refresh(self, force=False):
+        """Download (or read) and parse the CSV file.
+
+        The last download is reused inside the 'CACHE_TTL' window, unless
+        'force' is True. Return False if the source is not available. In
+        this case, the prices from the last successful refresh are kept.
+        """
+        if not force and self.__isUpdated():
+            return True
+        dataframe = self.readDataframe()
+        if dataframe is None:
+            return False
+        self.__dataframe = self._getLastPricesDataframe(dataframe)
+        self._setPriceDict(self.__dataframe)
+        self.__refresh_time = self.clock()
+        return True
+
+    def getPrice(self, kind, maturity_year):
+        """Return the last price of the title.
+
+        Return 'VALUE_NOT_FOUND' if the title is not available.
+        """
+        return self.__price_dict.get(
+            (kind, int(maturity_year)),
+            TreasuryPriceProvider.VALUE_NOT_FOUND,
+        )
+
+    def hasPrice(self, kind, maturity_year):
+        """Return True if the title is available."""
+        return (kind, int(maturity_year)) in self.__price_dict
+
+    def getPriceDict(self):
+        """Return a copy of the '(kind, maturity_year) -> price' dictionary."""
+        return self.__price_dict.copy()
+
+    def getDataframe(self):
+        """Return the last price per title (rows of the CSV) of the refresh.
+
+        Return None if the CSV was not parsed yet.
+        """
+        return self.__dataframe
+
+    def getReferenceDate(self):
+        """Return the date related to the last available prices."""
+        return self.__reference_date
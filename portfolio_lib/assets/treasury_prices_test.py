@@ -0,0 +1,103 @@
+"""This file is used to test the 'treasury_prices.py'."""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.treasury_prices import TreasuryPriceProvider
+
+FIXTURE_PATH = os.path.join(SCRIPT_DIR, "fixtures", "PrecoTaxaTesouroDireto.csv")
+
+
+class Test_TreasuryPriceProvider:
+    """Tests for 'TreasuryPriceProvider' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - kind, maturity_year, price
+    test_getPrice_list = [
+        ("SELIC", 2027, 13115.47),
+        ("Prefixado", 2026, 749.35),
+        ("Prefixado com Juros Semestrais", 2033, 934.57),
+        ("IPCA+", 2035, 1920.20),
+        ("IPCA+ com Juros Semestrais", 2032, 4125.77),
+        ("SELIC", 1980, 0.0),
+    ]
+
+    def getProvider(self):
+        """Return the TreasuryPriceProvider object under testing."""
+        provider = TreasuryPriceProvider(FIXTURE_PATH)
+        assert provider.refresh() is True
+        return provider
+
+    @pytest.mark.parametrize("kind, maturity_year, price", test_getPrice_list)
+    def test_getPrice(self, kind, maturity_year, price):
+        """Test the 'getPrice' method."""
+        provider = self.getProvider()
+        assert provider.getPrice(kind, maturity_year) == pytest.approx(price)
+
+    def test_getPriceDict(self):
+        """Test the 'getPriceDict' method."""
+        provider = self.getProvider()
+        assert len(provider.getPriceDict()) == 5
+        assert provider.getReferenceDate() == datetime(2023, 6, 2)
+
+    def test_refresh_not_available(self):
+        """Test the 'refresh' method against a missing source."""
+        provider = TreasuryPriceProvider(FIXTURE_PATH + ".missing")
+        assert provider.refresh() is False
+        assert provider.getPriceDict() == {}
+
+    def test_refresh_ttl(self):
+        """Test the 'refresh' method reusing the last download."""
+        now_list = [1000.0]
+        provider = TreasuryPriceProvider(FIXTURE_PATH, clock=lambda: now_list[0])
+        assert provider.refresh() is True
+
+        # Only the last price per title is kept
+        assert len(provider.getDataframe()) == len(provider.getPriceDict())
+
+        # The source is not read again inside the TTL window
+        provider.source = FIXTURE_PATH + ".missing"
+        assert provider.refresh() is True
+        assert provider.refresh(force=True) is False
+        now_list[0] += TreasuryPriceProvider.CACHE_TTL
+        assert provider.refresh() is False
+        assert len(provider.getPriceDict()) == 5
+
+    def test_readDataframe(self):
+        """Test the 'readDataframe' method (all dates)."""
+        provider = TreasuryPriceProvider(FIXTURE_PATH)
+        dataframe = provider.readDataframe()
+        assert len(dataframe) > len(provider._getLastPricesDataframe(dataframe))
+        assert provider.getDataframe() is None
+        assert TreasuryPriceProvider(FIXTURE_PATH + ".missing").readDataframe() is None
+
+    # List of tuples, with the following order per tuple:
+    # - content of the source
+    test_refresh_invalid_list = [
+        "<html><body>Service Unavailable</body></html>",
+        "Tipo Titulo;Data Vencimento;Data Base;PU Venda Manha\n"
+        + "Tesouro Selic;01/03/2027;02/06/20",
+        "Tipo Titulo;Data Vencimento\nTesouro Selic;01/03/2027;1;2;3\n",
+        "",
+    ]
+
+    @pytest.mark.parametrize("content", test_refresh_invalid_list)
+    def test_refresh_invalid(self, content, tmp_path):
+        """Test the 'refresh' method against an invalid content."""
+        provider = self.getProvider()
+        price_dict = provider.getPriceDict()
+
+        source_path = tmp_path / "PrecoTaxaTesouroDireto.csv"
+        source_path.write_text(content, encoding="latin-1")
+        provider.source = str(source_path)
+        assert provider.readDataframe() is None
+
+        # The prices from the last successful refresh are kept
+        assert provider.refresh(force=True) is False
+        assert provider.getPriceDict() == price_dict
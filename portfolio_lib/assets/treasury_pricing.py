@@ -0,0 +1,274 @@
+"""This file has a pricing model related to Treasuries assets."""
+
+from datetime import datetime
+
+import numpy as np
+from indexer_lib.business_days import BusinessDaysCalendar
+from indexer_lib.economic_indexers import IPCA, SELIC
+from indexer_lib.indexer_manager import StackedFormatConstants
+
+from portfolio_lib.assets.treasury_classifier import TreasuryTitleClassifier
+
+
+class TreasuryPricingModel:
+    """Class used to estimate the unit price (PU) of Treasuries offline.
+
+    The theoretical price is calculated from the title kind, the maturity
+    date, the annual rate and the local indexer series, without any network
+    request. All the positions are priced in a single vectorized pass,
+    following the market convention (252 business days per year):
+    - LTN (Prefixado): 1000 / (1 + rate)^(du/252)
+    - LFT (SELIC): VNA_SELIC / (1 + rate)^(du/252)
+    - NTN-B Principal (IPCA+): VNA_IPCA / (1 + rate)^(du/252)
+    - NTN-F (Prefixado com Juros Semestrais): 1000 * (coupons + principal)
+    - NTN-B (IPCA+ com Juros Semestrais): VNA_IPCA * (coupons + principal)
+
+    The VNA (updated nominal value) starts at 1000 in July 2000 and it is
+    updated by the monthly indexer rates, where the current month is taken
+    pro rata by business days. It is an approximation of the official VNA,
+    that uses the daily SELIC and the projected IPCA.
+
+    The semiannual coupons are paid 6, 12, 18... months before the maturity
+    date. When the maturity date is not known (only the year), the usual
+    maturity day and month of the kind are used.
+    """
+
+    VALUE_NOT_FOUND = 0.0
+
+    FACE_VALUE = 1000.0
+    VNA_BASE_DATE = "2000-07-01"
+
+    # Annual rates of the semiannual coupons
+    COUPON_RATE_DICT = {
+        "Prefixado com Juros Semestrais": 0.10,
+        "IPCA+ com Juros Semestrais": 0.06,
+    }
+
+    # Indexers used to update the nominal value (VNA)
+    INDEXER_KIND_DICT = {
+        "SELIC": "SELIC",
+        "IPCA+": "IPCA",
+        "IPCA+ com Juros Semestrais": "IPCA",
+    }
+
+    # Usual maturity (day, month) per kind
+    MATURITY_DAY_MONTH_DICT = {
+        "SELIC": (1, 3),
+        "Prefixado": (1, 1),
+        "Prefixado com Juros Semestrais": (1, 1),
+        "IPCA+": (15, 5),
+        "IPCA+ com Juros Semestrais": (15, 5),
+    }
+
+    COUPON_MONTHS_PERIOD = 6
+
+    def __init__(self):
+        """Create the TreasuryPricingModel object."""
+        self.calendar = BusinessDaysCalendar()
+        self.classifier = TreasuryTitleClassifier()
+        self.__indexer_factors_dict = {}
+
+    """Private methods."""
+
+    def __getIndexerObject(self, indexer):
+        if indexer == "SELIC":
+            return SELIC()
+        return IPCA()
+
+    def __getIndexerFactors(self, indexer):
+        # The cumulative factors are created once per indexer
+        if indexer not in self.__indexer_factors_dict:
+            constants = StackedFormatConstants()
+            dataframe = self.__getIndexerObject(indexer).getExtendedDataframe()
+            dates = dataframe[constants.getAdjustedDateTitle()].to_numpy()
+            rates = dataframe[constants.getInterestTitle()].to_numpy(dtype=float)
+            rates = np.nan_to_num(rates)
+
+            # The position 'N' stores the factor accumulated before the month 'N'
+            first_month = dates[:1].astype("datetime64[M]")[0]
+            factors = np.concatenate(([1.0], np.cumprod(1 + rates)))
+            self.__indexer_factors_dict[indexer] = (first_month, rates, factors)
+        return self.__indexer_factors_dict[indexer]
+
+    def __getDaysArray(self, dates):
+        return np.asarray(dates).astype("datetime64[D]")
+
+    def __getDiscountArray(self, initial_dates, final_dates, rates):
+        business_days = self.calendar.getBusinessDaysArray(
+            initial_dates,
+            final_dates,
+        )
+        years = np.maximum(business_days, 0) / self.calendar.BUSINESS_DAYS_PER_YEAR
+        return (1 + rates) ** (-years)
+
+    def __getCouponDatesArray(self, maturity_dates, coupons_amount):
+        # Shape: (positions, coupons), from the maturity date backwards
+        maturity = maturity_dates[:, np.newaxis]
+        months = maturity.astype("datetime64[M]")
+        day_offset = maturity - months.astype("datetime64[D]")
+        steps = np.arange(coupons_amount) * TreasuryPricingModel.COUPON_MONTHS_PERIOD
+        coupon_months = months - steps.astype("timedelta64[M]")
+        return coupon_months.astype("datetime64[D]") + day_offset
+
+    def __getCouponsValueArray(self, kinds, maturity_dates, rates, reference):
+        coupon_rates = np.array(
+            [TreasuryPricingModel.COUPON_RATE_DICT.get(kind, 0.0) for kind in kinds]
+        )
+        value = np.zeros(len(kinds))
+        has_coupons = coupon_rates > 0.0
+        if not np.any(has_coupons):
+            return value
+
+        # Maximum amount of coupons among the positions
+        months = maturity_dates[has_coupons].astype("datetime64[M]").astype(np.int64)
+        months -= reference[has_coupons].astype("datetime64[M]").astype(np.int64)
+        period = TreasuryPricingModel.COUPON_MONTHS_PERIOD
+        coupons_amount = int(np.max(months)) // period + 1
+
+        coupon_dates = self.__getCouponDatesArray(
+            maturity_dates[has_coupons],
+            coupons_amount,
+        )
+        ref = reference[has_coupons][:, np.newaxis]
+        valid = coupon_dates > ref
+        coupon_dates = np.where(valid, coupon_dates, ref)
+        discount = self.__getDiscountArray(
+            ref,
+            coupon_dates,
+            rates[has_coupons][:, np.newaxis],
+        )
+        semiannual_rates = ((1 + coupon_rates[has_coupons]) ** 0.5) - 1
+        value[has_coupons] = semiannual_rates * np.sum(discount * valid, axis=1)
+        return value
+
+    """Public methods."""
+
+    def getMaturityDateArray(self, kinds, maturity_years):
+        """Return an array with the usual maturity dates given the years.
+
+        Example:
+        - kinds = ['Prefixado', 'IPCA+']
+        - maturity_years = [2026, 2035]
+        - output = [2026-01-01, 2035-05-15]
+        """
+        date_list = []
+        for kind, year in zip(kinds, maturity_years):
+            day, month = TreasuryPricingModel.MATURITY_DAY_MONTH_DICT.get(
+                kind,
+                (1, 1),
+            )
+            date_list.append("%04d-%02d-%02d" % (int(year), month, day))
+        return np.array(date_list, dtype="datetime64[D]")
+
+    def getVNAArray(self, indexer, dates):
+        """Return an array with the updated nominal value (VNA).
+
+        Arguments:
+        - indexer: 'SELIC' or 'IPCA'
+        - dates: a list/array/series of dates
+        """
+        first_month, rates, factors = self.__getIndexerFactors(indexer)
+        days = self.__getDaysArray(dates)
+        months = days.astype("datetime64[M]")
+        index_array = (months - first_month).astype(np.int64)
+        index_array = np.clip(index_array, 0, len(rates) - 1)
+        base_month = np.datetime64(TreasuryPricingModel.VNA_BASE_DATE, "M")
+        base_index = int((base_month - first_month).astype(np.int64))
+
+        # Business days elapsed in the current month (pro rata)
+        month_start = months.astype("datetime64[D]")
+        month_end = (months + 1).astype("datetime64[D]")
+        elapsed = self.calendar.getBusinessDaysArray(month_start, days)
+        total = self.calendar.getBusinessDaysArray(month_start, month_end)
+        pro_rata = (1 + rates[index_array]) ** (elapsed / total)
+
+        accumulated = factors[index_array] / factors[base_index]
+        return TreasuryPricingModel.FACE_VALUE * accumulated * pro_rata
+
+    def getPriceArray(self, kinds, maturity_dates, rates, reference_dates):
+        """Return an array with the theoretical unit prices (PU).
+
+        Arguments:
+        - kinds: the title kinds ('SELIC', 'Prefixado', ...)
+        - maturity_dates: the maturity dates
+        - rates: the annual rates (example: 0.05 for 5% a.a.). For SELIC
+          titles, it is the rate over the SELIC (usually close to zero).
+          For IPCA titles, it is the rate over the IPCA.
+        - reference_dates: the pricing dates
+
+        The expired titles, the unknown kinds and the missing rates return
+        'VALUE_NOT_FOUND'.
+        """
+        kinds = np.asarray(kinds, dtype=object)
+        maturity = self.__getDaysArray(maturity_dates)
+        reference = self.__getDaysArray(reference_dates)
+        reference = np.broadcast_to(reference, maturity.shape)
+        rates = np.asarray(rates, dtype=float)
+        rates = np.broadcast_to(rates, maturity.shape)
+
+        known = np.isin(kinds, list(TreasuryPricingModel.MATURITY_DAY_MONTH_DICT))
+        valid = known & ~np.isnan(rates) & ~np.isnat(maturity) & ~np.isnat(reference)
+        valid &= maturity > np.where(np.isnat(reference), maturity, reference)
+        prices = np.full(maturity.shape, TreasuryPricingModel.VALUE_NOT_FOUND)
+        if not np.any(valid):
+            return prices
+
+        kinds = kinds[valid]
+        maturity = maturity[valid]
+        reference = reference[valid]
+        rates = rates[valid]
+
+        # Present value per unit of nominal value
+        principal = self.__getDiscountArray(reference, maturity, rates)
+        coupons = self.__getCouponsValueArray(kinds, maturity, rates, reference)
+        unit_value = principal + coupons
+
+        # Nominal value: fixed (prefixed titles) or updated by the indexer
+        nominal = np.full(len(kinds), TreasuryPricingModel.FACE_VALUE)
+        for indexer in set(TreasuryPricingModel.INDEXER_KIND_DICT.values()):
+            indexed = np.array(
+                [
+                    TreasuryPricingModel.INDEXER_KIND_DICT.get(kind) == indexer
+                    for kind in kinds
+                ]
+            )
+            if np.any(indexed):
+                nominal[indexed] = self.getVNAArray(indexer, reference[indexed])
+
+        prices[valid] = nominal * unit_value
+        return prices
+
+    def getPriceArrayByTicker(self, ticker_list, rates, reference_date=None):
+        """Return an array with the theoretical unit prices per ticker.
+
+        The tickers are classified by the 'TreasuryTitleClassifier'. The
+        unknown tickers return 'VALUE_NOT_FOUND'.
+
+        Arguments:
+        - ticker_list: the Treasury tickers ('SELIC 2027', 'NTN-B 150824')
+        - rates: the annual rates per ticker
+        - reference_date: the pricing date (default: today)
+        """
+        if reference_date is None:
+            reference_date = datetime.today()
+        kind_list = []
+        maturity_list = []
+        for ticker in ticker_list:
+            title = self.classifier.classify(ticker)
+            if title is None:
+                kind_list.append(None)
+                maturity_list.append(np.datetime64("NaT", "D"))
+            elif title.maturity_date is None:
+                kind_list.append(title.kind)
+                maturity_list.append(
+                    self.getMaturityDateArray([title.kind], [title.maturity_year])[0]
+                )
+            else:
+                kind_list.append(title.kind)
+                maturity_list.append(np.datetime64(title.maturity_date, "D"))
+        return self.getPriceArray(
+            kind_list,
+            np.array(maturity_list, dtype="datetime64[D]"),
+            rates,
+            np.datetime64(reference_date, "D"),
+        )
@@ -0,0 +1,94 @@
+"""This file is used to test the 'treasury_pricing.py'."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.assets.treasury_pricing import TreasuryPricingModel
+
+
+class Test_TreasuryPricingModel:
+    """Tests for 'TreasuryPricingModel' class."""
+
+    # List of tuples, with the following order per tuple:
+    # - kind, maturity_year, maturity_date
+    test_getMaturityDateArray_list = [
+        ("SELIC", 2027, "2027-03-01"),
+        ("Prefixado", 2026, "2026-01-01"),
+        ("Prefixado com Juros Semestrais", 2033, "2033-01-01"),
+        ("IPCA+", 2035, "2035-05-15"),
+        ("IPCA+ com Juros Semestrais", 2045, "2045-05-15"),
+    ]
+
+    # List of tuples, with the following order per tuple:
+    # - kind, maturity_date, rate, reference_date, price
+    test_getPriceArray_list = [
+        # 252 business days from 2025-01-02 to 2026-01-01
+        ("Prefixado", "2026-01-01", 0.10, "2025-01-02", 909.0909),
+        ("Prefixado", "2026-01-01", 0.00, "2025-01-02", 1000.0),
+        # Expired title
+        ("Prefixado", "2023-01-01", 0.10, "2025-01-02", 0.0),
+        # Unknown kind
+        ("Tesouro XYZ", "2026-01-01", 0.10, "2025-01-02", 0.0),
+        # Missing rate
+        ("Prefixado", "2026-01-01", np.nan, "2025-01-02", 0.0),
+        # Coupons of 10% a.a. discounted at 10% a.a. (close to par)
+        ("Prefixado com Juros Semestrais", "2033-01-01", 0.10, "2023-01-02", 1003.6585),
+        # The VNA at the base date is the face value
+        ("SELIC", "2027-03-01", 0.00, "2000-07-01", 1000.0),
+        ("IPCA+", "2035-05-15", 0.00, "2000-07-01", 1000.0),
+    ]
+
+    @pytest.mark.parametrize(
+        "kind, maturity_year, maturity_date",
+        test_getMaturityDateArray_list,
+    )
+    def test_getMaturityDateArray(self, kind, maturity_year, maturity_date):
+        """Test the 'getMaturityDateArray' method."""
+        model = TreasuryPricingModel()
+        output = model.getMaturityDateArray([kind], [maturity_year])
+        assert output[0] == np.datetime64(maturity_date)
+
+    @pytest.mark.parametrize(
+        "kind, maturity_date, rate, reference_date, price",
+        test_getPriceArray_list,
+    )
+    def test_getPriceArray(self, kind, maturity_date, rate, reference_date, price):
+        """Test the 'getPriceArray' method."""
+        model = TreasuryPricingModel()
+        output = model.getPriceArray([kind], [maturity_date], [rate], reference_date)
+        assert output[0] == pytest.approx(price, abs=0.001)
+
+    def test_getPriceArray_vectorized(self):
+        """Test the 'getPriceArray' method with several positions."""
+        model = TreasuryPricingModel()
+        kinds = ["Prefixado", "IPCA+ com Juros Semestrais", "SELIC", "IPCA+"]
+        maturity_dates = ["2026-01-01", "2032-08-15", "2027-03-01", "2035-05-15"]
+        rates = [0.10, 0.06, 0.0, 0.055]
+        output = model.getPriceArray(kinds, maturity_dates, rates, "2023-06-02")
+        for index, kind in enumerate(kinds):
+            single = model.getPriceArray(
+                [kind],
+                [maturity_dates[index]],
+                [rates[index]],
+                "2023-06-02",
+            )
+            assert output[index] == pytest.approx(single[0])
+        # The SELIC title with zero rate is priced at the VNA
+        vna = model.getVNAArray("SELIC", ["2023-06-02"])
+        assert output[2] == pytest.approx(vna[0])
+
+    def test_getPriceArrayByTicker(self):
+        """Test the 'getPriceArrayByTicker' method."""
+        model = TreasuryPricingModel()
+        output = model.getPriceArrayByTicker(
+            ["Prefixado 2026", "LTN 010126", "Tesouro XYZ"],
+            [0.10, 0.10, 0.10],
+            "2025-01-02",
+        )
+        assert list(output) == pytest.approx([909.0909, 909.0909, 0.0], abs=0.001)
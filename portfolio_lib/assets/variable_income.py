@@ -3,22 +3,63 @@
 import pandas as pd
 import requests
 import yfinance as yf
-from bs4 import BeautifulSoup
+from network_lib.async_fetcher import AsyncFetcher
+from network_lib.html_parser import HtmlParser
+from network_lib.http_session import getSharedSession
+from network_lib.quote_cache import QuoteCache, getSharedQuoteCache
 
+from portfolio_lib.assets.market_data import MarketDataProvider
 from portfolio_lib.assets.portfolio_assets import PortfolioAssets
 from portfolio_lib.gdrive_exporter import GoogleDriveExporter
-from portfolio_lib.multi_processing import PoolTasks
+from portfolio_lib.multi_processing import ThreadPoolTasks
 
 
 class VariableIncomeAssets(PortfolioAssets):
     """Class used to manipulate the Variable Income assets."""
 
-    SECTOR_NOT_FOUND = "Sector not found"
+    SECTOR_NOT_FOUND = MarketDataProvider.SECTOR_NOT_FOUND
     VALUE_NOT_FOUND = 0.0
 
-    def __init__(self):
-        """Create the VariableIncomeAssets object."""
+    STATUS_INVEST_URL = "https://statusinvest.com.br/"
+
+    YIELD_SELECTOR_DICT = {
+        "FII": "#main-2 > div.container.pb-7 > div.top-info.d-flex.flex-wrap."
+        + "justify-between.mb-3.mb-md-5 > div:nth-child(4) > div > div"
+        + ":nth-child(1) > strong",
+        "Ações": "#main-2 > div:nth-child(4) > div > div.pb-3.pb-md-5 > div >"
+        + " div:nth-child(4) > div > div:nth-child(1) > strong",
+    }
+
+    # Limits of the concurrent requests to the Status Invest website
+    YIELD_MAX_CONCURRENCY = 16
+    YIELD_HOST_CONCURRENCY = 8
+    YIELD_DEADLINE = 30.0
+
+    def __init__(self, marketData=None, quoteCache=None):
+        """Create the VariableIncomeAssets object.
+
+        Arguments:
+        - marketData: the 'MarketDataProvider' (or any 'QuoteProvider')
+          used to get the prices, dividends and sectors of the whole wallet
+          in batched calls.
+        - quoteCache: the 'QuoteCache' used to reuse the quotes between
+          refreshes (default: the shared one, or a private one for an
+          injected 'marketData').
+        """
         super().__init__()
+        if quoteCache is None:
+            # The shared cache keeps only the web quotes
+            if marketData is None:
+                quoteCache = getSharedQuoteCache()
+            else:
+                quoteCache = QuoteCache()
+        self.quoteCache = quoteCache
+        if marketData is None:
+            marketData = MarketDataProvider()
+        self.marketData = marketData
+        self.yieldParser = HtmlParser(
+            list(VariableIncomeAssets.YIELD_SELECTOR_DICT.values()),
+        )
         self.wallet = self.__renameColumns(self.wallet)
         self.openedOperations = self.__renameColumns(self.openedOperations)
 
@@ -41,38 +82,48 @@ class VariableIncomeAssets(PortfolioAssets):
 
         return yield_col1, yield_col2, wallet
 
-    def __currentPortfolio(self):
+    def __currentPortfolio(self, cache_only):
         # Prepare the default wallet dataframe
         market_list = ["Ações", "ETF", "FII", "BDR"]
         wallet = self.createWalletDefaultColumns(market_list)
 
-        # Create a list of ticker to be used in YFinance API
+        # Create a list of ticker to be used by the market data provider
         listTicker = wallet["Ticker"].tolist()
-        listTicker = [(Ticker + ".SA") for Ticker in listTicker]
         listMarket = wallet["Mercado"].tolist()
 
         # Get related values of all tickers in the wallet
         if listTicker:
 
-            # Get the current values of all tickers in the wallet
-            curPricesTickers = self.currentMarketPriceByTickerList(listTicker)
-            for index, row in wallet.iterrows():
-                # ".SA" is needed due YFinance
-                ticker = row["Ticker"] + ".SA"
-                wallet.at[index, "Cotação"] = float(curPricesTickers[ticker])
-
-            # Get the current dividend yield of all tickers in the wallet
+            # Get the current prices and dividend yields: the quotes not
+            # cached are requested in a single call
+            price_col = MarketDataProvider.PRICE_COLUMN
+            dy_col = MarketDataProvider.YIELD_COLUMN
+            key_list = [
+                (ticker, market, field)
+                for ticker, market in zip(listTicker, listMarket)
+                for field in [price_col, dy_col]
+            ]
+            if cache_only:
+                value_dict = self.quoteCache.getCachedMany(
+                    key_list,
+                    not_found=VariableIncomeAssets.VALUE_NOT_FOUND,
+                )
+            else:
+                value_dict = self.quoteCache.getOrFetchMany(
+                    key_list,
+                    self.__fetchMarketData,
+                    not_found=VariableIncomeAssets.VALUE_NOT_FOUND,
+                )
+
+            # Align the quotes to the wallet positions in a single step
+            quote_df = self.__getAlignedQuotes(wallet, value_dict)
+            wallet["Cotação"] = quote_df[price_col].to_numpy()
+
+            # Set the current dividend yield of all tickers in the wallet
             yield_col1 = "Taxa-média Contratada"
             yield_col2 = "Taxa-média Ajustada"
-            yield_df = self.currentMarketYieldByTickerList(
-                listTicker,
-                listMarket,
-            )
-            for index, row in wallet.iterrows():
-                # ".SA" is needed due YFinance
-                ticker = row["Ticker"] + ".SA"
-                wallet.at[index, yield_col1] = float(yield_df[ticker])
-                wallet.at[index, yield_col2] = float(yield_df[ticker])
+            wallet[yield_col1] = quote_df[dy_col].to_numpy()
+            wallet[yield_col2] = quote_df[dy_col].to_numpy()
 
         # Calculate values related to the wallet default columns
         self.calculateWalletDefaultColumns(market_list)
@@ -84,9 +135,21 @@ class VariableIncomeAssets(PortfolioAssets):
 
         return wallet
 
-    def __getSectorOfTicker(self, ticker):
-        data = yf.Ticker(ticker)
-        return data.info["sector"]
+    def __getAlignedQuotes(self, wallet, value_dict):
+        # Return the quotes dataframe ('field' columns) aligned to the wallet
+        # rows, where the missing tickers are 'VALUE_NOT_FOUND'
+        quote_df = pd.Series(value_dict, dtype=float).unstack()
+        wallet_index = pd.MultiIndex.from_arrays(
+            [wallet["Ticker"], wallet["Mercado"]],
+        )
+        quote_df = quote_df.reindex(wallet_index)
+        return quote_df.fillna(VariableIncomeAssets.VALUE_NOT_FOUND)
+
+    def __fetchMarketData(self, key_list):
+        # Return the '(ticker, market, field) -> value' of the missing quotes
+        ticker_list = list(dict.fromkeys(key[0] for key in key_list))
+        market_df = self.marketData.getMarketDataframe(ticker_list, sector=False)
+        return {key: float(market_df.at[key[0], key[2]]) for key in key_list}
 
     def __getCurrentMarketPriceByTicker(self, ticker):
         # I had issues when downloading data for Fundos imobiliários.
@@ -104,10 +167,32 @@ class VariableIncomeAssets(PortfolioAssets):
 
     """Protected methods."""
 
-    def _currentMarketYieldByTicker(self, arg_list):
-        ticker = arg_list[0]
-        market = arg_list[1]
-        return [self.currentMarketYieldByTicker(ticker, market)]
+    def _getYieldURL(self, ticker, market):
+        """Return the Status Invest URL related to the ticker."""
+        strip_list = ticker.split(".")  # The left side is without ".SA"
+        true_ticker = strip_list[0]
+        main_url = VariableIncomeAssets.STATUS_INVEST_URL
+        if market == "FII":
+            return main_url + "fundos-imobiliarios/" + true_ticker
+        return main_url + "acoes/" + true_ticker
+
+    def _parseYield(self, content, market):
+        """Return the Dividend Yield from the Status Invest page content."""
+        soup = self.yieldParser.parse(content)
+        if market == "FII":
+            selector = soup.select(VariableIncomeAssets.YIELD_SELECTOR_DICT["FII"])
+        else:
+            selector = soup.select(VariableIncomeAssets.YIELD_SELECTOR_DICT["Ações"])
+
+        # Convert string to float values
+        try:
+            value_str = selector[0].get_text()
+            value = value_str.replace(",", ".")
+            return float(value) / 100
+        except IndexError:
+            return VariableIncomeAssets.VALUE_NOT_FOUND
+        except ValueError:
+            return VariableIncomeAssets.VALUE_NOT_FOUND
 
     def _checkMarketType(self, market):
         self._checkStringType(market)
@@ -130,16 +215,20 @@ class VariableIncomeAssets(PortfolioAssets):
     def sectorOfTicker(self, ticker):
         """Return the sector of a given ticker.
 
-        The function uses the yfinance library to get the information.
+        The function uses the yfinance library (through the market data
+        provider) to get the information.
         """
         self._checkStringType(ticker)
-        try:
-            return self.__getSectorOfTicker(ticker)
-        except (KeyError, IndexError):
-            try:
-                return self.__getSectorOfTicker(ticker + ".SA")
-            except (KeyError, IndexError):
-                return VariableIncomeAssets.SECTOR_NOT_FOUND
+        return self.marketData.getSector(ticker)
+
+    def sectorOfTickerList(self, tickerList):
+        """Return a dictionary with the sector of each ticker in the list.
+
+        The sectors are kept in a local store for a long time. Then, only
+        the tickers not stored yet are requested to the yfinance library.
+        """
+        self._checkStringListType(tickerList)
+        return self.marketData.getSectorDict(tickerList)
 
     def currentMarketPriceByTicker(self, ticker):
         """Return the last price of a given ticker.
@@ -173,40 +262,13 @@ class VariableIncomeAssets(PortfolioAssets):
         # If we want to improve the application performance, we need to change
         # something here.
 
-        # Prepare the URL
-        strip_list = ticker.split(".")  # The left side is without ".SA"
-        true_ticker = strip_list[0]
-        main_url = "https://statusinvest.com.br/"
-        if market == "FII":
-            url = main_url + "fundos-imobiliarios/" + true_ticker
-        else:
-            url = main_url + "acoes/" + true_ticker
-
-        # Web scraping
-        headers = {"User-Agent": "Mozilla/5.0"}
-        page = requests.get(url, headers=headers)
-        soup = BeautifulSoup(page.content, "html.parser")
-        if market == "FII":
-            selector = soup.select(
-                "#main-2 > div.container.pb-7 > div.top-info.d-flex.flex-wrap."
-                + "justify-between.mb-3.mb-md-5 > div:nth-child(4) > div > div"
-                + ":nth-child(1) > strong"
-            )
-        else:
-            selector = soup.select(
-                "#main-2 > div:nth-child(4) > div > div.pb-3.pb-md-5 > div >"
-                + " div:nth-child(4) > div > div:nth-child(1) > strong"
-            )
-
-        # Convert string to float values
+        # Web scraping (the shared session sets the timeout and retries)
+        url = self._getYieldURL(ticker, market)
         try:
-            value_str = selector[0].get_text()
-            value = value_str.replace(",", ".")
-            return float(value) / 100
-        except IndexError:
-            return VariableIncomeAssets.VALUE_NOT_FOUND
-        except ValueError:
+            page = getSharedSession().get(url)
+        except requests.RequestException:
             return VariableIncomeAssets.VALUE_NOT_FOUND
+        return self._parseYield(page.content, market)
 
     def currentMarketPriceByTickerList(self, value_list):
         """Return a dataframe with the last price of the stocks in the list.
@@ -241,38 +303,54 @@ class VariableIncomeAssets(PortfolioAssets):
         - BDR
         - ETF
 
-        The function uses the Status Invest website to get the information
+        The function uses the Status Invest website to get the information.
+        The pages are requested concurrently (asyncio), limited per host and
+        by an overall deadline. The pages not available return
+        'VALUE_NOT_FOUND'. The wallet refresh does not use this method (see
+        'currentPortfolio'), so the fetcher is created only when it is called.
         """
         self._checkStringListType(tickerList)
         self._checkMarketListType(marketList)
-        # Set the pool list variables
-        self.tickerPool = []
-        self.marketPool = []
-        self.yieldPool = []
-        for index, ticker in enumerate(tickerList):
-            self.tickerPool.append(ticker)
-            self.marketPool.append(marketList[index])
-            self.yieldPool.append([])
-        self.indexPool = range(len(self.yieldPool))
-
-        # Run the pool multitask
-        self.yieldPool = PoolTasks().runPool(
-            self._currentMarketYieldByTicker,
-            zip(
-                self.tickerPool,
-                self.marketPool,
-                self.indexPool,
-            ),
+        url_list = [
+            self._getYieldURL(ticker, market)
+            for ticker, market in zip(tickerList, marketList)
+        ]
+        market_dict = dict(zip(url_list, marketList))
+
+        def parseYield(url, content):
+            return self._parseYield(content, market_dict[url])
+
+        # Run the requests in the event loop, parsing in worker threads of
+        # the shared pool
+        fetcher = AsyncFetcher(
+            max_concurrency=VariableIncomeAssets.YIELD_MAX_CONCURRENCY,
+            host_concurrency=VariableIncomeAssets.YIELD_HOST_CONCURRENCY,
+            deadline=VariableIncomeAssets.YIELD_DEADLINE,
+            executor=ThreadPoolTasks(),
+        )
+        yield_list = fetcher.fetchAll(
+            url_list,
+            parseYield,
+            default=VariableIncomeAssets.VALUE_NOT_FOUND,
         )
-        df_dict = dict(zip(self.tickerPool, self.yieldPool))
+        df_dict = {ticker: [value] for ticker, value in zip(tickerList, yield_list)}
         return pd.DataFrame(data=df_dict)
 
-    def currentPortfolio(self):
+    def currentPortfolio(self, cache_only=False):
         """Analyze the operations to get the current wallet.
 
         Return a dataframe containing the current wallet of stocks, FIIs,
         ETFs and BDRs.
 
+        The prices and the dividend yields come from the market data
+        provider (yfinance). The dividend yield is the dividends of the
+        last 12 months over the last price, instead of the Status Invest
+        value (see 'currentMarketYieldByTickerList').
+
+        If 'cache_only' is True, only the quotes stored in the 'QuoteCache'
+        (even if stale) are used, without any network request. The quotes
+        not stored are 'VALUE_NOT_FOUND'.
+
         The following columns are present:
         - Ticker
         - Mercado
@@ -300,11 +378,23 @@ class VariableIncomeAssets(PortfolioAssets):
         - Mercado-pago(%)
         - Líquido parcial
         - Líquido parcial(%)
+        - Líquido parcial real(%)
         - Porcentagem carteira
         """
-        self.wallet = self.__currentPortfolio()
+        self.wallet = self.__currentPortfolio(cache_only)
         return self.wallet.copy()
 
+    def getQuoteAgeList(self):
+        """Return the age (minutes) of the quotes of each wallet row.
+
+        It is the age of the oldest quote (price or dividend yield) in the
+        'QuoteCache', or None if not cached.
+        """
+        return self._getQuoteAgeList(
+            self.quoteCache,
+            [MarketDataProvider.PRICE_COLUMN, MarketDataProvider.YIELD_COLUMN],
+        )
+
     def currentPortfolioGoogleDrive(
         self,
         extrato_path,
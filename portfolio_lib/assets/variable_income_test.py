@@ -2,6 +2,8 @@
 
 import os
 import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 import pandas as pd
 import pytest
@@ -9,7 +11,42 @@ import pytest
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
+from network_lib.quote_cache import QuoteCache
+from portfolio_lib.assets.market_data_test import (
+    FixtureMarketDataProvider,
+    getSectorStore,
+)
 from portfolio_lib.assets.variable_income import VariableIncomeAssets
+from portfolio_lib.extrato_manager import ExtratoFileManager
+
+FIXTURE_DIR = os.path.join(SCRIPT_DIR, "fixtures")
+
+
+class StatusInvestHandler(SimpleHTTPRequestHandler):
+    """Local stand-in of the Status Invest website (fixture pages)."""
+
+    def translate_path(self, path):
+        """Return the fixture page related to the market in the path."""
+        if path.startswith("/fundos-imobiliarios/"):
+            return os.path.join(FIXTURE_DIR, "statusinvest_fii.html")
+        return os.path.join(FIXTURE_DIR, "statusinvest_acoes.html")
+
+    def log_message(self, format, *args):
+        """Do not print the requests."""
+
+
+@pytest.fixture
+def status_invest_url(monkeypatch):
+    """Redirect the Status Invest requests to the local server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusInvestHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = "http://127.0.0.1:" + str(server.server_address[1]) + "/"
+    monkeypatch.setattr(VariableIncomeAssets, "STATUS_INVEST_URL", url)
+    yield url
+    server.shutdown()
+    server.server_close()
 
 
 class Test_VariableIncomeAssets_initialization:
@@ -278,6 +315,16 @@ class Test_VariableIncomeAssets_currentMarketYieldByTickerList:
         with pytest.raises(ValueError):
             assets.currentMarketYieldByTickerList(ticker_list, market_list)
 
+    def test_currentMarketYieldByTickerList_fixture(self, status_invest_url):
+        """Test the 'currentMarketYieldByTickerList' against fixture pages."""
+        assets = VariableIncomeAssets()
+        ticker_list = ["BBAS3", "CPTS11"] * 30
+        market_list = ["Ações", "FII"] * 30
+        val = assets.currentMarketYieldByTickerList(ticker_list, market_list)
+        assert isinstance(val, pd.DataFrame) is True
+        assert val["BBAS3"][0] == pytest.approx(0.0984)
+        assert val["CPTS11"][0] == pytest.approx(0.1152)
+
 
 class Test_VariableIncomeAssets_currentPortfolio:
     """Tests for 'VariableIncomeAssets': currentPortfolio()."""
@@ -311,6 +358,7 @@ class Test_VariableIncomeAssets_currentPortfolio:
             "Mercado-pago(%)",
             "Líquido parcial",
             "Líquido parcial(%)",
+            "Líquido parcial real(%)",
             "Porcentagem carteira",
         ]
         assets = VariableIncomeAssets()
@@ -319,3 +367,21 @@ class Test_VariableIncomeAssets_currentPortfolio:
         assert isinstance(df, pd.DataFrame) is True
         assert all(item in title_list for item in list(df)) is True
         assert title_list == expected_title_list
+
+    def test_currentPortfolio_dividend_yield(self, tmp_path):
+        """Test the dividend yield comes from the market data provider.
+
+        It is the dividends of the last 12 months over the last 'Close'
+        price (yfinance), not the Status Invest value.
+        """
+        file = os.path.join(os.path.dirname(SCRIPT_DIR), "PORTFOLIO_TEMPLATE.xlsx")
+        provider = FixtureMarketDataProvider(getSectorStore(tmp_path))
+        assets = VariableIncomeAssets(marketData=provider, quoteCache=QuoteCache())
+        # The 'ITUB3' operations are used as 'BBAS3' ones (fixture data)
+        extrato = ExtratoFileManager(file).getExtrato()
+        extrato = extrato[extrato["Ticker"] != "BBAS3"]
+        extrato["Ticker"] = extrato["Ticker"].replace("ITUB3", "BBAS3")
+        assets.setExtratoDataframe(extrato)
+        wallet = assets.currentPortfolio().set_index("Ticker")
+        assert wallet.at["BBAS3", "Cotação"] == pytest.approx(42.0)
+        assert wallet.at["BBAS3", "Dividend-Yield"] == pytest.approx(0.1)
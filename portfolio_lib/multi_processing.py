@@ -1,6 +1,10 @@
 """This file is useful to handle some slow tasks in parallel."""
 
+import atexit
+import contextvars
 import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 
 class MultiProcessingTasks:
@@ -38,3 +42,73 @@ class PoolTasks:
         self.pool.close()
         self.pool.join()
         return pool_map
+
+
+class ThreadPoolTasks:
+    """This is a class to manage I/O tasks with parameters in threads.
+
+    Unlike 'PoolTasks', a single pool of threads is shared by all the
+    objects and kept alive between the calls. Then, there is no process
+    spawn neither pickling of the arguments (or 'self') per call, what fits
+    better the I/O-bound tasks, like HTTP requests.
+
+    The pool is created on first use and shut down at the interpreter exit.
+    The tasks should not wait for other tasks submitted to the same pool.
+
+    Each task runs in a copy of the caller context ('contextvars'), then
+    the context state (the time budget of the requests, for example) is
+    kept by the worker threads.
+    """
+
+    MAX_WORKERS = 16
+
+    _executor = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        """Create the ThreadPoolTasks object."""
+        self.workers = ThreadPoolTasks.MAX_WORKERS
+
+    """Public methods."""
+
+    def getExecutor(self):
+        """Return the shared 'ThreadPoolExecutor' (created on first use)."""
+        with ThreadPoolTasks._lock:
+            if ThreadPoolTasks._executor is None:
+                ThreadPoolTasks._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="ThreadPoolTasks",
+                )
+                atexit.register(self.shutdown)
+            return ThreadPoolTasks._executor
+
+    def runPool(self, function, arg_list):
+        """Run the function for each argument and return the results list.
+
+        The results keep the same order of the arguments.
+        """
+        arg_list = list(arg_list)
+        context_list = [contextvars.copy_context() for arg in arg_list]
+        return list(
+            self.getExecutor().map(
+                lambda context, arg: context.run(function, arg),
+                context_list,
+                arg_list,
+            )
+        )
+
+    def submit(self, function, *args, **kwargs):
+        """Schedule a single task and return its 'Future' object."""
+        context = contextvars.copy_context()
+        return self.getExecutor().submit(context.run, function, *args, **kwargs)
+
+    def shutdown(self):
+        """Wait the running tasks and release the shared pool.
+
+        A new pool is created if more tasks are submitted later.
+        """
+        with ThreadPoolTasks._lock:
+            executor = ThreadPoolTasks._executor
+            ThreadPoolTasks._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,44 @@
+"""This file is used to test the 'multi_processing.py'."""
+
+import os
+import sys
+import threading
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from portfolio_lib.multi_processing import ThreadPoolTasks
+
+
+def getThreadName(value):
+    """Return the value and the name of the thread running the task."""
+    return value, threading.current_thread().name
+
+
+class Test_ThreadPoolTasks:
+    """Tests for 'ThreadPoolTasks' class."""
+
+    def test_runPool(self):
+        """Test the 'runPool' method keeps the arguments order."""
+        output = ThreadPoolTasks().runPool(lambda x: x * 2, range(50))
+        assert output == [x * 2 for x in range(50)]
+
+    def test_runPool_shared(self):
+        """Test the pool of threads is reused between calls and objects."""
+        first = ThreadPoolTasks().runPool(getThreadName, range(20))
+        second = ThreadPoolTasks().runPool(getThreadName, range(20))
+        names = {name for value, name in first + second}
+        assert len(names) <= ThreadPoolTasks.MAX_WORKERS
+        assert all(name.startswith("ThreadPoolTasks") for name in names)
+
+    def test_submit(self):
+        """Test the 'submit' method."""
+        future = ThreadPoolTasks().submit(sum, [1, 2, 3])
+        assert future.result() == 6
+
+    def test_shutdown(self):
+        """Test the pool is created again after the 'shutdown'."""
+        tasks = ThreadPoolTasks()
+        tasks.runPool(abs, [-1])
+        tasks.shutdown()
+        assert tasks.runPool(abs, [-1, -2]) == [1, 2]
@@ -2,6 +2,7 @@
 
 
 from gui_lib.treeview.format_applier import EasyFormatter
+from network_lib.quote_cache import QuoteCache
 
 
 class PortfolioFormater(EasyFormatter):
@@ -71,7 +72,9 @@ class VariableIncomesFormater(EasyFormatter):
             "JCP": "$",
             "Líquido parcial": "$",
             "Líquido parcial(%)": "%",
+            "Líquido parcial real(%)": "%",
             "Porcentagem carteira": "%",
+            QuoteCache.AGE_COLUMN: "0.0",
         }
         super().__init__(portfolio_data_frame, column_type_dict)
 
@@ -97,6 +100,7 @@ class TreasuriesFormater(EasyFormatter):
             "Preço médio": "$",
             "Preço médio+taxas": "$",
             "Cotação": "$",
+            "Cotação líquida": "$",
             "Preço pago": "$",
             "Preço mercado": "$",
             "Mercado-pago": "$",
@@ -108,7 +112,9 @@ class TreasuriesFormater(EasyFormatter):
             "JCP": "$",
             "Líquido parcial": "$",
             "Líquido parcial(%)": "%",
+            "Líquido parcial real(%)": "%",
             "Porcentagem carteira": "%",
+            QuoteCache.AGE_COLUMN: "0.0",
         }
         super().__init__(portfolio_data_frame, column_type_dict)
 
@@ -134,6 +140,7 @@ class FixedIncomesFormater(EasyFormatter):
             "Preço médio": "$",
             "Preço médio+taxas": "$",
             "Cotação": "$",
+            "Cotação líquida": "$",
             "Preço pago": "$",
             "Preço mercado": "$",
             "Mercado-pago": "$",
@@ -145,6 +152,7 @@ class FixedIncomesFormater(EasyFormatter):
             "JCP": "$",
             "Líquido parcial": "$",
             "Líquido parcial(%)": "%",
+            "Líquido parcial real(%)": "%",
             "Porcentagem carteira": "%",
         }
         super().__init__(portfolio_data_frame, column_type_dict)
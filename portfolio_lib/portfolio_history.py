@@ -5,6 +5,7 @@ from datetime import datetime
 import pandas as pd
 from gui_lib.treeview.format_applier import EasyFormatter
 from indexer_lib.dataframe_filter import DataframeFilter
+from indexer_lib.real_return import RealReturnCalculation
 
 from portfolio_lib.tabs.summary.market_info import MarketInfo
 
@@ -46,6 +47,7 @@ class HistoryFormatter(EasyFormatter):
             "Venda-Compra Realizado": "$",
             "Líquido Realizado": "$",
             "Rentabilidade Líquida": "%",
+            "Rentabilidade Real": "%",
         }
         super().__init__(dataframe, column_type_dict)
 
@@ -57,6 +59,7 @@ class OperationsHistory:
         """Create the operations history object."""
         self.extrato_df = extrato_df
         self.df_filter = DataframeFilter()
+        self.real_return = None
 
     def _sortDataframePerData(self, filtered_df):
         filtered_df = filtered_df.sort_values(by=["Data"])
@@ -102,6 +105,7 @@ class OperationsHistory:
             "Venda-Compra Realizado",
             "Líquido Realizado",
             "Rentabilidade Líquida",
+            "Rentabilidade Real",
         ]
         return pd.DataFrame(columns=col_list)
 
@@ -365,6 +369,18 @@ class OperationsHistory:
             )
         return operations_mkt_df
 
+    def __setRealReturnColumn(self, operations_mkt_df):
+        # The IPCA series is loaded only when there is something to deflate
+        if len(operations_mkt_df):
+            if self.real_return is None:
+                self.real_return = RealReturnCalculation()
+            self.real_return.addRealReturnColumn(
+                operations_mkt_df,
+                "Rentabilidade Líquida",
+                "Rentabilidade Real",
+            )
+        return operations_mkt_df
+
     def __getHistOperationsDataframe(self, closed=True):
         operations_mkt_df = self.__getDefaultHistoryDataframe()
         mkt_info = MarketInfo(self.extrato_df)
@@ -383,7 +399,7 @@ class OperationsHistory:
             operations_mkt_df = operations_mkt_df.sort_values(
                 by=["Mercado", "Ticker", "Operação"]
             )
-        return operations_mkt_df
+        return self.__setRealReturnColumn(operations_mkt_df)
 
     def __getFormattedHistOperationsDataframe(self, closed=True):
         if closed:
@@ -1,5 +1,8 @@
 """This file has a set of methods related to Portfolio/Extrato."""
 
+from network_lib.http_session import getSharedSession
+from network_lib.quote_cache import QuoteCache
+
 from portfolio_lib.assets.fixed_income import FixedIncomeAssets
 from portfolio_lib.assets.treasuries import TreasuriesAssets
 from portfolio_lib.assets.variable_income import VariableIncomeAssets
@@ -14,14 +17,55 @@ class PortfolioInvestment(ExtratoFileManager):
     EXTRATO_PROCESS_ID = 0
     REALTIME_PROCESS_ID = 1
 
-    def __init__(self, fileOperations=None):
-        """Create the PortfolioInvestment object."""
+    # Overall time (seconds) of the network requests of a refresh
+    REFRESH_BUDGET = 30.0
+
+    # Fields of the cached quotes used by the wallet
+    QUOTE_FIELD_LIST = ["Cotação", "Dividend-Yield"]
+
+    def __init__(self, fileOperations=None, quoteProvider=None, refreshBudget=None):
+        """Create the PortfolioInvestment object.
+
+        Arguments:
+        - fileOperations: the path of the extrato file
+        - quoteProvider: the 'QuoteProvider' shared by the assets. If None,
+          each asset uses its web sources (and the shared 'QuoteCache').
+          Otherwise, the assets share a private 'QuoteCache', then the
+          quotes of distinct providers are never mixed. An
+          'OfflineQuoteProvider' allows to run (and to measure) the refresh
+          of the wallets without the internet (see 'QuoteProvider').
+        - refreshBudget: the overall time (seconds) shared by the network
+          requests of each refresh (default: 'REFRESH_BUDGET'). When the
+          budget is over, the missing quotes are flagged instead of
+          blocking (see 'getMissingQuotesDict').
+        """
         super().__init__(fileOperations)
-        self.VariableIncome = VariableIncomeAssets()
-        self.FixedIncome = FixedIncomeAssets()
-        self.Treasuries = TreasuriesAssets()
-        self.multi_process_list = self.__getProcessList()
-        self.run()
+        if refreshBudget is None:
+            refreshBudget = PortfolioInvestment.REFRESH_BUDGET
+        self.refreshBudget = refreshBudget
+        self.quoteProvider = quoteProvider
+
+        # The assets share the responses of repeated requests during the
+        # whole initialization
+        session = getSharedSession()
+        session.startRefresh()
+        quoteCache = None
+        if quoteProvider is not None:
+            quoteCache = QuoteCache()
+        try:
+            self.VariableIncome = VariableIncomeAssets(
+                marketData=quoteProvider,
+                quoteCache=quoteCache,
+            )
+            self.FixedIncome = FixedIncomeAssets()
+            self.Treasuries = TreasuriesAssets(
+                quoteCache=quoteCache,
+                quoteProvider=quoteProvider,
+            )
+            self.multi_process_list = self.__getProcessList()
+            self.run()
+        finally:
+            session.endRefresh()
 
     """Private methods."""
 
@@ -29,6 +73,17 @@ class PortfolioInvestment(ExtratoFileManager):
         processes = PortfolioInvestment.TOTAL_PROCESSES
         return [MultiProcessingTasks() for x in range(processes)]
 
+    def __updateCurrentDataframes(self, cache_only, proc_id):
+        self._startNewProcess(self._updateCurrentPortfolio(cache_only), proc_id)
+        self._startNewProcess(self._updateCurrentRendaFixa(), proc_id)
+        self._startNewProcess(self._updateCurrentTesouroDireto(cache_only), proc_id)
+        self._endAllProcesses(proc_id)
+
+    def __getQuoteCacheList(self):
+        # The assets usually share the same cache
+        cache_list = [self.VariableIncome.quoteCache, self.Treasuries.quoteCache]
+        return list({id(cache): cache for cache in cache_list}.values())
+
     """Protected methods."""
 
     def _startNewProcess(self, function, proc_index):
@@ -42,30 +97,46 @@ class PortfolioInvestment(ExtratoFileManager):
         self.FixedIncome.setExtratoDataframe(self.operations)
         self.Treasuries.setExtratoDataframe(self.operations)
 
-    def _updateCurrentPortfolio(self):
-        self.currentVariableIncome = self.VariableIncome.currentPortfolio()
+    def _updateCurrentPortfolio(self, cache_only=False):
+        self.currentVariableIncome = self.VariableIncome.currentPortfolio(
+            cache_only,
+        )
 
     def _updateCurrentRendaFixa(self):
         self.currentFixedIncome = self.FixedIncome.currentRendaFixa()
 
-    def _updateCurrentTesouroDireto(self):
-        self.currentTreasuries = self.Treasuries.currentTesouroDireto()
+    def _updateCurrentTesouroDireto(self, cache_only=False):
+        self.currentTreasuries = self.Treasuries.currentTesouroDireto(cache_only)
 
     """Public methods."""
 
-    def run(self):
-        """Run the main routines related to the excel porfolio file."""
+    def run(self, cache_only=False):
+        """Run the main routines related to the excel porfolio file.
+
+        If 'cache_only' is True, the dataframes are rebuilt only with the
+        cached quotes (even if stale), without any network request. It is
+        useful to repaint the GUI when the fresh quotes are stored in
+        background.
+        """
         # The bellow tasks run in parallel
         proc_id = PortfolioInvestment.EXTRATO_PROCESS_ID
         self._startNewProcess(self._updateOpenedOperations(), proc_id)
         self._endAllProcesses(proc_id)
 
-        # The below tasks run in parallel and are dependent of the above tasks
+        # The below tasks run in parallel and are dependent of the above tasks.
         proc_id = PortfolioInvestment.REALTIME_PROCESS_ID
-        self._startNewProcess(self._updateCurrentPortfolio(), proc_id)
-        self._startNewProcess(self._updateCurrentRendaFixa(), proc_id)
-        self._startNewProcess(self._updateCurrentTesouroDireto(), proc_id)
-        self._endAllProcesses(proc_id)
+        if cache_only:
+            self.__updateCurrentDataframes(True, proc_id)
+            return
+
+        # All the network requests share the same time budget, and the
+        # repeated requests share a single response.
+        session = getSharedSession()
+        session.startRefresh(self.refreshBudget)
+        try:
+            self.__updateCurrentDataframes(False, proc_id)
+        finally:
+            session.endRefresh()
 
     def currentPortfolioGoogleDrive(self, auto_save=True, auto_open=True):
         """Save the excel file to be used in Google Drive."""
@@ -75,13 +146,60 @@ class PortfolioInvestment(ExtratoFileManager):
             auto_open,
         )
 
-    def currentPortfolio(self):
-        """Create a dataframe with all opened operations of Renda Variável."""
-        return self.currentVariableIncome.copy()
-
-    def currentTesouroDireto(self):
-        """Create a dataframe with all opened operations of Tesouro Direto."""
-        return self.currentTreasuries.copy()
+    def getRequestStatistics(self):
+        """Return the counts of the coalesced requests (shared session)."""
+        return getSharedSession().getStatistics()
+
+    def addRefreshListener(self, listener):
+        """Add a function 'listener(ticker_list)' called after a refresh.
+
+        In the stale-while-revalidate mode of the 'QuoteCache', the stale
+        quotes are used at once, and the fresh ones are requested in
+        background. Then, the listener is called (by a background thread)
+        when the fresh quotes of the wallet are stored. A new
+        'run(cache_only=True)' updates the dataframes with them.
+        """
+        for cache in self.__getQuoteCacheList():
+            cache.addTickerListener(listener, PortfolioInvestment.QUOTE_FIELD_LIST)
+
+    def removeRefreshListener(self, listener):
+        """Remove the listener added by 'addRefreshListener'."""
+        for cache in self.__getQuoteCacheList():
+            cache.removeTickerListener(listener)
+
+    def getMissingQuotesDict(self):
+        """Return the tickers without quotes after the last refresh.
+
+        The dictionary keys are 'Renda Variável' and 'Tesouro Direto'.
+        """
+        return {
+            "Renda Variável": self.VariableIncome.getMissingQuotesList(),
+            "Tesouro Direto": self.Treasuries.getMissingQuotesList(),
+        }
+
+    def currentPortfolio(self, quote_age=False):
+        """Create a dataframe with all opened operations of Renda Variável.
+
+        If 'quote_age' is True, the age of the quotes is included in the
+        'QuoteCache.AGE_COLUMN' column.
+        """
+        dataframe = self.currentVariableIncome.copy()
+        if quote_age:
+            age_list = self.VariableIncome.getQuoteAgeList()
+            dataframe[QuoteCache.AGE_COLUMN] = age_list
+        return dataframe
+
+    def currentTesouroDireto(self, quote_age=False):
+        """Create a dataframe with all opened operations of Tesouro Direto.
+
+        If 'quote_age' is True, the age of the prices is included in the
+        'QuoteCache.AGE_COLUMN' column.
+        """
+        dataframe = self.currentTreasuries.copy()
+        if quote_age:
+            age_list = self.Treasuries.getQuoteAgeList()
+            dataframe[QuoteCache.AGE_COLUMN] = age_list
+        return dataframe
 
     def currentRendaFixa(self):
         """Create a dataframe with all opened operations of Renda Fixa."""
@@ -1,6 +1,7 @@
 """This file is used to test the 'portfolio_investment.py'."""
 
 import os
+import socket
 import sys
 
 import pandas as pd
@@ -8,6 +9,8 @@ import pandas as pd
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(SCRIPT_DIR))
 
+from network_lib.quote_cache import QuoteCache, getSharedQuoteCache
+from portfolio_lib.assets.quote_provider import OfflineQuoteProvider
 from portfolio_lib.portfolio_investment import PortfolioInvestment
 
 
@@ -108,3 +111,81 @@ class Test_PortfolioInvestment:
         GDriveDF = portfolio.currentPortfolioGoogleDrive(False, False)
         assert isinstance(GDriveDF, pd.DataFrame) is True
         assert len(GDriveDF) > 0
+
+    def test_offline_provider_initialization(self):
+        """Test the 'PortfolioInvestment' refresh with an offline provider."""
+        file = os.path.join(SCRIPT_DIR, "PORTFOLIO_TEMPLATE.xlsx")
+        provider = OfflineQuoteProvider()
+        portfolio = PortfolioInvestment(file, quoteProvider=provider)
+        assert portfolio.VariableIncome.marketData is provider
+        assert portfolio.Treasuries.quoteProvider is provider
+
+        VIncomeDF = portfolio.currentPortfolio()
+        assert len(VIncomeDF) > 0
+        TreasuriesDF = portfolio.currentTesouroDireto()
+        assert len(TreasuriesDF) > 0
+
+        # A single batched request per asset class, not shared with the
+        # quotes of other providers
+        assert portfolio.VariableIncome.quoteCache is portfolio.Treasuries.quoteCache
+        assert portfolio.VariableIncome.quoteCache is not getSharedQuoteCache()
+        assert provider.getStatistics()["requests"] == 2
+
+        # The tickers not present in the provider file are flagged
+        missing_dict = portfolio.getMissingQuotesDict()
+        assert set(missing_dict) == {"Renda Variável", "Tesouro Direto"}
+        assert "BBAS3" not in missing_dict["Renda Variável"]
+
+    def test_offline_provider_no_connection(self, monkeypatch):
+        """Test the refresh with an offline provider opens no connection."""
+        connection_list = []
+
+        def connect(sock, address):
+            connection_list.append(address)
+            raise OSError("Network not available")
+
+        monkeypatch.setattr(socket.socket, "connect", connect)
+        file = os.path.join(SCRIPT_DIR, "PORTFOLIO_TEMPLATE.xlsx")
+        portfolio = PortfolioInvestment(file, quoteProvider=OfflineQuoteProvider())
+        portfolio.currentPortfolio()
+        portfolio.currentTesouroDireto()
+        portfolio.currentRendaFixa()
+        assert connection_list == []
+
+    def test_run_cache_only(self):
+        """Test the refresh with the cached quotes, without any request."""
+        file = os.path.join(SCRIPT_DIR, "PORTFOLIO_TEMPLATE.xlsx")
+        provider = OfflineQuoteProvider()
+        portfolio = PortfolioInvestment(file, quoteProvider=provider)
+        VIncomeDF = portfolio.currentPortfolio()
+        TreasuriesDF = portfolio.currentTesouroDireto()
+        missing_dict = portfolio.getMissingQuotesDict()
+
+        # The missing quotes are not requested again
+        portfolio.run(cache_only=True)
+        assert provider.getStatistics()["requests"] == 2
+        for column in ["Cotação", "Dividend-Yield"]:
+            value_list = portfolio.currentPortfolio()[column].tolist()
+            assert value_list == VIncomeDF[column].tolist()
+        value_list = portfolio.currentTesouroDireto()["Cotação"].tolist()
+        assert value_list == TreasuriesDF["Cotação"].tolist()
+        assert portfolio.getMissingQuotesDict() == missing_dict
+
+    def test_quote_age(self):
+        """Test the age of the cached quotes of the wallets."""
+        file = os.path.join(SCRIPT_DIR, "PORTFOLIO_TEMPLATE.xlsx")
+        provider = OfflineQuoteProvider()
+        portfolio = PortfolioInvestment(file, quoteProvider=provider)
+        age_column = QuoteCache.AGE_COLUMN
+        assert age_column not in portfolio.currentPortfolio()
+
+        for dataframe, missing_list in [
+            (portfolio.currentPortfolio(quote_age=True), "Renda Variável"),
+            (portfolio.currentTesouroDireto(quote_age=True), "Tesouro Direto"),
+        ]:
+            missing_list = portfolio.getMissingQuotesDict()[missing_list]
+            for ticker, age in zip(dataframe["Ticker"], dataframe[age_column]):
+                if ticker in missing_list:
+                    assert pd.isna(age)
+                else:
+                    assert 0 <= age < 1
@@ -1,6 +1,6 @@
 """This file has a set of classes to display data from Portfolio."""
 
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtWidgets import QMessageBox
 from xlrd import XLRDError
 
@@ -12,7 +12,14 @@ from portfolio_lib.tabs.variable_income_tab import VariableTabInterface
 
 
 class PortfolioViewerWidget(QtWidgets.QTabWidget):
-    """Widget used to show data related to Portfolio."""
+    """Widget used to show data related to Portfolio.
+
+    The tabs are painted at once with the cached quotes (even if stale), and
+    then updated when the fresh quotes are stored in background.
+    """
+
+    # Emitted (by a background thread) when fresh quotes are stored
+    refreshed = QtCore.pyqtSignal()
 
     def __init__(self, File):
         """Create the PortfolioViewerWidget object.
@@ -28,6 +35,10 @@ class PortfolioViewerWidget(QtWidgets.QTabWidget):
         # Connect tab event
         self.currentChanged.connect(self.onChange)
 
+        # Connect the background refresh of the quotes
+        self.investment.addRefreshListener(self.__onRefresh)
+        self.refreshed.connect(self.refreshData)
+
     def __addNewTab(self, tab_widget):
         tab_index = self.addTab(
             tab_widget.getTab(),
@@ -58,6 +69,16 @@ class PortfolioViewerWidget(QtWidgets.QTabWidget):
             ShortSummaryTabInterface, self.short_summary
         )
 
+    def __onRefresh(self, ticker_list):
+        # The tabs are repainted by the 'refreshData' slot, in the GUI thread
+        self.refreshed.emit()
+
+    def __updateTabs(self):
+        self.VariableTab.updateData(self.variable_income)
+        self.FixedTab.updateData(self.fixed_income)
+        self.TreasuriesTab.updateData(self.treasuries)
+        self.ShortSummaryTab.updateData(self.short_summary)
+
     def __showColumnsErrorMessage(self):
         msg = "O arquivo selecionado é inválido.\n\n"
         msg += "Por favor, verifique se as colunas existem no arquivo:\n"
@@ -72,15 +93,15 @@ class PortfolioViewerWidget(QtWidgets.QTabWidget):
 
     def __setMainDataframes(self):
         self.extrato = self.investment.getExtrato()
-        self.variable_income = self.investment.currentPortfolio()
+        self.variable_income = self.investment.currentPortfolio(quote_age=True)
         self.fixed_income = self.investment.currentRendaFixa()
-        self.treasuries = self.investment.currentTesouroDireto()
+        self.treasuries = self.investment.currentTesouroDireto(quote_age=True)
         self.short_summary = self.extrato.copy()
 
-    def __updateMainDataframes(self, initialization):
+    def __updateMainDataframes(self, initialization, cache_only=False):
         try:
             if not initialization:
-                self.investment.run()
+                self.investment.run(cache_only)
             self.__setMainDataframes()
             if self.investment.isValidFile():
                 return True
@@ -108,12 +129,17 @@ class PortfolioViewerWidget(QtWidgets.QTabWidget):
     def updateData(self, File):
         """Update the treeview data lines."""
         if self.setPortfolioInvestment(File):
-            self.VariableTab.updateData(self.variable_income)
-            self.FixedTab.updateData(self.fixed_income)
-            self.TreasuriesTab.updateData(self.treasuries)
-            self.ShortSummaryTab.updateData(self.short_summary)
+            self.__updateTabs()
             self.File = File
 
+    def refreshData(self):
+        """Update the treeview data lines with the cached quotes.
+
+        It runs in the GUI thread, then no network request is done.
+        """
+        if self.__updateMainDataframes(initialization=False, cache_only=True):
+            self.__updateTabs()
+
     def onChange(self, index):
         """Onchange tab method to render the table columns."""
         for tab_interface in self.TabInterfaceList:
@@ -1,42 +1,215 @@
 """This file provides methods to get fundamental analysis data from stocks."""
 
 import pandas as pd
+import requests
+from network_lib.quote_cache import QuoteCache, getSharedQuoteCache
 
-from portfolio_lib.assets.status_invest import HtmlCacheManager, LocalScraper
+from portfolio_lib.assets.status_invest import (
+    HtmlCacheManager,
+    LocalScraper,
+    ScrapedFieldsCache,
+)
+from portfolio_lib.multi_processing import ThreadPoolTasks
 
 
 class FundamentalAnalysisJob:
-    """Class useful to collect fundamentalist data from YFinance."""
+    """Class useful to collect fundamentalist data from YFinance.
 
-    def __init__(self):
+    The scraped values are stored in the shared 'QuoteCache'. Then, the
+    tickers still fresh there do not need the HTML cache neither the
+    parsing. Also, the fields of each HTML file are stored next to it
+    ('ScrapedFieldsCache'), then a fresh HTML file is parsed only once,
+    even between the application executions.
+
+    The tickers missing in the 'QuoteCache' are collected at once and then
+    downloaded and parsed concurrently ('ThreadPoolTasks'), where the
+    requests to the website are limited by the 'HtmlCacheManager'. If a
+    download fails, the previous HTML page is used (if available).
+
+    In the stale-while-revalidate mode of the 'QuoteCache', the expired
+    values (and the values of the expired HTML pages) are returned at once,
+    with their age ('QuoteCache.AGE_COLUMN'). The fresh values are
+    collected in background, and then the refresh listeners are called.
+    """
+
+    # Columns of the 'LocalScraper' dataframe, besides 'Ticker' and 'Mercado'
+    FIELD_LIST = [
+        "Valor atual",
+        "Variação no dia",
+        "Min. no mês",
+        "Máx. no mês",
+        "Variação no mês",
+        "Min. 52 semanas",
+        "Máx. 52 semanas",
+        "Variação 12 meses",
+        "Dividend yield",
+        "Dividendos 12 meses",
+        "P/L",
+        "P/VP",
+        "VPA",
+        "LPA",
+    ]
+
+    def __init__(self, quoteCache=None, htmlCache=None):
         """Create the object."""
-        self._scraper = LocalScraper()
-        self._cache = HtmlCacheManager()
+        if htmlCache is None:
+            htmlCache = HtmlCacheManager()
+        self._cache = htmlCache
+        self._fields = ScrapedFieldsCache()
+        if quoteCache is None:
+            quoteCache = getSharedQuoteCache()
+        self._quotes = quoteCache
+
+    def __getAgeInMinutes(self, ticker, market):
+        age_list = [
+            self._quotes.getAge(ticker, market, field)
+            for field in FundamentalAnalysisJob.FIELD_LIST
+        ]
+        age_list = [age for age in age_list if age is not None]
+        if not age_list:
+            return None
+        return max(age_list) / 60
 
-    def getTickerListDataframe(self, tickers_list, markets_list):
-        """Return the dataframe according to the tickers list."""
-        self._cache.register_local_time()
+    def _getScrapedValues(self, ticker, market):
+        """Return the '(ticker, market, field) -> value' scraped dictionary.
 
-        df_tickers = pd.DataFrame({})
+        It may be called by several threads at once. The dictionary is
+        empty if the HTML page is not available.
+        """
+        # Donwload new data if necessary
+        if self._cache.is_ticker_data_not_updated(ticker):
+            try:
+                self._cache.download_ticker_data(ticker, market)
+            except requests.RequestException:
+                if not self._cache.has_ticker_data(ticker):
+                    return {}
+        return self._getPageValues(ticker, market)
 
-        # Concatenate the new tickers information into the dataframe
-        for ticker, market in zip(tickers_list, markets_list):
+    def _getPageValues(self, ticker, market):
+        """Return the scraped dictionary of the cached HTML page.
+
+        The page is not downloaded, even if expired.
+        """
+        # Parse the HTML page only if its fields are not stored yet
+        ticker_path = self._cache.get_cache_file_path(ticker)
+        field_dict = self._fields.get_fields(ticker_path, ticker, market)
+        if field_dict is None:
+            content = self._cache.read_ticker_data(ticker)
+            if content is None:
+                return {}
+            scraper = LocalScraper()
+            scraper.set_html_content_properties(content, ticker, market)
+            df_new_ticker = scraper.get_dataframe()
+            field_dict = {
+                field: df_new_ticker.at[0, field]
+                for field in FundamentalAnalysisJob.FIELD_LIST
+            }
+            self._fields.set_fields(ticker_path, ticker, market, field_dict)
+
+        return {
+            (ticker, market, field): field_dict[field]
+            for field in FundamentalAnalysisJob.FIELD_LIST
+        }
+
+    def _setStaleValues(self, ticker, market):
+        """Store the values of the expired HTML page, as stale values.
+
+        The values keep the time of the page. Then, the 'QuoteCache'
+        returns them at once and requests the fresh values in background.
+        """
+        page_time = self._cache.get_ticker_data_time(ticker)
+        if page_time is None:
+            return
+        for key, value in self._getPageValues(ticker, market).items():
+            self._quotes.set(*key, value, timestamp=page_time)
+
+    def _setStaleValuesList(self, pair_list):
+        """Store the values of the expired pages not cached yet."""
+        first_field = FundamentalAnalysisJob.FIELD_LIST[0]
+        stale_pair_list = [
+            (ticker, market)
+            for ticker, market in dict.fromkeys(pair_list)
+            if self._quotes.getAge(ticker, market, first_field) is None
+            and self._cache.has_ticker_data(ticker)
+            and self._cache.is_ticker_data_not_updated(ticker)
+        ]
+        ThreadPoolTasks().runPool(
+            lambda pair: self._setStaleValues(*pair),
+            stale_pair_list,
+        )
 
-            # Donwload new data if necessary
-            self._cache.set_ticker_market(ticker, market)
-            if self._cache.is_ticker_cache_not_updated():
-                self._cache.download_new_ticker_data()
+    def _fetchScrapedValues(self, missing_key_list):
+        """Return the scraped values of the missing keys.
 
-            ticker_path = self._cache.get_ticker_cache_file_path()
-            self._scraper.set_html_file_properties(ticker_path, ticker, market)
+        Each '(ticker, market)' is downloaded and parsed in a thread.
+        """
+        pair_list = list(dict.fromkeys(key[:2] for key in missing_key_list))
+        value_dict = {}
+        for pair_dict in ThreadPoolTasks().runPool(
+            lambda pair: self._getScrapedValues(*pair),
+            pair_list,
+        ):
+            value_dict.update(pair_dict)
+        return value_dict
 
-            df_new_ticker = self._scraper.get_dataframe()
-            df_tickers = pd.concat(
-                [df_tickers, df_new_ticker], ignore_index=True, sort=False
+    def getTickerListDataframe(self, tickers_list, markets_list, cache_only=False):
+        """Return the dataframe according to the tickers list.
+
+        The values not available are NaN.
+
+        If 'cache_only' is True, only the values stored in the 'QuoteCache'
+        (even if stale) are used, without any download. It is useful to
+        repaint the GUI when the fresh values are stored in background.
+        """
+        pair_list = list(zip(tickers_list, markets_list))
+        key_list = [
+            (ticker, market, field)
+            for ticker, market in pair_list
+            for field in FundamentalAnalysisJob.FIELD_LIST
+        ]
+
+        if cache_only:
+            value_dict = self._quotes.getCachedMany(key_list)
+        else:
+            self._cache.register_local_time()
+
+            # The expired pages are not downloaded before returning
+            if self._quotes.isStaleWhileRevalidate():
+                self._setStaleValuesList(pair_list)
+
+            # Scrape only the tickers not cached, all of them at once
+            value_dict = self._quotes.getOrFetchMany(
+                key_list,
+                self._fetchScrapedValues,
             )
 
+        # Build the dataframe at once
+        age_column = QuoteCache.AGE_COLUMN
+        row_list = []
+        for ticker, market in pair_list:
+            row = {"Ticker": ticker, "Mercado": market}
+            for field in FundamentalAnalysisJob.FIELD_LIST:
+                row[field] = value_dict[(ticker, market, field)]
+            row[age_column] = self.__getAgeInMinutes(ticker, market)
+            row_list.append(row)
+        float_column_list = FundamentalAnalysisJob.FIELD_LIST + [age_column]
+        column_list = ["Ticker", "Mercado"] + float_column_list
+        df_tickers = pd.DataFrame(row_list, columns=column_list)
+        df_tickers[float_column_list] = df_tickers[float_column_list].astype(float)
         return df_tickers
 
+    def addRefreshListener(self, listener):
+        """Add a function 'listener(ticker_list)' called after a refresh.
+
+        In the stale-while-revalidate mode, it is called (by a background
+        thread) when the fresh values of some tickers are stored.
+        """
+        self._quotes.addTickerListener(listener, FundamentalAnalysisJob.FIELD_LIST)
+
+    def removeRefreshListener(self, listener):
+        """Remove the listener added by 'addRefreshListener'."""
+        self._quotes.removeTickerListener(listener)
+
 
 class FundamentalAnalysisFrame:
     """Class useful to provide a dataframe with fundamentalistic data."""
@@ -61,17 +234,30 @@ class FundamentalAnalysisFrame:
         """Get the markets list."""
         return self.markets_list
 
-    def updateTickersDataframe(self):
-        """Update the dataframe related to the tickers list."""
+    def updateTickersDataframe(self, cache_only=False):
+        """Update the dataframe related to the tickers list.
+
+        If 'cache_only' is True, only the cached values are used (see
+        'FundamentalAnalysisJob.getTickerListDataframe').
+        """
         self.df_tickers = self.job.getTickerListDataframe(
             self.tickers_list,
             self.markets_list,
+            cache_only,
         )
 
     def getTickersDataframe(self):
         """Get the tickers list dataframe."""
         return self.df_tickers
 
+    def addRefreshListener(self, listener):
+        """Add a function 'listener(ticker_list)' called after a refresh."""
+        self.job.addRefreshListener(listener)
+
+    def removeRefreshListener(self, listener):
+        """Remove the listener added by 'addRefreshListener'."""
+        self.job.removeRefreshListener(listener)
+
 
 if __name__ == "__main__":
     frame = FundamentalAnalysisFrame()
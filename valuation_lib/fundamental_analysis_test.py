@@ -0,0 +1,190 @@
+"""This file is used to test the 'fundamental_analysis.py'."""
+
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+import pytest
+import requests
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(SCRIPT_DIR))
+
+from network_lib.quote_cache import QuoteCache
+
+from portfolio_lib.assets.status_invest import ScrapedFieldsCache
+from valuation_lib.fundamental_analysis import FundamentalAnalysisJob
+
+FIELD_LIST = FundamentalAnalysisJob.FIELD_LIST
+
+
+class FixtureHtmlCache:
+    """HTML cache writing local pages, with the related scraped fields.
+
+    The downloads of the tickers starting with 'FAIL' raise an error. The
+    pages are expired only if the 'expired' flag is set.
+    """
+
+    def __init__(self, folder_path, delay=0.0):
+        """Create the FixtureHtmlCache object."""
+        self.folder_path = folder_path
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.download_list = []
+        self.running = 0
+        self.max_running = 0
+        self.expired = False
+
+    def register_local_time(self):
+        """Nothing to do (the fixture pages never expire)."""
+
+    def get_cache_file_path(self, ticker):
+        """Return the cache file path of the ticker."""
+        return os.path.join(self.folder_path, ticker + ".html")
+
+    def has_ticker_data(self, ticker):
+        """Return True if the ticker page exists."""
+        return os.path.isfile(self.get_cache_file_path(ticker))
+
+    def is_ticker_data_not_updated(self, ticker):
+        """Return True if the ticker page does not exist (or is expired)."""
+        return self.expired or not self.has_ticker_data(ticker)
+
+    def get_ticker_data_time(self, ticker):
+        """Return the modification time of the ticker page."""
+        if not self.has_ticker_data(ticker):
+            return None
+        return os.path.getmtime(self.get_cache_file_path(ticker))
+
+    def read_ticker_data(self, ticker):
+        """Return the ticker page (bytes)."""
+        with open(self.get_cache_file_path(ticker), "rb") as html_file:
+            return html_file.read()
+
+    def download_ticker_data(self, ticker, market):
+        """Write the ticker page and its fields."""
+        with self.lock:
+            self.download_list.append(ticker)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if ticker.startswith("FAIL"):
+            raise requests.ConnectionError("Page not available")
+        html_path = self.get_cache_file_path(ticker)
+        with open(html_path, "w", encoding="utf-8") as html_file:
+            html_file.write("<html><body>" + ticker + "</body></html>")
+        field_dict = {field: float(len(ticker)) for field in FIELD_LIST}
+        ScrapedFieldsCache().set_fields(html_path, ticker, market, field_dict)
+
+
+class Test_FundamentalAnalysisJob:
+    """Tests for 'FundamentalAnalysisJob' class."""
+
+    TICKER_LIST = ["BBAS3", "ITSA4", "HGLG11", "IVVB11", "AMZO34"]
+    MARKET_LIST = ["Ações", "Ações", "FII", "ETF", "BDR"]
+
+    def getJob(self, tmp_path, delay=0.0):
+        """Return the FundamentalAnalysisJob object and its HTML cache."""
+        htmlCache = FixtureHtmlCache(str(tmp_path), delay)
+        job = FundamentalAnalysisJob(quoteCache=QuoteCache(), htmlCache=htmlCache)
+        return job, htmlCache
+
+    def test_getTickerListDataframe(self, tmp_path):
+        """Test the 'getTickerListDataframe' method."""
+        job, htmlCache = self.getJob(tmp_path)
+        df = job.getTickerListDataframe(self.TICKER_LIST, self.MARKET_LIST)
+        age_column = QuoteCache.AGE_COLUMN
+        assert list(df.columns) == ["Ticker", "Mercado"] + FIELD_LIST + [age_column]
+        assert (df[age_column] < 1).all()
+        assert list(df["Ticker"]) == self.TICKER_LIST
+        assert list(df["Mercado"]) == self.MARKET_LIST
+        assert list(df["P/L"]) == [5.0, 5.0, 6.0, 6.0, 6.0]
+        assert sorted(htmlCache.download_list) == sorted(self.TICKER_LIST)
+
+        # The values are cached
+        job.getTickerListDataframe(self.TICKER_LIST, self.MARKET_LIST)
+        assert len(htmlCache.download_list) == len(self.TICKER_LIST)
+
+    def test_getTickerListDataframe_concurrent(self, tmp_path):
+        """Test the concurrent downloads of the 'getTickerListDataframe'."""
+        job, htmlCache = self.getJob(tmp_path, delay=0.2)
+        start = time.perf_counter()
+        job.getTickerListDataframe(self.TICKER_LIST, self.MARKET_LIST)
+        assert time.perf_counter() - start < 0.2 * len(self.TICKER_LIST)
+        assert htmlCache.max_running > 1
+
+    @pytest.mark.parametrize("stored", [False, True])
+    def test_getTickerListDataframe_failure(self, tmp_path, stored):
+        """Test the 'getTickerListDataframe' method with a failed download."""
+        job, htmlCache = self.getJob(tmp_path)
+        html_path = htmlCache.get_cache_file_path("FAIL3")
+        if stored:
+            with open(html_path, "w", encoding="utf-8") as html_file:
+                html_file.write("<html><body>FAIL3</body></html>")
+            field_dict = {field: 1.0 for field in FIELD_LIST}
+            ScrapedFieldsCache().set_fields(html_path, "FAIL3", "Ações", field_dict)
+            htmlCache.is_ticker_data_not_updated = lambda ticker: True
+
+        df = job.getTickerListDataframe(["FAIL3", "BBAS3"], ["Ações", "Ações"])
+        assert df.at[1, "P/L"] == 5.0
+        if stored:
+            assert df.at[0, "P/L"] == 1.0
+        else:
+            assert pd.isna(df.at[0, "P/L"])
+
+    def test_getTickerListDataframe_stale(self, tmp_path):
+        """Test the stale-while-revalidate mode with an expired page."""
+        htmlCache = FixtureHtmlCache(str(tmp_path), delay=0.5)
+        quoteCache = QuoteCache(stale_while_revalidate=True)
+        job = FundamentalAnalysisJob(quoteCache=quoteCache, htmlCache=htmlCache)
+        refreshed_list = []
+        job.addRefreshListener(refreshed_list.append)
+
+        # The page was stored one hour ago
+        html_path = htmlCache.get_cache_file_path("BBAS3")
+        with open(html_path, "w", encoding="utf-8") as html_file:
+            html_file.write("<html><body>BBAS3 (old page)</body></html>")
+        old_time = time.time() - 3600
+        os.utime(html_path, (old_time, old_time))
+        field_dict = {field: 1.0 for field in FIELD_LIST}
+        ScrapedFieldsCache().set_fields(html_path, "BBAS3", "Ações", field_dict)
+        htmlCache.expired = True
+
+        # The stale values are returned before the download
+        start = time.perf_counter()
+        df = job.getTickerListDataframe(["BBAS3"], ["Ações"])
+        assert time.perf_counter() - start < 0.5
+        assert df.at[0, "P/L"] == 1.0
+        assert df.at[0, QuoteCache.AGE_COLUMN] == pytest.approx(60, abs=1)
+
+        # Then, the fresh values are stored in background
+        assert quoteCache.waitRevalidation(timeout=5) is True
+        assert refreshed_list == [["BBAS3"]]
+        assert htmlCache.download_list == ["BBAS3"]
+        htmlCache.expired = False
+        df = job.getTickerListDataframe(["BBAS3"], ["Ações"])
+        assert df.at[0, "P/L"] == 5.0
+        assert df.at[0, QuoteCache.AGE_COLUMN] < 1
+
+        job.removeRefreshListener(refreshed_list.append)
+
+    def test_getTickerListDataframe_cache_only(self, tmp_path):
+        """Test the cached values are used without any download."""
+        htmlCache = FixtureHtmlCache(str(tmp_path))
+        quoteCache = QuoteCache(stale_while_revalidate=True)
+        job = FundamentalAnalysisJob(quoteCache=quoteCache, htmlCache=htmlCache)
+        ticker_list = ["FAIL3", "BBAS3"]
+        market_list = ["Ações", "Ações"]
+        job.getTickerListDataframe(ticker_list, market_list)
+        assert sorted(htmlCache.download_list) == sorted(ticker_list)
+
+        # The failed download is not retried
+        df = job.getTickerListDataframe(ticker_list, market_list, cache_only=True)
+        assert quoteCache.waitRevalidation(timeout=5) is True
+        assert sorted(htmlCache.download_list) == sorted(ticker_list)
+        assert pd.isna(df.at[0, "P/L"])
+        assert df.at[1, "P/L"] == 5.0
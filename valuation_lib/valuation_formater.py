@@ -1,6 +1,7 @@
 """This file has methods to format valuation tables."""
 
 from gui_lib.treeview.format_applier import EasyFormatter
+from network_lib.quote_cache import QuoteCache
 
 
 class FundamentalAnalysisFormater(EasyFormatter):
@@ -34,5 +35,6 @@ class FundamentalAnalysisFormater(EasyFormatter):
             "P/VP": "0.0",
             "VPA": "$",
             "LPA": "$",
+            QuoteCache.AGE_COLUMN: "0.0",
         }
         super().__init__(dataframe, column_type_dict)
@@ -3,7 +3,7 @@
 import os
 
 import pandas as pd
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
 from gui_lib.treeview.treeview_pandas import ResizableTreeviewPandas
 from gui_lib.window import Window
@@ -12,7 +12,14 @@ from valuation_lib.valuation_formater import FundamentalAnalysisFormater
 
 
 class ValuationWindow(QtWidgets.QWidget):
-    """Window Class used to show Valuation analysis frame."""
+    """Window Class used to show Valuation analysis frame.
+
+    The table is painted at once with the cached values (even if stale), and
+    then updated when the fresh values are stored in background.
+    """
+
+    # Emitted (by a background thread) when fresh values are stored
+    refreshed = QtCore.pyqtSignal()
 
     def __init__(self, auto_show=True):
         """Create the ValuationWindow object.
@@ -38,6 +45,14 @@ class ValuationWindow(QtWidgets.QWidget):
             self.file_dataframe["Mercado"].to_list(),
         )
         self.analysis.updateTickersDataframe()
+        self.analysis.addRefreshListener(self.__onRefresh)
+        self.refreshed.connect(self.updateData)
+
+        # The window may be destroyed without a 'closeEvent' (example: when
+        # it is replaced by a new one), then the listener is removed here
+        analysis = self.analysis
+        listener = self.__onRefresh
+        self.destroyed.connect(lambda: analysis.removeRefreshListener(listener))
 
         # Formater
         self.formater = FundamentalAnalysisFormater(
@@ -61,6 +76,28 @@ class ValuationWindow(QtWidgets.QWidget):
             self.showMaximized()
             self.treeview.resizeColumnsToTreeViewWidth()
 
+    """Private methods."""
+
+    def __onRefresh(self, ticker_list):
+        self.refreshed.emit()
+
+    """Public methods."""
+
     def resizeEvent(self, event):
         """Overide the resizeEvent from QtWidgets.QWidget."""
         self.treeview.resizeColumnsToTreeViewWidth()
+
+    def closeEvent(self, event):
+        """Override 'QtWidgets.QWidget.closeEvent'."""
+        self.analysis.removeRefreshListener(self.__onRefresh)
+        event.accept()
+
+    def updateData(self):
+        """Update the table with the cached values (no network requests)."""
+        self.analysis.updateTickersDataframe(cache_only=True)
+        self.formater = FundamentalAnalysisFormater(
+            self.analysis.getTickersDataframe(),
+        )
+        self.formated_dataframe = self.formater.getFormattedDataFrame()
+        self.treeview.setDataframe(self.formated_dataframe)
+        self.treeview.showPandas(resize_per_contents=False)